@@ -0,0 +1,134 @@
+"""
+TUX CODE BOOT CAMP - Challenge Selector Benchmark
+
+Builds a synthetic catalog far larger than the real armory and measures
+the adaptive challenge selector (src/attempt4/selector.py):
+
+  build     splitting every language into per-difficulty pools
+  first     a recruit's first pick in a language (copies the pools)
+  pick      every later pick
+  ace       folding in a graded event that aces a challenge
+
+USAGE:
+    python benchmarks/selector.py
+    python benchmarks/selector.py --languages 500 --challenges 300 --picks 200000
+    python benchmarks/selector.py --check     # exit 1 if pick/ace exceed budget
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src" / "attempt4"))
+
+from catalog import Catalog  # noqa: E402
+from selector import ChallengeSelector  # noqa: E402
+
+DIFFICULTIES = ("Easy", "Medium", "Hard", "Elite")
+
+# Per-operation budgets in microseconds; O(1) picks should stay far below
+BUDGET_US = {"pick": 20.0, "ace": 40.0}
+
+
+def synthetic_catalog(languages, challenges):
+    names = [f"Lang{i:05d}" for i in range(languages)]
+    language_data = {name: {"difficulty": "Beginner"} for name in names}
+    challenge_data = {
+        name: [
+            {"name": f"MISSION {j:05d}", "description": "",
+             "difficulty": DIFFICULTIES[j % len(DIFFICULTIES)]}
+            for j in range(challenges)
+        ]
+        for name in names
+    }
+    return Catalog(language_data, challenge_data)
+
+
+def per_op_us(elapsed, count):
+    return elapsed / count * 1e6 if count else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp selector benchmark")
+    parser.add_argument("--languages", type=int, default=200)
+    parser.add_argument("--challenges", type=int, default=200, help="per language")
+    parser.add_argument("--recruits", type=int, default=100)
+    parser.add_argument("--picks", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero if a per-operation budget is exceeded")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = synthetic_catalog(args.languages, args.challenges)
+    languages = list(catalog.get_all_languages())
+
+    start = time.perf_counter()
+    selector = ChallengeSelector(catalog, DIFFICULTIES[:3], rng=random.Random(args.seed))
+    build_s = time.perf_counter() - start
+
+    recruits = [selector.new_mastery() for _ in range(args.recruits)]
+
+    # First pick per (recruit, language) builds that recruit's pools
+    start = time.perf_counter()
+    first_count = 0
+    for mastery in recruits:
+        for language in languages[:10]:
+            selector.next_challenge(mastery, language)
+            first_count += 1
+    first_s = time.perf_counter() - start
+
+    pairs = [(rng.choice(recruits), rng.choice(languages[:10])) for _ in range(args.picks)]
+    start = time.perf_counter()
+    served = [selector.next_challenge(mastery, language) for mastery, language in pairs]
+    pick_s = time.perf_counter() - start
+
+    events = [
+        (mastery, {"type": "code_graded", "language": c.language, "challenge": c.name,
+                   "correct": True, "completeness": 100, "quality_score": 95})
+        for (mastery, _), c in zip(pairs, served) if c is not None
+    ]
+    start = time.perf_counter()
+    for mastery, event in events:
+        mastery.observe(event)
+    ace_s = time.perf_counter() - start
+
+    # Sanity: nothing aced is ever served again
+    for mastery in recruits[:10]:
+        for language in languages[:10]:
+            challenge = selector.next_challenge(mastery, language)
+            if challenge is not None and challenge.key in mastery.aced:
+                print(f"BUG: served aced challenge {challenge.key}")
+                sys.exit(1)
+
+    results = {
+        "build": per_op_us(build_s, args.languages),
+        "first": per_op_us(first_s, first_count),
+        "pick": per_op_us(pick_s, len(pairs)),
+        "ace": per_op_us(ace_s, len(events)),
+    }
+
+    print(f"\nCATALOG: {args.languages} languages x {args.challenges} challenges,"
+          f" {args.recruits} recruits")
+    print(f"  build  {build_s * 1000:8.1f}ms total  ({results['build']:.1f}us per language)")
+    print(f"  first  {results['first']:8.1f}us per recruit/language")
+    print(f"  pick   {results['pick']:8.2f}us per pick   ({len(pairs)} picks)")
+    print(f"  ace    {results['ace']:8.2f}us per graded event")
+
+    problems = [f"{op}: {results[op]:.2f}us > budget {limit}us"
+                for op, limit in BUDGET_US.items() if results[op] > limit]
+    if problems:
+        print("\nBUDGET VIOLATIONS:")
+        for problem in problems:
+            print(f"  - {problem}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nSelector within budget. OUTSTANDING, RECRUIT!")
+
+
+if __name__ == "__main__":
+    main()
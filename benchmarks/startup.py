@@ -0,0 +1,230 @@
+"""
+TUX CODE BOOT CAMP - Startup Benchmark
+
+Measures how long each attempt takes to get its first frame on screen and
+how much of that is spent importing modules, then compares the numbers with
+the tracked baseline in startup_baseline.json.
+
+USAGE:
+    python benchmarks/startup.py                  # measure and compare
+    python benchmarks/startup.py --check          # exit 1 if a budget is blown
+    python benchmarks/startup.py --update-baseline
+
+COLD runs use an empty bytecode cache (PYTHONPYCACHEPREFIX points at a fresh
+temp dir), WARM runs reuse the cache from the previous run. Time to first
+frame needs a display; on a headless box it is reported as unavailable and
+only the import numbers are checked.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "startup_baseline.json"
+
+# Each target is run from its own directory, exactly like a recruit would
+TARGETS = {
+    "attempt3": {"directory": "src/attempt3", "module": "main"},
+    "attempt4": {"directory": "src/attempt4", "module": "TuxBootCamp"},
+}
+
+# Child process: build the app, draw one frame, report back, exit
+FRAME_HARNESS = """
+import sys, tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print("NODISPLAY", flush=True)
+    sys.exit(0)
+import {module} as target
+target.TuxBootCampApp(root)
+root.update_idletasks()
+root.update()
+print("FRAME", flush=True)
+root.destroy()
+"""
+
+
+# =====================================================================
+# MEASUREMENTS
+# =====================================================================
+
+
+def _run_env(pycache_dir):
+    env = dict(os.environ)
+    env["PYTHONPYCACHEPREFIX"] = pycache_dir
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def measure_first_frame(target, pycache_dir):
+    """Wall-clock ms from process spawn until the first frame is drawn"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", FRAME_HARNESS.format(module=target["module"])],
+        cwd=REPO_ROOT / target["directory"],
+        env=_run_env(pycache_dir),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if "FRAME" not in result.stdout:
+        return None
+    return elapsed
+
+
+def measure_imports(target, pycache_dir):
+    """Parse `-X importtime` output into {module: self_us} for one import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target['module']}"],
+        cwd=REPO_ROOT / target["directory"],
+        env=_run_env(pycache_dir),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Importing {target['module']} failed:\n{result.stderr[-2000:]}"
+        )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def benchmark_target(target, runs):
+    """Cold + warm numbers for one target"""
+    frames = {"cold": [], "warm": []}
+    import_ms = {"cold": [], "warm": []}
+    modules = {}
+
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix="tux_pycache_") as pycache:
+            for phase in ("cold", "warm"):
+                # The cold pass fills the cache the warm pass then reuses
+                modules = measure_imports(target, pycache)
+                import_ms[phase].append(sum(modules.values()) / 1000)
+
+        with tempfile.TemporaryDirectory(prefix="tux_pycache_") as pycache:
+            for phase in ("cold", "warm"):
+                frames[phase].append(measure_first_frame(target, pycache))
+
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 2) if values else None
+
+    return {
+        "first_frame_ms": {phase: median(v) for phase, v in frames.items()},
+        "import_ms": {phase: median(v) for phase, v in import_ms.items()},
+        "eager_modules": sorted(modules),
+    }
+
+
+# =====================================================================
+# BASELINE AND BUDGET
+# =====================================================================
+
+
+def load_baseline():
+    if not BASELINE_FILE.exists():
+        return {"budget": {}, "results": {}}
+    with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_budget(name, result, budget):
+    """Return a list of human readable budget violations"""
+    problems = []
+    limits = budget.get(name, {})
+
+    max_import = limits.get("max_warm_import_ms")
+    if max_import is not None and result["import_ms"]["warm"] > max_import:
+        problems.append(
+            f"{name}: warm import {result['import_ms']['warm']}ms > budget {max_import}ms"
+        )
+
+    max_frame = limits.get("max_warm_first_frame_ms")
+    warm_frame = result["first_frame_ms"]["warm"]
+    if max_frame is not None and warm_frame is not None and warm_frame > max_frame:
+        problems.append(
+            f"{name}: warm first frame {warm_frame}ms > budget {max_frame}ms"
+        )
+
+    eager = set(result["eager_modules"])
+    for module in limits.get("lazy_modules", []):
+        if module in eager:
+            problems.append(f"{name}: '{module}' is imported at startup, keep it lazy")
+
+    return problems
+
+
+def print_report(name, result, previous):
+    print(f"\n{name.upper()}")
+    for metric in ("first_frame_ms", "import_ms"):
+        for phase in ("cold", "warm"):
+            value = result[metric][phase]
+            old = previous.get(metric, {}).get(phase) if previous else None
+            shown = "unavailable" if value is None else f"{value:.2f}ms"
+            delta = ""
+            if value is not None and old:
+                delta = f"  ({(value - old) / old * 100:+.1f}% vs baseline)"
+            print(f"  {metric:<15} {phase:<5} {shown}{delta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="runs per phase")
+    parser.add_argument("--target", choices=sorted(TARGETS), action="append")
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero if any budget is exceeded")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new tracked baseline")
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    results = {}
+    problems = []
+
+    for name in args.target or sorted(TARGETS):
+        results[name] = benchmark_target(TARGETS[name], args.runs)
+        print_report(name, results[name], baseline["results"].get(name))
+        problems += check_budget(name, results[name], baseline["budget"])
+
+    if args.update_baseline:
+        for name, result in results.items():
+            # The full module list is only needed for the lazy check
+            result["eager_module_count"] = len(result.pop("eager_modules"))
+        baseline["results"].update(results)
+        baseline["python"] = sys.version.split()[0]
+        baseline["platform"] = sys.platform
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {BASELINE_FILE}")
+
+    if problems:
+        print("\nBUDGET VIOLATIONS:")
+        for problem in problems:
+            print(f"  - {problem}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nAll startup budgets met. OUTSTANDING, RECRUIT!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+TUX CODE BOOT CAMP - Template Rendering Benchmark
+
+Renders a challenge file for every language in armory/templates.json with
+the compiled template engine (src/attempt4/template_engine.py) and, for
+comparison, the old way: build the header f-string, pick the body and
+concatenate on every call.
+
+  compile   building the engine (every language, once per process)
+  render    one full challenge file
+  stamp     one file from a partial template (packs.py: only the recruit
+            name left to fill in)
+  legacy    the per-call f-string approach
+
+USAGE:
+    python benchmarks/templates.py
+    python benchmarks/templates.py --rounds 2000
+    python benchmarks/templates.py --check     # exit 1 if render exceeds budget
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ARMORY_DIR = REPO_ROOT / "src" / "attempt4" / "armory"
+sys.path.insert(0, str(REPO_ROOT / "src" / "attempt4"))
+
+from template_engine import TemplateEngine  # noqa: E402
+
+# Per-file budgets in microseconds
+BUDGET_US = {"render": 10.0, "stamp": 5.0}
+
+VALUES = {
+    "student": "Jane Doe",
+    "challenge": "INTERMEDIATE MISSION",
+    "difficulty": "Medium",
+    "date": "2024-01-01 12:00:00",
+    "description": "Build a command-line todo list that saves to a file.",
+}
+
+
+def legacy_render(templates, language, values):
+    """What ChallengeFileManager used to do for every file"""
+    comment = templates["comment_styles"].get(language, {}).get("start", "#")
+    lines = templates["header_lines"]
+    sep = lines["separator"]
+    header = f"""{comment}{sep}
+{comment} {lines['title']}
+{comment} {sep}
+{comment} Recruit: {values['student']}
+{comment} Challenge: {values['challenge']}
+{comment} Language: {language}
+{comment} Difficulty: {values['difficulty']}
+{comment} Date: {values['date']}
+{comment} {sep}
+{comment}
+{comment} {lines['mission_briefing_header']}
+{comment} {values['description']}
+{comment}
+{comment} {lines['orders_header']}
+""" + "".join(f"{comment} {order}\n" for order in lines["orders"]) + f"""{comment}
+{comment} {lines['reminder']}
+{comment} {sep}
+
+"""
+    bodies = dict(templates["language_templates"])  # rebuilt per call, like before
+    return header + bodies[language]
+
+
+def per_file_us(elapsed, count):
+    return elapsed / count * 1e6 if count else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp template benchmark")
+    parser.add_argument("--rounds", type=int, default=1000,
+                        help="files rendered per language")
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero if a per-file budget is exceeded")
+    args = parser.parse_args()
+
+    with open(ARMORY_DIR / "templates.json", "r", encoding="utf-8") as f:
+        templates = json.load(f)
+
+    start = time.perf_counter()
+    engine = TemplateEngine(templates)
+    compile_s = time.perf_counter() - start
+
+    languages = sorted(templates["language_templates"])
+    count = len(languages) * args.rounds
+
+    # Sanity: the engine reproduces the legacy output byte for byte
+    for language in languages:
+        if engine.render(language, **VALUES) != legacy_render(templates, language, VALUES):
+            print(f"BUG: {language} renders differently from the legacy path")
+            sys.exit(1)
+
+    start = time.perf_counter()
+    for language in languages:
+        for _ in range(args.rounds):
+            engine.render(language, **VALUES)
+    render_s = time.perf_counter() - start
+
+    fixed = {k: v for k, v in VALUES.items() if k != "student"}
+    partials = [engine.partial(language, **fixed) for language in languages]
+    student = {"student": VALUES["student"]}
+    start = time.perf_counter()
+    for template in partials:
+        for _ in range(args.rounds):
+            template.render(student)
+    stamp_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for language in languages:
+        for _ in range(args.rounds):
+            legacy_render(templates, language, VALUES)
+    legacy_s = time.perf_counter() - start
+
+    results = {
+        "render": per_file_us(render_s, count),
+        "stamp": per_file_us(stamp_s, count),
+        "legacy": per_file_us(legacy_s, count),
+    }
+
+    print(f"\nTEMPLATES: {len(languages)} languages x {args.rounds} files")
+    print(f"  compile {compile_s * 1000:8.2f}ms total")
+    print(f"  render  {results['render']:8.2f}us per file")
+    print(f"  stamp   {results['stamp']:8.2f}us per file")
+    print(f"  legacy  {results['legacy']:8.2f}us per file"
+          f"  ({results['legacy'] / results['render']:.1f}x render)")
+
+    problems = [f"{op}: {results[op]:.2f}us > budget {limit}us"
+                for op, limit in BUDGET_US.items() if results[op] > limit]
+    if problems:
+        print("\nBUDGET VIOLATIONS:")
+        for problem in problems:
+            print(f"  - {problem}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nTemplates within budget. OUTSTANDING, RECRUIT!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import random
-import webbrowser
+import os
+import sys
+import threading
+
+# Sandboxed code runner (and the rest of the engines) live in attempt4
+ATTEMPT4_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "attempt4")
+)
 
 class TuxLanguageLearner:
     def __init__(self, root):
         self.root = root
+        self._runner = None  # WorkerPool, started with the first playground
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
         self.root.title("Tux Programming Boot Camp")
         self.root.geometry("1000x700")
 
@@ -204,6 +213,7 @@ class TuxLanguageLearner:
             self.description_text.insert(tk.END, language_info['description'])
             
             # Insert code
+            import webbrowser
             for resource in resources:
                 webbrowser.open(resource)
         except IndexError:
@@ -315,6 +325,24 @@ class TuxLanguageLearner:
         except IndexError:
             messagebox.showwarning("Warning", "Please select a language first.")
 
+    def _code_runner(self):
+        """Warm pool of out-of-process Python workers (attempt4/runner.py)"""
+        if self._runner is None:
+            if ATTEMPT4_DIR not in sys.path:
+                sys.path.insert(0, ATTEMPT4_DIR)
+            from runner import WorkerPool
+            from TuxBootCamp import ConfigManager
+            config = ConfigManager(os.path.join(ATTEMPT4_DIR, "command.json"))
+            self._runner = WorkerPool.from_config(config)
+        return self._runner
+
+    def shutdown(self):
+        """Stop the playground's worker processes, then close the app"""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+        self.root.destroy()
+
     def open_language_specific_playground(self, language):
         # Create a specialized coding environment for each language
         playground_window = tk.Toplevel(self.root)
@@ -341,23 +369,55 @@ class TuxLanguageLearner:
         output_text = tk.Text(output_frame, height=5, width=80, state='disabled')
         output_text.pack(padx=10, pady=10)
 
-        # Language-specific execution methods
+        output_text.tag_config("stderr", foreground="red")
+        output_text.tag_config("status", foreground="gray")
+
+        # Code runs in a sandboxed worker process with CPU, memory and
+        # output limits - an infinite loop or a crash can't take the
+        # playground down. Output streams in as the program prints it.
+        def append_output(stream, text):
+            def append():
+                if not output_text.winfo_exists():
+                    return  # playground closed while the code ran
+                output_text.config(state='normal')
+                output_text.insert(tk.END, text, stream)
+                output_text.see(tk.END)
+                output_text.config(state='disabled')
+            self.root.after(0, append)
+
+        def enable_run_button():
+            if run_button.winfo_exists():
+                run_button.config(state='normal')
+
         def run_code():
             output_text.config(state='normal')
             output_text.delete(1.0, tk.END)
 
-            # Placeholder for language-specific execution
-            # In a real-world scenario, you'd need more sophisticated 
-            # execution environments for each language
-            try:
-                if language == "Python":
-                    # Python execution
-                    import sys
-                    from io import StringIO
-                    old_stdout = sys.stdout
-                    redirected_output = sys.stdout = StringIO()
-
-                    exec(code_text.get("1.0", tk.END))
+            if language != "Python":
+                output_text.insert(tk.END,
+                    f"Live {language} execution not supported in this demo.\n"
+                    "This would require language-specific compilers/interpreters."
+                )
+                output_text.config(state='disabled')
+                return
+
+            output_text.config(state='disabled')
+            run_button.config(state='disabled')
+            code = code_text.get("1.0", tk.END)
+
+            def work():
+                try:
+                    result = self._code_runner().run(code, on_output=append_output)
+                    append_output("status", f"\n[{result.describe()}, {result.duration_ms:.0f}ms]\n")
+                except Exception as e:
+                    append_output("stderr", f"Error: {str(e)}\n")
+                self.root.after(0, enable_run_button)
+
+            threading.Thread(target=work, daemon=True).start()
+
+        # Run Code Button
+        run_button = tk.Button(playground_window, text="Run Code", command=run_code)
+        run_button.pack(pady=10)
         # Add menu bar
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -367,7 +427,7 @@ class TuxLanguageLearner:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="New Playground", command=self.create_main_interface)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.shutdown)
 
         # Help Menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -474,23 +534,6 @@ class TuxLanguageLearner:
 def main():
     root = tk
 
-                    sys.stdout = old_stdout
-                    output = redirected_output.getvalue()
-                    output_text.insert(tk.END, output)
-                else:
-                    output_text.insert(tk.END, 
-                        f"Live {language} execution not supported in this demo.\n"
-                        "This would require language-specific compilers/interpreters."
-                    )
-            except Exception as e:
-                output_text.insert(tk.END, f"Error: {str(e)}")
-
-            output_text.config(state='disabled')
-
-        # Run Code Button
-        run_button = tk.Button(playground_window, text="Run Code", command=run_code)
-        run_button.pack(pady=10)
-
     def launch_tutorial(self):
         # Create a tutorial window
         tutorial_window = tk.Toplevel(self.root)
@@ -536,7 +579,7 @@ def main():
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="New Playground", command=self.create_main_interface)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.shutdown)
 
         # Help Menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -614,8 +657,10 @@ def main():
         )
         desc_label.pack(pady=10)
 
-        # Welcome image (placeholder)
+        # Welcome image (placeholder) - only when Pillow was found at launch
         try:
+            if not CAPABILITIES.get('image_banner'):
+                raise ImportError("Pillow not installed")
             from PIL import Image, ImageTk
             # You would need to have a Tux or programming-related image
             image = Image.open("tux_logo.png")  # Replace with actual path
@@ -664,45 +709,82 @@ def main():
     # Start the Tkinter event loop
     root.mainloop()
 
-# Dependency Check and Installation Helper
-def check_dependencies():
-    dependencies = [
-        'tkinter',
-        'PIL',  # Pillow for image handling
-    ]
-    
-    missing_deps = []
-    
-    for dep in dependencies:
-        try:
-            __import__(dep)
-        except ImportError:
-            missing_deps.append(dep)
-    
-    if missing_deps:
-        print("Missing dependencies detected:")
-        for dep in missing_deps:
-            print(f"- {dep}")
-        
-        print("\nAttempting to install dependencies...")
-        
+# Capability Probe
+#
+# Finds out which optional features this interpreter can support WITHOUT
+# importing anything (importlib.util.find_spec only locates the module).
+# The answer is cached on disk and only recomputed when the interpreter or
+# its site-packages change, so launching never waits on imports or pip.
+
+# feature -> modules it needs
+FEATURES = {
+    'gui': ['tkinter'],
+    'image_banner': ['PIL'],      # pip install pillow
+}
+
+CAPABILITY_CACHE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'tux_language_academy', 'capabilities.json'
+)
+
+# Filled in at launch by check_dependencies()
+CAPABILITIES = {}
+
+def _capability_cache_key():
+    """Identify this interpreter + its installed packages + FEATURES"""
+    import site
+    import sysconfig
+
+    paths = set(site.getsitepackages()) | {site.getusersitepackages(),
+                                          sysconfig.get_paths()['purelib']}
+    mtimes = []
+    for path in sorted(paths):
         try:
-            import sys
-            import subprocess
-            
-            # Attempt to install missing dependencies
-            for dep in missing_deps:
-                if dep == 'PIL':
-                    dep = 'pillow'
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', dep])
-            
-            print("Dependencies successfully installed!")
-        except Exception as e:
-            print(f"Error installing dependencies: {e}")
-            print("Please install manually using pip:")
-            for dep in missing_deps:
-                print(f"pip install {dep}")
-            sys.exit(1)
+            mtimes.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    return "|".join([sys.executable, sys.version, repr(sorted(FEATURES.items()))] + mtimes)
+
+def probe_capabilities(cache_file=CAPABILITY_CACHE):
+    """Return {feature: available}, using the on-disk cache when still valid"""
+    import json
+    import importlib.util
+
+    key = _capability_cache_key()
+    try:
+        with open(cache_file, 'r') as f:
+            cached = json.load(f)
+        if cached.get('key') == key:
+            return cached['features']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    features = {}
+    for feature, modules in FEATURES.items():
+        features[feature] = all(
+            importlib.util.find_spec(module) is not None for module in modules
+        )
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({'key': key, 'features': features}, f)
+    except OSError:
+        pass  # Caching is an optimization, never a reason to not start
+
+    return features
+
+def check_dependencies():
+    """Probe capabilities and report (but never install) missing extras"""
+    CAPABILITIES.update(probe_capabilities())
+
+    if not CAPABILITIES['gui']:
+        print("tkinter is not available - install your OS python3-tk package.")
+        sys.exit(1)
+
+    for feature, available in CAPABILITIES.items():
+        if not available:
+            modules = ", ".join(FEATURES[feature])
+            logging.info(f"Feature '{feature}' disabled (missing: {modules})")
 
 # Logging and Error Handling
 import logging
@@ -736,7 +818,7 @@ if __name__ == "__main__":
     # Set up logging
     setup_logging()
     
-    # Check and install dependencies
+    # Probe optional features (cached, no imports, no pip)
     check_dependencies()
     
     # Set global exception handler
@@ -1,11 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import random
-import webbrowser
+import itertools
 import os
+import sys
 from datetime import datetime
 from enum import Enum
 
+# The armory (JSON data) and the engines shared with attempt4 live there
+ATTEMPT4_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "attempt4")
+)
+ARMORY_DIR = os.path.join(ATTEMPT4_DIR, "armory")
+sys.path.insert(0, ATTEMPT4_DIR)
+
+from catalog import Catalog
+from search import SearchIndex
+from progress_store import ProgressStore
+from submission_store import SubmissionStore
+from sandbox_index import SandboxIndex
+from leaderboard import Leaderboard
+from achievements import AchievementEngine
+from activity import ActivityCalendar
+from selector import ChallengeSelector
+from template_engine import TemplateEngine
+from journal import Journal, apply_event, make_event
+from TuxBootCamp import ConfigManager
+
 """
 TUX CODE BOOT CAMP - With AI Code Analysis
 
@@ -36,8 +57,23 @@ class DrillLevel(Enum):
     TOUGH_LOVE = "You think this is easy?"
 
 
+# Motivation delta per action (overridden by motivation.changes in command.json)
+DEFAULT_MOTIVATION_CHANGES = {
+    "commit_language": 10,
+    "accept_challenge": 15,
+    "code_correct": 20,
+    "code_partial": 10,
+    "code_failed": -5,
+    "skip_challenge": -10,
+}
+
+
 class StudentProgress:
-    """Track individual student progress and struggle patterns"""
+    """Track individual student progress and struggle patterns
+
+    Every change goes through record_event(), so progress can be rebuilt by
+    replaying the recruit's activity Journal.
+    """
 
     def __init__(self, name):
         self.name = name
@@ -49,10 +85,62 @@ class StudentProgress:
         self.last_session = None
         self.motivation_level = 50
         self.streak_days = 0
+        self.activity = ActivityCalendar()
+        self.motivation_changes = dict(DEFAULT_MOTIVATION_CHANGES)
+        self.journal = None
+        self.medals = None  # achievements.MedalCase when medals are enabled
+        self.mastery = None  # selector.Mastery, drives challenge selection
+        self.on_medal = None  # called with each newly earned medal id
 
     def update_motivation(self, change):
         """Update motivation level based on actions"""
-        self.motivation_level = max(0, min(100, self.motivation_level + change))
+        self._record(make_event("motivation", change))
+
+    def record_event(self, kind, change=None, **data):
+        """Apply + journal an action; `change` names its motivation.changes entry"""
+        delta = self.motivation_changes.get(change or kind, 0)
+        return self._record(make_event(kind, delta, **data))
+
+    def _record(self, event):
+        apply_event(self, event)
+        if self.journal:
+            self.journal.append(event)
+        if self.medals and self.on_medal:
+            for award_id in self.medals.take_unannounced():
+                self.on_medal(award_id)
+        return event
+
+    def to_record(self):
+        """Plain snapshot for the ProgressStore"""
+        return {
+            "name": self.name,
+            "joined_date": self.joined_date.isoformat(timespec="seconds"),
+            "languages_started": list(self.languages_started),
+            "languages_completed": list(self.languages_completed),
+            "completion_attempts": dict(self.completion_attempts),
+            "decision_struggle_count": self.decision_struggle_count,
+            "last_session": self.last_session,
+            "motivation_level": int(self.motivation_level),
+            "streak_days": self.streak_days,
+            "activity": self.activity.to_dict(),
+            "medals": self.medals.to_dict() if self.medals else {},
+            "mastery": self.mastery.to_dict() if self.mastery else {},
+        }
+
+    @classmethod
+    def from_record(cls, record):
+        """Rebuild progress saved by to_record()"""
+        student = cls(record["name"])
+        student.joined_date = datetime.fromisoformat(record["joined_date"])
+        student.languages_started = list(record["languages_started"])
+        student.languages_completed = list(record["languages_completed"])
+        student.completion_attempts = dict(record["completion_attempts"])
+        student.decision_struggle_count = record["decision_struggle_count"]
+        student.last_session = record["last_session"]
+        student.motivation_level = record["motivation_level"]
+        student.streak_days = record["streak_days"]
+        student.activity = ActivityCalendar(record.get("activity"))
+        return student
 
     def get_tux_phrase(self):
         """Get motivational phrase based on progress and struggle"""
@@ -96,18 +184,64 @@ class StudentProgress:
 
 
 class CodeAnalyzer:
-    """Uses Claude API to analyze student code submissions"""
+    """Uses Claude API to analyze student code submissions
+
+    With a BuildEngine, the code is compiled and run first: the compiler
+    and program output go into the prompt, and code that does not build
+    or crashes can't be graded correct. With a TestBench, the challenge's
+    hidden tests run too; their pass ratio is blended into completeness.
+    A challenge with tests is only built, not run with no input: programs
+    that read stdin would fail that run, so the tests decide instead.
+    """
 
-    def __init__(self):
+    def __init__(self, build_engine=None, testbench=None):
         self.api_url = "https://api.anthropic.com/v1/messages"
+        self.build_engine = build_engine
+        self.testbench = testbench
 
-    async def analyze_code(self, language, challenge_desc, student_code):
+    async def analyze_code(self, language, challenge_desc, student_code, challenge_name=None):
         """Analyze student code and provide feedback"""
+        cases = self.testbench.tests_for(language, challenge_name) if self.testbench else ()
+        build = await self._build_and_run(language, student_code, run=not cases)
+        # After the build, so the tests reuse its cached compile
+        tests = await self._run_tests(language, student_code, cases)
+        result = await self._ask_tux(language, challenge_desc, student_code, build, tests)
+        return self._apply_tests(self._apply_build(result, build), tests)
+
+    async def _build_and_run(self, language, student_code, run=True):
+        """Compile (+ run) in the sandbox (off the event loop); None if unsupported"""
+        if not (self.build_engine and self.build_engine.supports(language)):
+            return None
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        try:
+            step = self.build_engine.build_and_run if run else self.build_engine.build
+            return await loop.run_in_executor(None, step, language, student_code)
+        except Exception:
+            return None  # no verdict from the build beats a wrong one
+
+    async def _run_tests(self, language, student_code, tests):
+        """The challenge's hidden tests (off the event loop); None if it has none"""
+        if not tests:
+            return None
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None, self.testbench.run, language, student_code, tests
+            )
+        except Exception:
+            return None
+
+    async def _ask_tux(self, language, challenge_desc, student_code, build, tests=None):
         try:
             import aiohttp
-            import asyncio
 
-            prompt = self._build_analysis_prompt(language, challenge_desc, student_code)
+            prompt = self._build_analysis_prompt(
+                language, challenge_desc, student_code, build, tests
+            )
 
             async with aiohttp.ClientSession() as session:
                 async with session.post(
@@ -134,8 +268,22 @@ class CodeAnalyzer:
                 "tux_emotion": "confused",
             }
 
-    def _build_analysis_prompt(self, language, challenge_desc, student_code):
+    def _build_analysis_prompt(
+        self, language, challenge_desc, student_code, build=None, tests=None
+    ):
         """Build the prompt for code analysis"""
+        build_section = ""
+        if build:
+            how = "sandboxed run with no input" if build.run else "the hidden tests run it"
+            build_section = f"""
+BUILD AND RUN RESULTS (real compiler, {how}):
+{build.report()}
+"""
+        if tests:
+            build_section += f"""
+HIDDEN TEST RESULTS (objective - weigh them heavily):
+{tests.report()}
+"""
         return f"""You are Sergeant Tux analyzing recruit code for a programming boot camp. 
 
 CHALLENGE: {challenge_desc}
@@ -145,7 +293,7 @@ STUDENT CODE:
 ```{language.lower()}
 {student_code}
 ```
-
+{build_section}
 Analyze this code and respond in this EXACT JSON format:
 {{
     "correct": true/false,
@@ -228,6 +376,36 @@ If the challenge is "beginner" level but the code shows "intermediate" or "advan
         else:
             return "disappointed"
 
+    def _apply_build(self, result, build):
+        """Objective build/run facts override the model's opinion"""
+        if build is None:
+            return result
+        result["build"] = build.as_dict()
+        result["build_report"] = build.report()
+        if result.get("success") and not build.passed:
+            result["correct"] = False
+            if not build.ok:
+                result["completeness"] = min(result.get("completeness", 0), 50)
+            result["tux_emotion"] = self._determine_tux_emotion(result)
+        return result
+
+    def _apply_tests(self, result, tests):
+        """Blend the objective pass ratio into completeness"""
+        if tests is None:
+            return result
+        result["tests"] = tests.as_dict()
+        result["test_report"] = tests.report()
+        if result.get("success"):
+            from testbench import blend
+
+            result["completeness"] = blend(
+                result.get("completeness", 0), tests, self.testbench.weight
+            )
+            if not tests.ok:
+                result["correct"] = False
+            result["tux_emotion"] = self._determine_tux_emotion(result)
+        return result
+
     def _create_error_result(self, error_data):
         """Create error result"""
         return {
@@ -244,42 +422,21 @@ If the challenge is "beginner" level but the code shows "intermediate" or "advan
 
 
 class ChallengeFileManager:
-    """Handles creation and management of challenge files"""
-
-    EXTENSIONS = {
-        "Python": ".py",
-        "JavaScript": ".js",
-        "Go": ".go",
-        "Rust": ".rs",
-        "C": ".c",
-        "C++": ".cpp",
-        "Assembly": ".asm",
-        "C#": ".cs",
-        "LOLCODE": ".lol",
-        "Holy C": ".hc",
-        "INTERCAL": ".i",
-        "Shakespeare": ".spl",
-        "Rockstar": ".rock",
-    }
-
-    COMMENT_STYLES = {
-        "Python": ("#", "#"),
-        "JavaScript": ("//", "//"),
-        "Go": ("//", "//"),
-        "Rust": ("//", "//"),
-        "C": ("//", "//"),
-        "C++": ("//", "//"),
-        "Assembly": (";", ";"),
-        "C#": ("//", "//"),
-        "LOLCODE": ("BTW", "BTW"),
-        "Holy C": ("//", "//"),
-        "INTERCAL": ("NOTE", "NOTE"),
-        "Shakespeare": ("", ""),
-        "Rockstar": ("(", ")"),
-    }
-
-    def __init__(self, base_directory="TuxBootCamp_Challenges"):
+    """Handles creation and management of challenge files
+
+    File text comes from the shared TemplateEngine (armory/templates.json),
+    compiled once per language. Files are registered in the SandboxIndex
+    (if given) as they are created, opened and graded, and opened through
+    the EditorLauncher (no shell, off the Tk thread).
+    """
+
+    def __init__(
+        self, base_directory="TuxBootCamp_Challenges", engine=None, index=None, launcher=None
+    ):
         self.base_directory = base_directory
+        self.engine = engine or TemplateEngine.load(ARMORY_DIR)
+        self.index = index
+        self.launcher = launcher  # None: default editor, picked on first open
         self._ensure_directory_exists()
 
     def _ensure_directory_exists(self):
@@ -287,341 +444,63 @@ class ChallengeFileManager:
         if not os.path.exists(self.base_directory):
             os.makedirs(self.base_directory)
 
+    def extension(self, language):
+        return self.engine.extension(language)
+
     def create_challenge_file(
         self, language, challenge_name, challenge_desc, difficulty, student_name
     ):
         """Create a new file with function headers and comments"""
-        filename = self._generate_filename(challenge_name, language)
         content = self._generate_content(
             language, challenge_name, challenge_desc, difficulty, student_name
         )
 
-        filepath = os.path.join(self.base_directory, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        return filepath
-
-    def _generate_filename(self, challenge_name, language):
+        # Exclusive create: two files in the same microsecond get -2, -3, ...
+        for attempt in itertools.count(1):
+            filename = self._generate_filename(challenge_name, language, attempt)
+            filepath = os.path.join(self.base_directory, filename)
+            try:
+                with open(filepath, "x", encoding="utf-8") as f:
+                    f.write(content)
+            except FileExistsError:
+                continue
+            if self.index:
+                self.index.add(filepath, student_name, language, challenge_name)
+            return filepath
+
+    def _generate_filename(self, challenge_name, language, attempt=1):
         """Generate a safe filename for the challenge"""
         safe_name = challenge_name.replace(" ", "_").replace(":", "")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        extension = self.EXTENSIONS.get(language, ".txt")
-        return f"{safe_name}_{timestamp}{extension}"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        extension = self.extension(language)
+        suffix = f"-{attempt}" if attempt > 1 else ""
+        return f"{safe_name}_{timestamp}{suffix}{extension}"
 
     def _generate_content(
         self, language, challenge_name, challenge_desc, difficulty, student_name
     ):
         """Generate file content based on language"""
-        comment_start, _ = self.COMMENT_STYLES.get(language, ("#", "#"))
-
-        header = self._generate_header(
-            comment_start,
-            student_name,
-            challenge_name,
+        return self.engine.render(
             language,
-            difficulty,
-            challenge_desc,
-        )
-
-        template = self._get_language_template(language, comment_start)
-
-        return header + template
-
-    def _generate_header(self, comment, student, challenge, language, difficulty, desc):
-        """Generate file header with challenge information"""
-        return f"""{comment}{'=' * 70}
-{comment} TUX CODE BOOT CAMP - CHALLENGE FILE
-{comment} {'=' * 70}
-{comment} Recruit: {student}
-{comment} Challenge: {challenge}
-{comment} Language: {language}
-{comment} Difficulty: {difficulty}
-{comment} Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-{comment} {'=' * 70}
-{comment}
-{comment} MISSION BRIEFING:
-{comment} {desc}
-{comment}
-{comment} YOUR ORDERS:
-{comment} 1. Read the mission briefing carefully
-{comment} 2. Complete the function implementation below
-{comment} 3. Test your code thoroughly
-{comment} 4. Report back to Sergeant Tux when complete!
-{comment}
-{comment} REMEMBER: Comments are your BATTLE PLAN! Use them!
-{comment} {'=' * 70}
-
-"""
-
-    def _get_language_template(self, language, comment):
-        """Get language-specific code template"""
-        templates = {
-            "Python": self._python_template,
-            "JavaScript": self._javascript_template,
-            "Go": self._go_template,
-            "Rust": self._rust_template,
-            "C": self._c_template,
-            "C++": self._cpp_template,
-            "C#": self._csharp_template,
-            "Assembly": self._assembly_template,
-            "LOLCODE": self._lolcode_template,
-        }
-
-        template_func = templates.get(
-            language, lambda c: self._generic_template(language, c)
+            student=student_name,
+            challenge=challenge_name,
+            difficulty=difficulty,
+            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            description=challenge_desc,
         )
-        return template_func(comment)
-
-    def _python_template(self, comment):
-        return """
-def main():
-    \"\"\"
-    Main function - This is where your code execution begins!
-    Purpose: Implement the challenge requirements here
-    \"\"\"
-    # TODO: Write your code here, recruit!
-    pass
-
-
-def helper_function():
-    \"\"\"
-    Helper function - Break down complex problems into smaller pieces!
-    Purpose: Add any helper functions you need
-    \"\"\"
-    # TODO: Implement helper logic
-    pass
-
-
-if __name__ == "__main__":
-    main()
-    
-# SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _javascript_template(self, comment):
-        return """
-// Main function - This is your entry point!
-// Purpose: Implement the challenge requirements here
-function main() {
-    // TODO: Write your code here, recruit!
-    
-}
-
-// Helper function - Break it down into manageable pieces!
-// Purpose: Add any helper functions you need
-function helperFunction() {
-    // TODO: Implement helper logic
-    
-}
-
-// Execute main function
-main();
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _go_template(self, comment):
-        return """
-package main
-
-import "fmt"
-
-// main - This is your entry point!
-// Purpose: Implement the challenge requirements here
-func main() {
-    // TODO: Write your code here, recruit!
-    fmt.Println("Challenge started!")
-    
-}
-
-// helperFunction - Break it down into manageable pieces!
-// Purpose: Add any helper functions you need
-func helperFunction() {
-    // TODO: Implement helper logic
-    
-}
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _rust_template(self, comment):
-        return """
-// main - This is your entry point!
-// Purpose: Implement the challenge requirements here
-fn main() {
-    // TODO: Write your code here, recruit!
-    println!("Challenge started!");
-    
-}
 
-// helper_function - Break it down into manageable pieces!
-// Purpose: Add any helper functions you need
-fn helper_function() {
-    // TODO: Implement helper logic
-    
-}
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _c_template(self, comment):
-        return """
-#include <stdio.h>
-
-// main - This is your entry point!
-// Purpose: Implement the challenge requirements here
-int main() {
-    // TODO: Write your code here, recruit!
-    printf("Challenge started!\\n");
-    
-    return 0;
-}
-
-// helperFunction - Break it down into manageable pieces!
-// Purpose: Add any helper functions you need
-void helperFunction() {
-    // TODO: Implement helper logic
-    
-}
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _cpp_template(self, comment):
-        return """
-#include <iostream>
-using namespace std;
-
-// main - This is your entry point!
-// Purpose: Implement the challenge requirements here
-int main() {
-    // TODO: Write your code here, recruit!
-    cout << "Challenge started!" << endl;
-    
-    return 0;
-}
-
-// helperFunction - Break it down into manageable pieces!
-// Purpose: Add any helper functions you need
-void helperFunction() {
-    // TODO: Implement helper logic
-    
-}
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _csharp_template(self, comment):
-        return """
-using System;
-
-class TuxChallenge
-{
-    // Main - This is your entry point!
-    // Purpose: Implement the challenge requirements here
-    static void Main()
-    {
-        // TODO: Write your code here, recruit!
-        Console.WriteLine("Challenge started!");
-        
-    }
-    
-    // HelperFunction - Break it down into manageable pieces!
-    // Purpose: Add any helper functions you need
-    static void HelperFunction()
-    {
-        // TODO: Implement helper logic
-        
-    }
-}
-
-// SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _assembly_template(self, comment):
-        return """
-section .data
-    ; Data section - Define your variables here
-    msg db 'Challenge started!', 0xA
-    len equ $ - msg
-
-section .bss
-    ; BSS section - Uninitialized data
-
-section .text
-    global _start
-
-; Main entry point
-; Purpose: Implement the challenge requirements here
-_start:
-    ; TODO: Write your code here, recruit!
-    
-    ; Exit program
-    mov eax, 1
-    xor ebx, ebx
-    int 0x80
-
-; Helper function - Break it down into manageable pieces!
-; Purpose: Add any helper functions you need
-helper_function:
-    ; TODO: Implement helper logic
-    ret
-
-; SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _lolcode_template(self, comment):
-        return """
-HAI 1.2
-    CAN HAS STDIO?
-    
-    BTW Main function - This is your entry point!
-    BTW Purpose: Implement the challenge requirements here
-    
-    VISIBLE "Challenge started!"
-    
-    BTW TODO: Write your code here, recruit!
-    
-    
-    BTW Helper section - Break it down!
-    BTW Purpose: Add any helper logic you need
-    
-    
-KTHXBYE
-
-BTW SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def _generic_template(self, language, comment):
-        return f"""
-{comment} Main function - This is your entry point!
-{comment} Purpose: Implement the challenge requirements here
-
-{comment} TODO: Write your code here, recruit!
-
-
-{comment} Helper function - Break it down into manageable pieces!
-
-{comment} TODO: Implement helper logic
+    def open_file(self, filepath, on_result=None):
+        """Open file in the recruit's editor; returns at once
 
+        on_result(LaunchResult) is called from the launcher thread.
+        """
+        if self.index:
+            self.index.touch(filepath)
+        if self.launcher is None:
+            from editor_launcher import EditorLauncher
 
-{comment} SERGEANT TUX SAYS: "Show me what you've got, recruit!"
-"""
-
-    def open_file(self, filepath):
-        """Open file in default editor"""
-        try:
-            if os.name == "nt":  # Windows
-                os.startfile(filepath)
-            elif os.name == "posix":  # macOS and Linux
-                os.system(
-                    f'open "{filepath}"'
-                    if os.uname().sysname == "Darwin"
-                    else f'xdg-open "{filepath}"'
-                )
-        except Exception as e:
-            raise Exception(f"Could not open file: {str(e)}")
+            self.launcher = EditorLauncher()
+        self.launcher.launch(filepath, on_result)
 
 
 # =====================================================================
@@ -630,426 +509,37 @@ BTW SERGEANT TUX SAYS: "Show me what you've got, recruit!"
 
 
 class LanguageRepository:
-    """Stores and manages programming language data"""
+    """Stores and manages programming language data
 
-    def __init__(self):
-        self.languages = {
-            "Python": {
-                "description": "High-level, interpreted language known for readability and versatility.",
-                "difficulty": "Beginner",
-                "drill_sergeant_take": "PERFECT for BEGINNERS! Easy to READ but don't let that make you LAZY!",
-                "use_cases": ["Web Development", "Data Science", "AI/ML"],
-                "sample_code": "print('Hello, Tux!')\ndef greet(name):\n    return f'Welcome, {name}!'",
-                "learning_resources": [
-                    "https://docs.python.org/3/tutorial/",
-                    "https://www.codecademy.com/learn/learn-python-3",
-                ],
-            },
-            "JavaScript": {
-                "description": "The language of the WEB! If you want to make things MOVE, this is IT!",
-                "difficulty": "Beginner-Intermediate",
-                "drill_sergeant_take": "JavaScript is EVERYWHERE! Master this and you can CONQUER the web!",
-                "use_cases": ["Web Development", "Frontend", "Full Stack"],
-                "sample_code": "console.log('Hello, Tux!');\nfunction greet(name) {\n    return `Welcome, ${name}!`;\n}",
-                "learning_resources": [
-                    "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide",
-                    "https://www.codecademy.com/learn/learn-javascript",
-                ],
-            },
-            "Go": {
-                "description": "Concurrent programming language developed by Google.",
-                "difficulty": "Intermediate",
-                "drill_sergeant_take": "Go is LEAN, MEAN, and gets the JOB DONE! Learn this and you're UNSTOPPABLE!",
-                "use_cases": [
-                    "Cloud Computing",
-                    "Network Programming",
-                    "Microservices",
-                ],
-                "sample_code": 'package main\n\nimport "fmt"\n\nfunc main() {\n    fmt.Println("Hello, Tux!")\n}',
-                "learning_resources": [
-                    "https://go.dev/",
-                    "https://www.freecodecamp.org/news/learn-golang-handbook/",
-                ],
-            },
-            "Rust": {
-                "description": "Systems programming language focused on memory safety and concurrency.",
-                "difficulty": "Advanced",
-                "drill_sergeant_take": "RUST is for SOLDIERS! The COMPILER will YELL at you just like I do!",
-                "use_cases": ["Systems Programming", "WebAssembly", "Network Services"],
-                "sample_code": 'fn main() {\n    println!("Hello, Tux!");\n    let greeting = String::from("Rust is awesome");\n}',
-                "learning_resources": [
-                    "https://doc.rust-lang.org/book/",
-                    "https://rustlings.cool/",
-                ],
-            },
-            "C": {
-                "description": "Low-level systems programming language with direct hardware access.",
-                "difficulty": "Advanced",
-                "drill_sergeant_take": "C is the FOUNDATION! Learn this and you'll understand EVERYTHING!",
-                "use_cases": [
-                    "Operating Systems",
-                    "Embedded Systems",
-                    "Performance-critical Applications",
-                ],
-                "sample_code": '#include <stdio.h>\n\nint main() {\n    printf("Hello, Tux!\\n");\n    return 0;\n}',
-                "learning_resources": [
-                    "https://www.learn-c.org/",
-                    "https://cplusplus.com/doc/tutorial/",
-                ],
-            },
-            "C++": {
-                "description": "Object-oriented systems programming language with high performance.",
-                "difficulty": "Advanced",
-                "drill_sergeant_take": "C++ is the ADVANCED TRAINING! You ready for this?!",
-                "use_cases": [
-                    "Game Development",
-                    "High-Performance Applications",
-                    "System Software",
-                ],
-                "sample_code": '#include <iostream>\nint main() {\n    std::cout << "Hello, Tux!" << std::endl;\n    return 0;\n}',
-                "learning_resources": [
-                    "https://www.learncpp.com/",
-                    "https://www.cplusplus.com/doc/tutorial/",
-                ],
-            },
-            "Assembly": {
-                "description": "Low-level language that directly corresponds to machine instructions.",
-                "difficulty": "Expert",
-                "drill_sergeant_take": "ASSEMBLY is for the ELITE SOLDIERS! This is where the REAL WORK gets done!",
-                "use_cases": [
-                    "Compiler Design",
-                    "Embedded Systems",
-                    "Reverse Engineering",
-                ],
-                "sample_code": "section .data\n    msg db 'Hello, Tux!', 0\nsection .text\n    global _start\n_start:\n    mov eax, 1\n    mov ebx, 0",
-                "learning_resources": [
-                    "https://www.cs.virginia.edu/~evans/cs216/guides/x86.html",
-                    "https://www.assemblylanguagetuts.com/",
-                ],
-            },
-            "C#": {
-                "description": "Microsoft's object-oriented language for .NET ecosystem.",
-                "difficulty": "Intermediate",
-                "drill_sergeant_take": "C# is POWERFUL and MODERN! Microsoft BUILT this for PROFESSIONALS!",
-                "use_cases": [
-                    "Windows Applications",
-                    "Game Development",
-                    "Enterprise Software",
-                ],
-                "sample_code": 'using System;\n\nclass TuxProgram {\n    static void Main() {\n        Console.WriteLine("Hello, Tux!");\n    }\n}',
-                "learning_resources": [
-                    "https://docs.microsoft.com/en-us/dotnet/csharp/",
-                    "https://www.codecademy.com/learn/learn-c-sharp",
-                ],
-            },
-            "LOLCODE": {
-                "description": "Esoteric programming language based on LOLcat internet meme.",
-                "difficulty": "Novelty",
-                "drill_sergeant_take": "LOLCODE is UNCONVENTIONAL! It teaches you to THINK DIFFERENT and HAVE FUN!",
-                "use_cases": ["Humor", "Esoteric Programming", "Creative Coding"],
-                "sample_code": 'HAI 1.2\n    CAN HAS STDIO?\n    VISIBLE "HELLO TUX!"\n    KTHXBYE',
-                "learning_resources": [
-                    "https://en.wikipedia.org/wiki/LOLCODE",
-                    "https://github.com/justinmeza/lolcode-spec",
-                ],
-            },
-            "Holy C": {
-                "description": "Programming language created by Terry A. Davis for TempleOS.",
-                "difficulty": "Unique",
-                "drill_sergeant_take": "Holy C is EXPERIMENTAL! It's for the VISIONARIES willing to explore!",
-                "use_cases": [
-                    "TempleOS Operating System",
-                    "Experimental Computing",
-                    "System Design",
-                ],
-                "sample_code": 'void main() {\n    Print("Hello, Tux!");\n}',
-                "learning_resources": [
-                    "https://www.templeos.org",
-                    "https://en.wikipedia.org/wiki/TempleOS",
-                ],
-            },
-            "INTERCAL": {
-                "description": "Intentionally Complicated programming language designed to be absurd.",
-                "difficulty": "Deliberately Difficult",
-                "drill_sergeant_take": "INTERCAL is a CHALLENGE like no other! MASTER this and you can MASTER anything!",
-                "use_cases": [
-                    "Humor",
-                    "Esoteric Programming Challenge",
-                    "Mental Exercise",
-                ],
-                "sample_code": "DO ,1 <- #1\nPLEASE DO ,1 SUB #1 <- #1\nPLEASE DO ,1 SUB #2 <- #0\nDO COME FROM ,1",
-                "learning_resources": [
-                    "https://www.muppetlabs.com/~breadbox/intercal/",
-                    "https://en.wikipedia.org/wiki/INTERCAL",
-                ],
-            },
-            "Shakespeare": {
-                "description": "Esoteric programming language that looks like a Shakespearean play.",
-                "difficulty": "Artistic Challenge",
-                "drill_sergeant_take": "SHAKESPEARE is ART meets CODE! Show me your CREATIVITY, recruit!",
-                "use_cases": [
-                    "Artistic Programming",
-                    "Coding Creativity",
-                    "Theatrical Expression",
-                ],
-                "sample_code": "Romeo, a young programmer.\nJuliet, a beautiful variable.\n\nRomeo: Thou art the sum of a proud strong lord!",
-                "learning_resources": [
-                    "https://shakespearelang.sourceforge.net/",
-                    "https://en.wikipedia.org/wiki/Shakespeare_Programming_Language",
-                ],
-            },
-            "Rockstar": {
-                "description": "Programming language designed to look like song lyrics.",
-                "difficulty": "Creative",
-                "drill_sergeant_take": "ROCKSTAR is MUSIC meets CODE! If you can COMPOSE, you can PROGRAM!",
-                "use_cases": [
-                    "Artistic Coding",
-                    "Programmer Humor",
-                    "Musical Expression",
-                ],
-                "sample_code": "Rock on, my heart!\nShout it out loud!\nRock on is as loud as the fire\nFire is 100",
-                "learning_resources": [
-                    "https://github.com/RockstarLang/rockstar",
-                    "https://esolangs.org/wiki/Rockstar",
-                ],
-            },
-        }
+    Thin wrapper over the shared armory Catalog: the records are built once
+    per process from ordnance.json/operations.json and every lookup is O(1).
+    """
 
-        self.challenge_templates = {
-            "Python": [
-                (
-                    "BEGINNER DRILL",
-                    "Implement a Fibonacci sequence generator with  memorization using decorators",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Build a CLI todo app with SQLite persistence and CRUD operations",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Create a multi-threaded web scraper with proxy rotation and rate limiting",
-                    "Hard",
-                ),
-            ],
-            "JavaScript": [
-                (
-                    "BEGINNER DRILL",
-                    "Build form validation with regex patterns and real-time error feedback",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create PWA with Service Workers and IndexedDB for offline functionality",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Develop real-time collaborative editor using WebSockets and Operational Transformation",
-                    "Hard",
-                ),
-            ],
-            "Go": [
-                (
-                    "BEGINNER DRILL",
-                    "Build HTTP server with Gorilla Mux and middleware for request logging",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create concurrent prime number generator with worker pools",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement REST API with JWT authentication and rate limiting",
-                    "Hard",
-                ),
-            ],
-            "Rust": [
-                (
-                    "BEGINNER DRILL",
-                    "Create safe calculator with compile-time validation of arithmetic operations",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Build async web crawler with Tokio and Serde for JSON parsing",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement thread-safe LRU cache using crossbeam and parking_lot",
-                    "Hard",
-                ),
-            ],
-            "C": [
-                (
-                    "BEGINNER DRILL",
-                    "Implement binary calculator with stack-based expression evaluation",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create memory-managed dynamic array with custom realloc implementation",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Build AES-128 ECB encryption utility with hex encoding/decoding",
-                    "Hard",
-                ),
-            ],
-            "C++": [
-                (
-                    "BEGINNER DRILL",
-                    "Design polymorphic game entity system with virtual inheritance",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Implement template metaprogramming for compile-time factorial calculation",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Create OpenGL-based 2D renderer with texture atlases and shaders",
-                    "Hard",
-                ),
-            ],
-            "Assembly": [
-                (
-                    "BEGINNER DRILL",
-                    "Implement stack-based arithmetic operations in 64-bit x86 assembly",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create system call-based file copier with buffer management",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement RSA encryption/decryption in pure assembly",
-                    "Hard",
-                ),
-            ],
-            "C#": [
-                (
-                    "BEGINNER DRILL",
-                    "Build WPF calculator with MVVM pattern and data binding",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create file synchronization utility with ZIP compression",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Develop multiplayer networked game with SignalR and concurrency control",
-                    "Hard",
-                ),
-            ],
-            "LOLCODE": [
-                (
-                    "BEGINNER DRILL",
-                    "Create program that outputs 'Hello, World!' with ASCII art",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Build meme generator that combines text and image operations",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement calculator with custom LOLCODE math syntax parser",
-                    "Hard",
-                ),
-            ],
-            "Holy C": [
-                (
-                    "BEGINNER DRILL",
-                    "Create VGA mode 13h graphics demo with pixel plotting",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Implement interrupt-driven keyboard handler in real mode",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Write bootloader that loads and executes a simple OS kernel",
-                    "Hard",
-                ),
-            ],
-            "INTERCAL": [
-                (
-                    "BEGINNER DRILL",
-                    "Write 'Hello, World!' using COME FROM and SUB instruction",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create program that uses . and ? for input/output in non-standard ways",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement obfuscated algorithm with maximum use of INTERCAL's esoteric features",
-                    "Hard",
-                ),
-            ],
-            "Shakespeare": [
-                (
-                    "BEGINNER DRILL",
-                    "Write sonnet-style program that outputs ASCII art",
-                    "Easy",
-                ),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create play that performs basic arithmetic operations",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Implement recursive algorithm using Shakespearean dialogue structure",
-                    "Hard",
-                ),
-            ],
-            "Rockstar": [
-                ("BEGINNER DRILL", "Compose song that outputs a love letter", "Easy"),
-                (
-                    "INTERMEDIATE MISSION",
-                    "Create lyrical implementation of bubble sort",
-                    "Medium",
-                ),
-                (
-                    "ADVANCED OPERATION",
-                    "Write rock ballad that calculates Fibonacci sequence",
-                    "Hard",
-                ),
-            ],
-        }
+    def __init__(self, armory_dir=ARMORY_DIR):
+        self.catalog = Catalog.load(armory_dir)
+        self._search_index = None
 
     def get_language(self, name):
-        """Get language data by name"""
-        return self.languages.get(name)
+        """Get language record by name"""
+        return self.catalog.get_language(name)
 
     def get_all_languages(self):
-        """Get all available languages"""
-        return sorted(self.languages.keys())
+        """Get all available languages (already sorted)"""
+        return self.catalog.get_all_languages()
 
     def get_challenges(self, language):
         """Get challenges for a specific language"""
-        return self.challenge_templates.get(language, [])
+        return self.catalog.get_challenges(language)
 
     def has_challenges(self, language):
         """Check if language has challenges available"""
-        return language in self.challenge_templates
+        return self.catalog.has_challenges(language)
+
+    def search(self, query):
+        """Ranked (language, [matching challenges]) pairs for a query"""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.catalog)
+        return self._search_index.matching_languages(query)
 
 
 # =====================================================================
@@ -1429,14 +919,38 @@ LET'S MOVE OUT!
 class MainInterface:
     """Main learning interface"""
 
-    def __init__(self, root, student, language_repo, file_manager, tux_sergeant):
+    def __init__(
+        self, root, student, language_repo, file_manager, tux_sergeant,
+        progress_store=None, leaderboard=None, selector=None, submission_store=None,
+        watch_queue=None, build_engine=None, testbench=None,
+    ):
         self.root = root
         self.student = student
         self.language_repo = language_repo
         self.file_manager = file_manager
         self.tux = tux_sergeant
+        self.progress_store = progress_store
+        self.leaderboard = leaderboard
+        self.selector = selector
+        self.submission_store = submission_store
+        self.build_engine = build_engine
+        self.testbench = testbench
+
+        # Watch mode: the SandboxWatcher thread fills watch_queue with
+        # (path, PreScreen); _drain_watch_queue empties it on the Tk thread
+        self.watch_queue = watch_queue
+        self.ledger = None
+        if watch_queue is not None:
+            from watcher import FingerprintLedger
+
+            self.ledger = FingerprintLedger()
+        self._latest_save = None  # (path, PreScreen) of the newest save
+        self.live_label = None
+        self.grade_now_button = None
 
         self.language_listbox = None
+        self.search_var = None
+        self._listbox_rows = []  # (language, Challenge or None) per listbox row
         self.language_name_label = None
         self.tux_commentary_text = None
         self.description_text = None
@@ -1458,6 +972,10 @@ class MainInterface:
         self._create_left_panel(content_frame)
         self._create_right_panel(content_frame)
 
+        if self.watch_queue is not None:
+            self._create_live_bar(main_frame)
+            self._drain_watch_queue()
+
     def _create_banner(self, parent):
         """Create top banner with student info"""
         banner_frame = tk.Frame(parent, bg="#ff6b6b")
@@ -1476,7 +994,7 @@ class MainInterface:
 
         self.motivation_label = tk.Label(
             banner_frame,
-            text=f"Motivation Level: {int(self.student.motivation_level)}/100",
+            text=self._motivation_text(),
             font=("Arial", 12, "bold"),
             fg="#ffffff",
             bg="#ff6b6b",
@@ -1499,6 +1017,18 @@ class MainInterface:
         )
         languages_label.pack(pady=10)
 
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            left_frame,
+            textvariable=self.search_var,
+            font=("Arial", 10),
+            bg="#3b3b3b",
+            fg="#ffffff",
+            insertbackground="white",
+        )
+        search_entry.pack(fill=tk.X, padx=5, pady=(0, 5))
+        self.search_var.trace_add("write", lambda *args: self._filter_languages())
+
         self.language_listbox = tk.Listbox(
             left_frame,
             width=20,
@@ -1515,11 +1045,36 @@ class MainInterface:
         self.language_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.language_listbox.yview)
 
-        for language in self.language_repo.get_all_languages():
-            self.language_listbox.insert(tk.END, language)
+        self._filter_languages()
 
         self.language_listbox.bind("<<ListboxSelect>>", self._on_language_select)
 
+    def _filter_languages(self):
+        """Refill the language list from the search box (runs per keystroke)"""
+        query = self.search_var.get().strip()
+
+        if query:
+            rows = []
+            for language, challenges in self.language_repo.search(query):
+                rows.append((language, None))
+                rows.extend((language, challenge) for challenge in challenges)
+        else:
+            rows = [(language, None) for language in self.language_repo.get_all_languages()]
+
+        self._listbox_rows = rows
+        self.language_listbox.delete(0, tk.END)
+        if rows:
+            self.language_listbox.insert(
+                tk.END,
+                *[
+                    f"   > {challenge.name}" if challenge else language
+                    for language, challenge in rows
+                ],
+            )
+        for i, (_, challenge) in enumerate(rows):
+            if challenge:
+                self.language_listbox.itemconfig(i, fg="#ffd93d")
+
     def _create_right_panel(self, parent):
         """Create language details panel"""
         right_frame = tk.Frame(parent, bg="#2b2b2b")
@@ -1631,14 +1186,127 @@ class MainInterface:
         )
         commit_button.pack(side=tk.LEFT, padx=3)
 
+        if self.leaderboard:
+            leaderboard_button = tk.Button(
+                button_frame,
+                text="LEADERBOARD",
+                font=("Arial", 10, "bold"),
+                bg="#4b4b4b",
+                fg="#ffffff",
+                command=self._show_leaderboard,
+                padx=10,
+                pady=6,
+            )
+            leaderboard_button.pack(side=tk.LEFT, padx=3)
+
+    def _create_live_bar(self, parent):
+        """Live pre-screen of the latest save, plus GRADE NOW"""
+        live_frame = tk.Frame(parent, bg="#111111")
+        live_frame.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.live_label = tk.Label(
+            live_frame,
+            text="WATCHING YOUR CHALLENGE FILES - SAVE TO GET INSTANT FEEDBACK",
+            font=("Courier", 10, "bold"),
+            fg="#888888",
+            bg="#111111",
+            anchor=tk.W,
+            padx=10,
+            pady=6,
+        )
+        self.live_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.grade_now_button = tk.Button(
+            live_frame,
+            text="GRADE NOW",
+            font=("Arial", 10, "bold"),
+            bg="#9370db",
+            fg="#ffffff",
+            command=self._grade_latest_save,
+            state=tk.DISABLED,
+            padx=10,
+            pady=4,
+        )
+        self.grade_now_button.pack(side=tk.RIGHT, padx=10, pady=4)
+
+    def _drain_watch_queue(self):
+        """Show pending watcher results; never blocks the Tk thread"""
+        from queue import Empty
+
+        if not self.live_label.winfo_exists():
+            return  # interface torn down
+        latest = None
+        try:
+            while True:
+                latest = self.watch_queue.get_nowait()
+        except Empty:
+            pass
+
+        if latest:
+            path, result = latest
+            self._latest_save = latest
+            if self.file_manager.index:
+                self.file_manager.index.refresh(path)
+            if not result.ok:
+                color = "#ff6b6b"
+            elif result.todos:
+                color = "#ffd93d"
+            else:
+                color = "#00ff00"
+            self.live_label.config(
+                text=f"LIVE  {os.path.basename(path)}: {result.summary()}", fg=color
+            )
+            self._update_grade_now()
+        self.root.after(200, self._drain_watch_queue)
+
+    def _on_editor_opened(self, result):
+        """Launch latency in the live bar, or the log without watch mode"""
+        text = (
+            f"EDITOR  {os.path.basename(result.path)} opened with"
+            f" {os.path.basename(result.argv[0])} in {result.latency_ms:.0f}ms"
+        )
+        if self.live_label is not None and self.live_label.winfo_exists():
+            self.live_label.config(text=text, fg="#888888")
+            return
+        import logging
+
+        logging.getLogger(__name__).info(text)
+
+    def _update_grade_now(self):
+        """GRADE NOW only when the latest save differs from its last grade"""
+        if not self._latest_save:
+            return
+        path, result = self._latest_save
+        changed = self.ledger.needs_grade(path, result.fingerprint)
+        self.grade_now_button.config(
+            state=tk.NORMAL if changed else tk.DISABLED,
+            text="GRADE NOW" if changed else "ALREADY GRADED",
+        )
+
+    def _grade_latest_save(self):
+        """Full grade of the file the recruit just saved"""
+        path, _ = self._latest_save
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                code_content = f.read()
+        except Exception as e:
+            messagebox.showerror("ERROR", f"Could not read file: {str(e)}")
+            return
+        language = next(
+            (line.partition(" Language: ")[2].strip()
+             for line in code_content.split("\n")[:10] if " Language: " in line),
+            self._get_selected_language(),
+        )
+        self._open_submission(language, code_content, path)
+
     def _on_language_select(self, event):
         """Handle language selection"""
         try:
             selected_index = self.language_listbox.curselection()[0]
-            selected_language = self.language_listbox.get(selected_index)
+            selected_language = self._listbox_rows[selected_index][0]
 
-            language_data = self.language_repo.get_language(selected_language)
-            if not language_data:
+            language = self.language_repo.get_language(selected_language)
+            if not language:
                 return
 
             self.language_name_label.config(text=selected_language.upper())
@@ -1646,22 +1314,22 @@ class MainInterface:
             self.tux_commentary_text.config(state=tk.NORMAL)
             self.tux_commentary_text.delete(1.0, tk.END)
             self.tux_commentary_text.insert(
-                tk.END, language_data["drill_sergeant_take"]
+                tk.END, language.drill_sergeant_take
             )
             self.tux_commentary_text.config(state=tk.DISABLED)
 
             self.description_text.config(state=tk.NORMAL)
             self.description_text.delete(1.0, tk.END)
-            desc = f"Difficulty: {language_data['difficulty']}\n\n"
+            desc = f"Difficulty: {language.difficulty}\n\n"
             desc += "Use Cases:\n"
-            for use_case in language_data["use_cases"]:
+            for use_case in language.use_cases:
                 desc += f"- {use_case}\n"
             self.description_text.insert(tk.END, desc)
             self.description_text.config(state=tk.DISABLED)
 
             self.code_sample_text.config(state=tk.NORMAL)
             self.code_sample_text.delete(1.0, tk.END)
-            self.code_sample_text.insert(tk.END, language_data["sample_code"])
+            self.code_sample_text.insert(tk.END, language.sample_code)
             self.code_sample_text.config(state=tk.DISABLED)
 
         except IndexError:
@@ -1671,7 +1339,15 @@ class MainInterface:
         """Get currently selected language"""
         try:
             selected_index = self.language_listbox.curselection()[0]
-            return self.language_listbox.get(selected_index)
+            return self._listbox_rows[selected_index][0]
+        except IndexError:
+            return None
+
+    def _get_selected_challenge(self):
+        """Get the challenge row picked from search results, if any"""
+        try:
+            selected_index = self.language_listbox.curselection()[0]
+            return self._listbox_rows[selected_index][1]
         except IndexError:
             return None
 
@@ -1682,8 +1358,8 @@ class MainInterface:
             messagebox.showwarning("TUX SAYS:", "PICK A LANGUAGE FIRST!")
             return
 
-        language_data = self.language_repo.get_language(selected_language)
-        resources = language_data["learning_resources"]
+        language = self.language_repo.get_language(selected_language)
+        resources = [resource.url for resource in language.resources]
 
         resource_window = tk.Toplevel(self.root)
         resource_window.title(f"{selected_language} Resources - GET LEARNING!")
@@ -1706,6 +1382,8 @@ class MainInterface:
         for i, resource in enumerate(resources, 1):
 
             def open_resource(url=resource):
+                import webbrowser
+
                 webbrowser.open(url)
 
             resource_button = tk.Button(
@@ -1730,6 +1408,55 @@ class MainInterface:
         )
         motivation_text.pack(pady=10)
 
+    def _show_leaderboard(self):
+        """Show the global board and the selected language's board"""
+        boards = [("ALL LANGUAGES", None)]
+        selected_language = self._get_selected_language()
+        if selected_language:
+            boards.append((selected_language.upper(), selected_language))
+
+        board_window = tk.Toplevel(self.root)
+        board_window.title("LEADERBOARD - Who's Carrying This Platoon?")
+        board_window.geometry("700x500")
+        board_window.configure(bg="#1a1a1a")
+
+        frame = tk.Frame(board_window, bg="#1a1a1a")
+        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        for title, language in boards:
+            column = tk.Frame(frame, bg="#1a1a1a")
+            column.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
+
+            tk.Label(
+                column,
+                text=title,
+                font=("Arial", 14, "bold"),
+                fg="#ff6b6b",
+                bg="#1a1a1a",
+            ).pack(pady=(0, 10))
+
+            lines = [
+                f"{rank:>3}. {name:<20} {score:>8.1f}"
+                for rank, (name, score) in enumerate(
+                    self.leaderboard.top(10, language=language), 1
+                )
+            ]
+            my_rank = self.leaderboard.rank(self.student.name, language=language)
+            if my_rank is None:
+                lines.append("\nYOU'RE NOT ON THE BOARD. SUBMIT SOME CODE!")
+            elif my_rank > 10:
+                lines.append(f"\nYOU: #{my_rank}. CLIMB, RECRUIT!")
+
+            tk.Label(
+                column,
+                text="\n".join(lines) or "NOBODY HAS SCORED YET!",
+                font=("Courier", 10),
+                fg="#00ff00",
+                bg="#1a1a1a",
+                justify=tk.LEFT,
+                anchor=tk.NW,
+            ).pack(fill=tk.BOTH, expand=True)
+
     def _commit_language(self):
         """Commit to learning a language"""
         selected_language = self._get_selected_language()
@@ -1738,8 +1465,7 @@ class MainInterface:
             return
 
         if selected_language not in self.student.languages_started:
-            self.student.languages_started.append(selected_language)
-            self.student.update_motivation(10)
+            self.student.record_event("commit_language", language=selected_language)
             self._update_motivation_display()
 
             messagebox.showinfo(
@@ -1769,19 +1495,30 @@ class MainInterface:
             )
             return
 
-        challenges = self.language_repo.get_challenges(selected_language)
-        challenge_name, challenge_desc, difficulty = random.choice(challenges)
+        challenge = self._get_selected_challenge()
+        if challenge is None and self.selector:
+            challenge = self.selector.next_challenge(self.student.mastery, selected_language)
+            if challenge is None:
+                messagebox.showinfo(
+                    "TUX SAYS:",
+                    f"You've ACED every {selected_language} challenge I've got!\n\n"
+                    f"Pick another language and KEEP MOVING, RECRUIT!",
+                )
+                return
+        elif challenge is None:
+            challenge = random.choice(self.language_repo.get_challenges(selected_language))
 
         challenge_window = ChallengeWindow(
             self.root,
             selected_language,
-            challenge_name,
-            challenge_desc,
-            difficulty,
+            challenge.name,
+            challenge.description,
+            self.selector.difficulty_of(challenge) if self.selector else challenge.difficulty,
             self.student,
             self.file_manager,
             self.tux,
             self._update_motivation_display,
+            on_editor_opened=self._on_editor_opened,
         )
         challenge_window.show()
 
@@ -1792,21 +1529,7 @@ class MainInterface:
             messagebox.showwarning("TUX SAYS:", "SELECT A LANGUAGE FIRST!")
             return
 
-        # Open file dialog to select code file
-        from tkinter import filedialog
-
-        filename = filedialog.askopenfilename(
-            title="SELECT YOUR CODE FILE",
-            initialdir="TuxBootCamp_Challenges",
-            filetypes=[
-                (
-                    f"{selected_language} files",
-                    f"*{ChallengeFileManager.EXTENSIONS.get(selected_language, '.txt')}",
-                ),
-                ("All files", "*.*"),
-            ],
-        )
-
+        filename = self._choose_code_file(selected_language)
         if not filename:
             return
 
@@ -1818,23 +1541,117 @@ class MainInterface:
             messagebox.showerror("ERROR", f"Could not read file: {str(e)}")
             return
 
-        # Show submission window
+        self._open_submission(selected_language, code_content, filename)
+
+    def _open_submission(self, language, code_content, source_path):
+        """Show the submission window for one file"""
         submission_window = CodeSubmissionWindow(
             self.root,
-            selected_language,
+            language,
             code_content,
             self.student,
             self.tux,
             self._update_motivation_display,
+            progress_store=self.progress_store,
+            leaderboard=self.leaderboard,
+            submission_store=self.submission_store,
+            sandbox_index=self.file_manager.index,
+            source_path=source_path,
+            on_graded=self._on_graded,
+            build_engine=self.build_engine,
+            testbench=self.testbench,
         )
         submission_window.show()
 
+    def _on_graded(self, source_path, code_content):
+        """Remember what was graded so GRADE NOW waits for a real change"""
+        if self.ledger is None:
+            return
+        from prescreen import fingerprint
+
+        self.ledger.graded(source_path, fingerprint(code_content))
+        if self.grade_now_button:
+            self._update_grade_now()
+
+    def _choose_code_file(self, language):
+        """Pick from the recruit's recent files (sandbox index), or browse"""
+        from tkinter import filedialog
+
+        def browse():
+            return filedialog.askopenfilename(
+                title="SELECT YOUR CODE FILE",
+                initialdir=self.file_manager.base_directory,
+                filetypes=[
+                    (f"{language} files", f"*{self.file_manager.extension(language)}"),
+                    ("All files", "*.*"),
+                ],
+            )
+
+        index = self.file_manager.index
+        recent = index.recent(self.student.name, language) if index else []
+        if not recent:
+            return browse()
+
+        picker = tk.Toplevel(self.root)
+        picker.title("SELECT YOUR CODE FILE")
+        picker.configure(bg="#1a1a1a")
+        picker.transient(self.root)
+
+        tk.Label(
+            picker,
+            text=f"YOUR RECENT {language.upper()} CHALLENGES",
+            font=("Arial", 14, "bold"),
+            fg="#ff6b6b",
+            bg="#1a1a1a",
+        ).pack(padx=20, pady=(20, 10))
+
+        listbox = tk.Listbox(
+            picker, width=70, height=min(len(recent), 12), font=("Courier", 10),
+            bg="#2b2b2b", fg="#00ff00", selectbackground="#ff6b6b",
+        )
+        for entry in recent:
+            stamp = datetime.fromtimestamp(entry["mtime"]).strftime("%Y-%m-%d %H:%M")
+            graded = "  [GRADED]" if entry["graded"] else ""
+            listbox.insert(tk.END, f"{entry['challenge']:<28} {stamp}{graded}")
+        listbox.selection_set(0)
+        listbox.pack(padx=20, pady=5)
+
+        choice = {"path": None}
+
+        def pick(_event=None):
+            selection = listbox.curselection()
+            if selection:
+                choice["path"] = recent[selection[0]]["path"]
+            picker.destroy()
+
+        def pick_other():
+            picker.destroy()
+            choice["path"] = browse()
+
+        buttons = tk.Frame(picker, bg="#1a1a1a")
+        buttons.pack(pady=(10, 20))
+        tk.Button(buttons, text="SUBMIT THIS ONE!", command=pick, bg="#00ff00",
+                  fg="#000000", font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="BROWSE...", command=pick_other, bg="#4a4a4a",
+                  fg="#ffffff", font=("Arial", 11)).pack(side=tk.LEFT, padx=5)
+        listbox.bind("<Double-Button-1>", pick)
+
+        picker.grab_set()
+        self.root.wait_window(picker)
+        return choice["path"]
+
+    def _motivation_text(self):
+        """Motivation plus the daily streak for the banner"""
+        activity = self.student.activity
+        return (
+            f"Motivation Level: {int(self.student.motivation_level)}/100"
+            f"  |  Streak: {activity.current_streak()} days (best {activity.longest})"
+        )
+
     def _update_motivation_display(self):
         """Update motivation level display"""
         if self.motivation_label:
-            self.motivation_label.config(
-                text=f"Motivation Level: {int(self.student.motivation_level)}/100"
-            )
+            self.motivation_label.config(text=self._motivation_text())
 
     def update_motivation(self, change):
         """Update student motivation"""
@@ -1856,6 +1673,7 @@ class ChallengeWindow:
         file_manager,
         tux_sergeant,
         on_motivation_update,
+        on_editor_opened=None,
     ):
         self.root = root
         self.language = language
@@ -1866,6 +1684,8 @@ class ChallengeWindow:
         self.file_manager = file_manager
         self.tux = tux_sergeant
         self.on_motivation_update = on_motivation_update
+        self.on_editor_opened = on_editor_opened
+        self._launches = None  # LaunchResults from the launcher thread
 
     def show(self):
         """Display challenge window"""
@@ -1953,12 +1773,20 @@ class ChallengeWindow:
             font=("Arial", 9),
             bg="#3b3b3b",
             fg="#ffffff",
-            command=window.destroy,
+            command=lambda: self._skip_challenge(window),
             padx=12,
             pady=6,
         )
         skip_button.pack(side=tk.LEFT, padx=4)
 
+    def _skip_challenge(self, window):
+        """Handle 'Maybe Later' - Tux notices"""
+        self.student.record_event(
+            "skip_challenge", language=self.language, challenge=self.challenge_name
+        )
+        self.on_motivation_update()
+        window.destroy()
+
     def _accept_challenge(self, window):
         """Handle challenge acceptance"""
         try:
@@ -1972,7 +1800,9 @@ class ChallengeWindow:
             )
 
             # Update motivation
-            self.student.update_motivation(15)
+            self.student.record_event(
+                "accept_challenge", language=self.language, challenge=self.challenge_name
+            )
             self.on_motivation_update()
 
             # Show success message
@@ -1985,8 +1815,12 @@ class ChallengeWindow:
                 f"Motivation: {int(self.student.motivation_level)}/100",
             )
 
-            # Open the file
-            self.file_manager.open_file(filename)
+            # Open the file; the launcher thread reports back through a queue
+            from queue import Queue
+
+            self._launches = Queue()
+            self.file_manager.open_file(filename, self._launches.put)
+            self._drain_launches()
 
             window.destroy()
 
@@ -1995,12 +1829,38 @@ class ChallengeWindow:
                 "FILE CREATION ERROR", f"Couldn't create challenge file:\n{str(e)}"
             )
 
+    def _drain_launches(self):
+        """Wait for the launcher's result without blocking the Tk thread"""
+        from queue import Empty
+
+        try:
+            result = self._launches.get_nowait()
+        except Empty:
+            self.root.after(100, self._drain_launches)
+            return
+        self._on_editor_launched(result)
+
+    def _on_editor_launched(self, result):
+        """Latency to the interface on success, a warning on failure"""
+        if result.ok:
+            if self.on_editor_opened:
+                self.on_editor_opened(result)
+            return
+        messagebox.showwarning(
+            "TUX SAYS:",
+            f"Couldn't open your editor:\n{result.error}\n\n"
+            f"Open the file yourself, recruit:\n{result.path}",
+        )
+
 
 class CodeSubmissionWindow:
     """Window for submitting and analyzing code"""
 
     def __init__(
-        self, root, language, code_content, student, tux_sergeant, on_motivation_update
+        self, root, language, code_content, student, tux_sergeant, on_motivation_update,
+        progress_store=None, leaderboard=None, submission_store=None,
+        sandbox_index=None, source_path=None, on_graded=None, build_engine=None,
+        testbench=None,
     ):
         self.root = root
         self.language = language
@@ -2008,11 +1868,26 @@ class CodeSubmissionWindow:
         self.student = student
         self.tux = tux_sergeant
         self.on_motivation_update = on_motivation_update
-        self.analyzer = CodeAnalyzer()
-
-        # Extract challenge description from code comments
+        self.progress_store = progress_store
+        self.leaderboard = leaderboard
+        self.submission_store = submission_store
+        self.sandbox_index = sandbox_index
+        self.source_path = source_path
+        self.on_graded = on_graded
+        self.analyzer = CodeAnalyzer(build_engine, testbench)
+
+        # Extract challenge name + description from code comments
+        self.challenge_name = self._extract_challenge_name()
         self.challenge_desc = self._extract_challenge_description()
 
+    def _extract_challenge_name(self):
+        """Extract the 'Challenge:' header line written by ChallengeFileManager"""
+        for line in self.code_content.split("\n")[:10]:
+            _, marker, name = line.partition(" Challenge: ")
+            if marker:
+                return name.strip()
+        return "Freestyle"
+
     def _extract_challenge_description(self):
         """Extract challenge description from code file"""
         lines = self.code_content.split("\n")
@@ -2154,6 +2029,20 @@ class CodeSubmissionWindow:
         """Run AI analysis in background thread"""
         import asyncio
 
+        # Every attempt's code goes into the (deduplicating) history - the
+        # delta encoding and commit stay off the Tk thread
+        if self.submission_store:
+            try:
+                self.submission_store.add(
+                    self.student.name,
+                    f"{self.language}/{self.challenge_name}",
+                    self.code_content,
+                )
+            except Exception as e:  # losing the history entry must not block grading
+                import logging
+
+                logging.getLogger(__name__).warning("submission history not saved: %s", e)
+
         # Create new event loop for this thread
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
@@ -2161,7 +2050,7 @@ class CodeSubmissionWindow:
         try:
             result = loop.run_until_complete(
                 self.analyzer.analyze_code(
-                    self.language, self.challenge_desc, self.code_content
+                    self.language, self.challenge_desc, self.code_content, self.challenge_name
                 )
             )
 
@@ -2221,19 +2110,57 @@ class CodeSubmissionWindow:
             if result.get("summary"):
                 self.analysis_text.insert(tk.END, f"Summary: {result['summary']}\n")
 
+        if result.get("test_report"):
+            self.analysis_text.insert(tk.END, "\n" + "=" * 80 + "\n")
+            self.analysis_text.insert(tk.END, "HIDDEN TESTS:\n")
+            self.analysis_text.insert(tk.END, "=" * 80 + "\n\n")
+            self.analysis_text.insert(tk.END, result["test_report"] + "\n")
+
+        if result.get("build_report"):
+            self.analysis_text.insert(tk.END, "\n" + "=" * 80 + "\n")
+            self.analysis_text.insert(tk.END, "BUILD & RUN:\n")
+            self.analysis_text.insert(tk.END, "=" * 80 + "\n\n")
+            self.analysis_text.insert(tk.END, result["build_report"] + "\n")
+
         self.analysis_text.config(state=tk.DISABLED)
 
         # Update motivation based on result
         if result.get("correct"):
-            motivation_change = 20
+            change = "code_correct"
         elif result.get("completeness", 0) >= 50:
-            motivation_change = 10
+            change = "code_partial"
         else:
-            motivation_change = -5
+            change = "code_failed"
 
-        self.student.update_motivation(motivation_change)
+        if result.get("success"):
+            self.student.record_event(
+                "code_graded",
+                change,
+                language=self.language,
+                challenge=self.challenge_name,
+                correct=bool(result.get("correct")),
+                completeness=result.get("completeness", 0),
+                quality_score=result.get("quality_score", 0),
+                emotion=result.get("tux_emotion", "neutral"),
+            )
+        else:
+            self.student.update_motivation(self.student.motivation_changes[change])
         self.on_motivation_update()
 
+        if result.get("success"):
+            if self.progress_store:
+                self.progress_store.stage_submission(
+                    self.student.name, self.language, self.challenge_name, result
+                )
+            if self.leaderboard:
+                self.leaderboard.record(
+                    self.student.name, self.language, self.challenge_name, result
+                )
+            if self.sandbox_index and self.source_path:
+                self.sandbox_index.mark_graded(self.source_path)
+            if self.on_graded and self.source_path:
+                self.on_graded(self.source_path, self.code_content)
+
         # Re-enable submit button
         self.submit_button.config(state=tk.NORMAL, text="SUBMIT FOR REVIEW!")
 
@@ -2254,13 +2181,148 @@ class TuxBootCampApp:
 
         # Initialize components
         self.student = None
+        self.config = ConfigManager(os.path.join(ATTEMPT4_DIR, "command.json"))
         self.tux_sergeant = TuxDrillSergeant()
         self.language_repo = LanguageRepository()
-        self.file_manager = ChallengeFileManager()
+        challenges_dir = self.config.get(
+            "paths", "challenge_files", default="TuxBootCamp_Challenges"
+        )
+        self.file_manager = ChallengeFileManager(
+            challenges_dir,
+            index=SandboxIndex.from_config(self.config, challenges_dir),
+        )
+
+        # Progress persistence - writes are batched on the auto-save timer
+        self.progress_store = None
+        self.submission_store = None
+        if self.config.get("features", "progress_saving", default=False):
+            self.progress_store = ProgressStore(
+                self.config.get("paths", "progress_db", default="tux_progress.db")
+            )
+            self.submission_store = SubmissionStore(
+                self.config.get("paths", "submissions", default="tux_submissions.db")
+            )
+
+        # Leaderboard is rebuilt from saved grades, then kept current per grade
+        self.leaderboard = None
+        if self.config.get("features", "leaderboard", default=False):
+            self.leaderboard = Leaderboard.from_config(self.config, self.progress_store)
+
+        self.achievements = None
+        if self.config.get("features", "achievement_system", default=False):
+            self.achievements = AchievementEngine.load(
+                ARMORY_DIR, self.language_repo.catalog
+            )
+
+        self.selector = ChallengeSelector.from_config(self.config, self.language_repo.catalog)
+        self.watcher = None
+
+        # Submissions are compiled and run for real before Tux grades them.
+        # The editor launcher and the engines (subprocess, thread pools...)
+        # load once the login screen is up - the recruit is still typing.
+        self.build_engine = None
+        self.testbench = None
+        self.root.after_idle(self._load_engines)
+
+        # Closing the window always stops the watcher and closes the index
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
 
         # Start with login screen
         self.show_login_screen()
 
+    def _load_engines(self):
+        """Import and configure the process-spawning engines, after first frame"""
+        from editor_launcher import EditorLauncher
+
+        self.file_manager.launcher = EditorLauncher.from_config(self.config)
+        if self.config.get("features", "build_and_run", default=False):
+            from build_engine import BuildEngine
+            from testbench import TestBench
+
+            self.build_engine = BuildEngine.from_config(self.config)
+            self.testbench = TestBench.from_config(
+                self.config, self.build_engine, self.language_repo.catalog
+            )
+            self.build_engine.prune()
+
+    def _autosave(self):
+        """Stage the current snapshot and flush everything off the Tk thread"""
+        if self.student:
+            self.progress_store.stage_recruit(self.student.to_record())
+            journal = self.student.journal
+            if journal.needs_compaction():
+                journal.compact(self.student.to_record())
+            else:
+                journal.sync()
+        self.progress_store.flush()
+        self._schedule_autosave()
+
+    def _schedule_autosave(self):
+        interval = self.config.get("behavior", "auto_save_interval", default=300)
+        self.root.after(int(interval * 1000), self._autosave)
+
+    def shutdown(self):
+        """Save progress one last time and close"""
+        if self.watcher:
+            self.watcher.stop()
+        if self.progress_store:
+            if self.student:
+                self.progress_store.stage_recruit(self.student.to_record())
+                self.student.journal.close()
+            self.progress_store.close()
+            self.submission_store.close()
+        self.file_manager.index.close()
+        self.root.destroy()
+
+    def _load_student(self, name):
+        """Rebuild a recruit from their journal (last snapshot + newer events)"""
+        journal = Journal(
+            self.config.get("paths", "journal_dir", default="tux_journal"), name
+        )
+        snapshot, _ = journal.load_snapshot()
+        is_new = False
+
+        if snapshot:
+            student = StudentProgress.from_record(snapshot)
+        else:
+            student = StudentProgress(name)
+            if os.path.getsize(journal.log_path) == 0:
+                # Progress saved before the journal existed becomes its first snapshot
+                record = self.progress_store.load_recruit(name)
+                if record:
+                    student = StudentProgress.from_record(record)
+                    journal.compact(student.to_record())
+                else:
+                    is_new = True
+
+        student.motivation_changes.update(
+            self.config.get("motivation", "changes", default={})
+        )
+        if self.achievements:
+            student.medals = self.achievements.new_case((snapshot or {}).get("medals"))
+        student.mastery = self.selector.new_mastery((snapshot or {}).get("mastery"))
+        journal.replay(student)
+        if journal.needs_compaction():
+            journal.compact(student.to_record())
+        student.journal = journal
+
+        if student.medals:
+            # Medals earned in earlier sessions were announced back then
+            student.medals.take_unannounced()
+        if is_new:
+            student.record_event("enroll")
+        return student
+
+    def _announce_medal(self, award_id):
+        """Pop up a newly earned medal once the current handler returns"""
+        name, description = self.achievements.describe(award_id)
+        self.root.after(
+            0,
+            lambda: messagebox.showinfo(
+                "MEDAL EARNED!", f"{name}\n\n{description}\n\nDON'T GET COMFORTABLE, RECRUIT!"
+            ),
+        )
+
     def show_login_screen(self):
         """Display login screen"""
         login_screen = LoginScreen(self.root, self.on_student_enrolled)
@@ -2268,7 +2330,24 @@ class TuxBootCampApp:
 
     def on_student_enrolled(self, name):
         """Handle student enrollment"""
-        self.student = StudentProgress(name)
+        if self.progress_store:
+            self.student = self._load_student(name)
+        else:
+            self.student = StudentProgress(name)
+            self.student.motivation_changes.update(
+                self.config.get("motivation", "changes", default={})
+            )
+            if self.achievements:
+                self.student.medals = self.achievements.new_case()
+            self.student.mastery = self.selector.new_mastery()
+        self.student.on_medal = self._announce_medal
+
+        if self.progress_store:
+            self.progress_store.stage_recruit(self.student.to_record())
+            self._schedule_autosave()
+
+        # Sweep stale, ungraded challenge files once the UI is up
+        self.root.after_idle(self.file_manager.index.enforce_quotas, name)
 
         # Clear the screen
         for widget in self.root.winfo_children():
@@ -2290,6 +2369,25 @@ class TuxBootCampApp:
         for widget in self.root.winfo_children():
             widget.destroy()
 
+        # Watch mode: pre-screen the recruit's files on every save
+        watch_queue = None
+        if self.config.get("features", "watch_mode", default=False):
+            import queue
+            from watcher import SandboxWatcher
+
+            watch_queue = queue.Queue()
+            if self.watcher:
+                self.watcher.stop()
+            self.watcher = SandboxWatcher(
+                self.file_manager.base_directory,
+                lambda path, result: watch_queue.put((path, result)),
+                comment_for=self.file_manager.engine.comment,
+                recruit=self.student.name,
+                debounce=self.config.get("watch", "debounce_seconds", default=0.6),
+                interval=self.config.get("watch", "poll_interval_seconds", default=1.0),
+                backend=self.config.get("watch", "backend", default="auto"),
+            ).start()
+
         # Create and show main interface
         main_interface = MainInterface(
             self.root,
@@ -2297,6 +2395,13 @@ class TuxBootCampApp:
             self.language_repo,
             self.file_manager,
             self.tux_sergeant,
+            progress_store=self.progress_store,
+            leaderboard=self.leaderboard,
+            selector=self.selector,
+            submission_store=self.submission_store,
+            watch_queue=watch_queue,
+            build_engine=self.build_engine,
+            testbench=self.testbench,
         )
         main_interface.show()
 
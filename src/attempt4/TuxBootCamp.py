@@ -5,7 +5,7 @@ import random
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 # =====================================================================
@@ -14,33 +14,154 @@ from typing import Dict, List, Any, Optional
 
 
 class ResourceManager:
-    def __init__(self, resources_dir: str = "armory"):
+    """Loads armory strings for a locale, falling back to the base pack.
+
+    The armory root holds the base pack (DEFAULT_LOCALE). Each extra locale
+    lives in ``armory/locales/<tag>/`` and only needs the files and keys it
+    actually translates - anything missing falls back along the chain
+    (es-MX -> es -> en). The chain is resolved once per locale when its
+    index is built, and files are only parsed the first time a category is
+    used.
+    """
+
+    RESOURCE_FILES = {
+        'ui': 'protocol.json',
+        'tux': 'cadence.json',
+        'languages': 'ordnance.json',
+        'challenges': 'operations.json',
+        'templates': 'templates.json',
+        'achievements': 'decorations.json'
+    }
+
+    DEFAULT_LOCALE = "en"
+    LOCALES_DIR = "locales"
+
+    # Shared by every ResourceManager so switching locale mid-session never
+    # re-reads or re-merges a file another locale already loaded.
+    _file_cache: Dict[Path, Any] = {}
+    _merged_cache: Dict[Tuple[Path, ...], Any] = {}
+    _index_cache: Dict[Tuple[Path, str], Dict[str, Tuple[Path, ...]]] = {}
+
+    def __init__(self, resources_dir: str = "armory", locale: str = DEFAULT_LOCALE,
+                 fallback_locale: str = DEFAULT_LOCALE):
         self.resources_dir = Path(resources_dir)
+        self.fallback_locale = self._normalize_locale(fallback_locale)
+        self.locale = None
         self.data: Dict[str, Any] = {}
-        self._load_all_resources()
-    
-    def _load_all_resources(self):
-        """Load all JSON resource files"""
-        resource_files = {
-            'ui': 'protocol.json',
-            'tux': 'cadence.json',
-            'languages': 'ordnance.json',
-            'challenges': 'operations.json',
-            'templates': 'templates.json'
-        }
-        
-        for key, filename in resource_files.items():
-            filepath = self.resources_dir / filename
-            if not filepath.exists():
-                raise FileNotFoundError(f"Required resource file not found: {filepath}")
-            
+        self._index: Dict[str, Tuple[Path, ...]] = {}
+        self.set_locale(locale)
+
+    @staticmethod
+    def _normalize_locale(locale: str) -> str:
+        """Turn 'es_mx' / 'es-MX' style tags into 'es-MX'"""
+        parts = locale.replace('_', '-').split('-')
+        return '-'.join([parts[0].lower()] + [p.upper() for p in parts[1:]])
+
+    def locale_chain(self, locale: str) -> List[str]:
+        """Most specific first: es-MX -> es -> fallback -> default"""
+        parts = self._normalize_locale(locale).split('-')
+        chain = ['-'.join(parts[:i]) for i in range(len(parts), 0, -1)]
+        for tag in (self.fallback_locale, self.DEFAULT_LOCALE):
+            if tag not in chain:
+                chain.append(tag)
+        return chain
+
+    def available_locales(self) -> List[str]:
+        """All locales that have a pack in the armory"""
+        locales_dir = self.resources_dir / self.LOCALES_DIR
+        found = {self.DEFAULT_LOCALE}
+        if locales_dir.is_dir():
+            found.update(d.name for d in locales_dir.iterdir() if d.is_dir())
+        return sorted(found)
+
+    def set_locale(self, locale: str):
+        """Switch locale - cheap once the shared caches are warm"""
+        locale = self._normalize_locale(locale)
+        if locale == self.locale:
+            return
+
+        self._index = self._build_index(locale)
+        self.locale = locale
+        self.data = {}
+
+    def _locale_dir(self, tag: str) -> Path:
+        if tag == self.DEFAULT_LOCALE:
+            return self.resources_dir
+        return self.resources_dir / self.LOCALES_DIR / tag
+
+    def _build_index(self, locale: str) -> Dict[str, Tuple[Path, ...]]:
+        """Resolve, per category, which files make up the fallback chain"""
+        cache_key = (self.resources_dir.resolve(), locale)
+        index = self._index_cache.get(cache_key)
+        if index is not None:
+            return index
+
+        index = {}
+        chain = self.locale_chain(locale)
+        for key, filename in self.RESOURCE_FILES.items():
+            base_file = self.resources_dir / filename
+            if not base_file.exists():
+                raise FileNotFoundError(f"Required resource file not found: {base_file}")
+
+            # Least specific first so later files override earlier ones
+            layers = [base_file]
+            for tag in reversed(chain):
+                if tag == self.DEFAULT_LOCALE:
+                    continue
+                filepath = self._locale_dir(tag) / filename
+                if filepath.exists():
+                    layers.append(filepath)
+            index[key] = tuple(layers)
+
+        self._index_cache[cache_key] = index
+        return index
+
+    def _category(self, category: str) -> Any:
+        """Lazily load (and cache) one category for the current locale"""
+        value = self.data.get(category)
+        if value is not None:
+            return value
+
+        layers = self._index.get(category)
+        if layers is None:
+            return {}
+
+        value = self._merged_cache.get(layers)
+        if value is None:
+            value = self._read_file(layers[0])
+            for filepath in layers[1:]:
+                value = self._merge(value, self._read_file(filepath))
+            self._merged_cache[layers] = value
+
+        self.data[category] = value
+        return value
+
+    def source_files(self, category: str) -> Tuple[Path, ...]:
+        """Files (base pack first) that make up a category for this locale"""
+        return self._index.get(category, ())
+
+    def _read_file(self, filepath: Path) -> Any:
+        value = self._file_cache.get(filepath)
+        if value is None:
             with open(filepath, 'r', encoding='utf-8') as f:
-                self.data[key] = json.load(f)
-    
+                value = json.load(f)
+            self._file_cache[filepath] = value
+        return value
+
+    @classmethod
+    def _merge(cls, base: Any, override: Any) -> Any:
+        """Deep merge dicts; anything else in the override wins outright"""
+        if not isinstance(base, dict) or not isinstance(override, dict):
+            return override
+        merged = dict(base)
+        for k, v in override.items():
+            merged[k] = cls._merge(base[k], v) if k in base else v
+        return merged
+
     def get(self, category: str, key: str, **kwargs) -> str:
         """Get a string with optional formatting"""
         try:
-            value = self.data[category]
+            value = self._category(category)
             for k in key.split('.'):
                 value = value[k]
             
@@ -63,7 +184,7 @@ class ResourceManager:
     def get_all(self, category: str, key: str = None) -> Any:
         """Get entire data structure"""
         if key is None:
-            return self.data.get(category, {})
+            return self._category(category)
         return self.get(category, key)
 
 
@@ -73,9 +194,9 @@ class ResourceManager:
 
 
 class ConfigManager:
-    """Manages application configuration from config.json"""
+    """Manages application configuration from command.json"""
     
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "command.json"):
         self.config_file = Path(config_file)
         
         if not self.config_file.exists():
@@ -347,8 +468,12 @@ class TuxBootCampApp:
         
         # Load resources and config from JSON files
         try:
-            self.resources = ResourceManager()
             self.config = ConfigManager()
+            self.resources = ResourceManager(
+                self.config.get('paths', 'armory', default="armory"),
+                locale=self.config.get('localization', 'locale', default="en"),
+                fallback_locale=self.config.get('localization', 'fallback_locale', default="en")
+            )
         except FileNotFoundError as e:
             messagebox.showerror("Configuration Error", str(e))
             self.root.quit()
@@ -0,0 +1,244 @@
+import json
+import operator
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# =====================================================================
+# ACHIEVEMENTS - Medals declared in armory/decorations.json
+# =====================================================================
+#
+# Each medal is a rule over journal events (see journal.EVENT_TYPES):
+#
+#   "on":       event type the rule listens to
+#   "when":     conditions an event must meet to count at all
+#   "streak":   conditions for `count` events IN A ROW (others reset it)
+#   "distinct": count different values of a field instead of events
+#   "values":   ...and the medal needs every one of these values
+#   "per":      track separately per value of a field ("{language}")
+#
+# Conditions are {field: value}, {field: [values]} or {field: {op: n}}
+# with op one of == != < <= > >=.
+#
+# Rules are compiled once and indexed by event type plus one equality
+# condition, so an event only evaluates the rules it can actually move.
+
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Fields an event doesn't carry but the catalog can fill in
+DERIVED_FIELDS = ("difficulty",)
+
+
+def compile_conditions(conditions: Dict[str, Any]) -> Tuple[Callable[[Dict], bool], Optional[Tuple[str, Any]]]:
+    """Predicate for a conditions dict, plus one (field, value) to index on"""
+    checks = []
+    index_on = None
+    for field, expected in conditions.items():
+        if isinstance(expected, dict):
+            for op, operand in expected.items():
+                if op not in OPERATORS:
+                    raise ValueError(f"Unknown operator {op!r} for {field!r}")
+                checks.append((field, OPERATORS[op], operand))
+        elif isinstance(expected, list):
+            checks.append((field, lambda value, allowed: value in allowed, tuple(expected)))
+        else:
+            checks.append((field, operator.eq, expected))
+            if index_on is None:
+                index_on = (field, expected)
+
+    def predicate(event: Dict[str, Any]) -> bool:
+        for field, test, operand in checks:
+            value = event.get(field)
+            if value is None:
+                return False
+            try:
+                if not test(value, operand):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    return predicate, index_on
+
+
+class Rule:
+    """One compiled medal rule"""
+
+    __slots__ = ("id", "name", "description", "on", "kind", "when", "index_on",
+                 "streak", "count", "distinct", "values", "per", "fields")
+
+    def __init__(self, rule_id: str, spec: Dict[str, Any]):
+        self.id = rule_id
+        self.name = spec.get("name", rule_id)
+        self.description = spec.get("description", "")
+        self.on = spec["on"]
+        self.when, self.index_on = compile_conditions(spec.get("when", {}))
+        self.streak = None
+        self.distinct = spec.get("distinct")
+        self.values = frozenset(spec["values"]) if "values" in spec else None
+        self.per = spec.get("per")
+        self.count = spec.get("count", len(self.values) if self.values else 1)
+
+        if "streak" in spec:
+            self.kind = "streak"
+            self.streak, _ = compile_conditions(spec["streak"])
+        elif self.values is not None:
+            self.kind = "collect"
+        else:
+            self.kind = "count"
+
+        # Every field the rule reads, so derived ones are only filled when needed
+        self.fields = set(spec.get("when", {})) | set(spec.get("streak", {}))
+        self.fields.update(f for f in (self.distinct, self.per) if f)
+
+    def award_id(self, event: Dict[str, Any]) -> Optional[str]:
+        if self.per is None:
+            return self.id
+        group = event.get(self.per)
+        return None if group is None else f"{self.id}:{group}"
+
+
+class AchievementEngine:
+    """Compiled, event-indexed medal rules shared by every recruit"""
+
+    def __init__(self, medals: Dict[str, Dict[str, Any]], catalog=None):
+        self.catalog = catalog
+        self.rules: Dict[str, Rule] = {}
+
+        # event type -> rules with no equality condition to index on
+        self._by_type: Dict[str, List[Rule]] = {}
+        # (event type, field, value) -> rules; event type -> indexed fields
+        self._by_key: Dict[Tuple[str, str, Any], List[Rule]] = {}
+        self._index_fields: Dict[str, List[str]] = {}
+
+        for rule_id, spec in medals.items():
+            rule = Rule(rule_id, spec)
+            self.rules[rule_id] = rule
+            if rule.index_on is None:
+                self._by_type.setdefault(rule.on, []).append(rule)
+            else:
+                field, value = rule.index_on
+                self._by_key.setdefault((rule.on, field, value), []).append(rule)
+                fields = self._index_fields.setdefault(rule.on, [])
+                if field not in fields:
+                    fields.append(field)
+
+    @classmethod
+    def load(cls, armory_dir: str = "armory", catalog=None,
+             filename: str = "decorations.json") -> "AchievementEngine":
+        with open(os.path.join(armory_dir, filename), "r", encoding="utf-8") as f:
+            return cls(json.load(f).get("medals", {}), catalog)
+
+    @classmethod
+    def from_resources(cls, resources, catalog=None) -> "AchievementEngine":
+        """Engine with the medal names/descriptions of the current locale"""
+        return cls(resources.get_all("achievements").get("medals", {}), catalog)
+
+    def rules_for(self, event: Dict[str, Any]) -> List[Rule]:
+        """Only the rules this event can affect"""
+        kind = event["type"]
+        rules = list(self._by_type.get(kind, ()))
+        for field in self._index_fields.get(kind, ()):
+            rules.extend(self._by_key.get((kind, field, event.get(field)), ()))
+        return rules
+
+    def describe(self, award_id: str) -> Tuple[str, str]:
+        """(name, description) for an earned medal, per-group names filled in"""
+        rule_id, _, group = award_id.partition(":")
+        rule = self.rules.get(rule_id)
+        if rule is None:
+            return award_id, ""
+        values = {rule.per: group} if rule.per else {}
+        return rule.name.format(**values), rule.description.format(**values)
+
+    def new_case(self, state: Optional[Dict[str, Any]] = None) -> "MedalCase":
+        return MedalCase(self, state)
+
+    def _derive(self, event: Dict[str, Any], rules: List[Rule]) -> Dict[str, Any]:
+        """Fill in catalog fields (difficulty) if a candidate rule reads them"""
+        if self.catalog is None or "challenge" not in event:
+            return event
+        if not any(f in rule.fields for rule in rules for f in DERIVED_FIELDS):
+            return event
+        challenge = self.catalog.get_challenge(f"{event.get('language')}/{event['challenge']}")
+        if challenge is None:
+            return event
+        return dict(event, difficulty=challenge.difficulty)
+
+
+class MedalCase:
+    """One recruit's earned medals and progress towards the rest"""
+
+    def __init__(self, engine: AchievementEngine, state: Optional[Dict[str, Any]] = None):
+        self.engine = engine
+        state = state or {}
+        self.earned: Dict[str, float] = dict(state.get("earned", {}))
+        # award id -> int counter, or a set of distinct values
+        self.progress: Dict[str, Any] = {}
+        for award_id, value in state.get("progress", {}).items():
+            self.progress[award_id] = set(value) if isinstance(value, list) else value
+        self.unannounced: List[str] = []
+
+    def observe(self, event: Dict[str, Any]) -> List[str]:
+        """Advance the rules this event affects; returns newly earned medals"""
+        rules = self.engine.rules_for(event)
+        if not rules:
+            return []
+        event = self.engine._derive(event, rules)
+
+        new = []
+        for rule in rules:
+            award_id = rule.award_id(event)
+            if award_id is None or award_id in self.earned:
+                continue
+            if not rule.when(event):
+                continue
+            if self._advance(rule, award_id, event):
+                self.earned[award_id] = event.get("ts", time.time())
+                self.progress.pop(award_id, None)
+                new.append(award_id)
+
+        self.unannounced.extend(new)
+        return new
+
+    def _advance(self, rule: Rule, award_id: str, event: Dict[str, Any]) -> bool:
+        if rule.kind == "streak":
+            run = self.progress.get(award_id, 0) + 1 if rule.streak(event) else 0
+            self.progress[award_id] = run
+            return run >= rule.count
+
+        if rule.distinct is None:
+            total = self.progress.get(award_id, 0) + 1
+            self.progress[award_id] = total
+            return total >= rule.count
+
+        value = event.get(rule.distinct)
+        if value is None:
+            return False
+        seen = self.progress.setdefault(award_id, set())
+        seen.add(value)
+        if rule.values is not None:
+            return rule.values <= seen
+        return len(seen) >= rule.count
+
+    def take_unannounced(self) -> List[str]:
+        """Medals earned since the last call (for pop-ups)"""
+        new, self.unannounced = self.unannounced, []
+        return new
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly state for snapshots"""
+        return {
+            "earned": dict(self.earned),
+            "progress": {k: sorted(v) if isinstance(v, set) else v
+                         for k, v in self.progress.items()},
+        }
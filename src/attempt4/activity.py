@@ -0,0 +1,169 @@
+import base64
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# =====================================================================
+# ACTIVITY CALENDAR - Daily streaks and a bitmap of active days
+# =====================================================================
+#
+# One bit per calendar day, starting at the recruit's first active day
+# (a year of history is 46 bytes). Every journal event marks its day and
+# moves the streak counters in O(1); only an event that arrives out of
+# order and bridges a gap walks the bitmap, and only over the streak it
+# joins. Calendars and cohort stats read the bits or the counters and
+# never rescan the journal.
+
+
+class ActivityCalendar:
+    """Active days, current streak and longest streak for one recruit"""
+
+    __slots__ = ("origin", "bits", "last_day", "streak", "longest", "active_days")
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        state = state or {}
+        # date.toordinal() of bit 0, and of the newest active day
+        self.origin: Optional[int] = state.get("origin")
+        self.bits = bytearray(base64.b64decode(state.get("bits", "")))
+        self.last_day: Optional[int] = state.get("last_day")
+        self.streak: int = state.get("streak", 0)
+        self.longest: int = state.get("longest", 0)
+        self.active_days: int = state.get("active_days", 0)
+
+    # -----------------------------------------------------------------
+    # Bitmap
+    # -----------------------------------------------------------------
+
+    def is_active(self, day: int) -> bool:
+        """Was the recruit active on this date ordinal?"""
+        if self.origin is None or day < self.origin:
+            return False
+        offset = day - self.origin
+        byte = offset >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (offset & 7)))
+
+    def _set(self, day: int):
+        if self.origin is None:
+            self.origin = day
+        elif day < self.origin:
+            # Rare: an event older than anything seen - shift by whole bytes
+            shift = (self.origin - day + 7) // 8
+            self.bits[:0] = bytes(shift)
+            self.origin -= shift * 8
+        offset = day - self.origin
+        byte = offset >> 3
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(byte - len(self.bits) + 1))
+        self.bits[byte] |= 1 << (offset & 7)
+
+    def _run_length(self, day: int, step: int) -> int:
+        """Consecutive active days starting next to `day` in one direction"""
+        length = 0
+        day += step
+        while self.is_active(day):
+            length += 1
+            day += step
+        return length
+
+    # -----------------------------------------------------------------
+    # Updating
+    # -----------------------------------------------------------------
+
+    def record(self, ts: float):
+        """Mark the day of an event timestamp as active"""
+        day = date.fromtimestamp(ts).toordinal()
+        if self.last_day is not None and day == self.last_day:
+            return  # the common case: another event today
+        if self.is_active(day):
+            return
+
+        self._set(day)
+        self.active_days += 1
+
+        if self.last_day is None or day > self.last_day:
+            self.streak = self.streak + 1 if day == (self.last_day or 0) + 1 else 1
+            self.last_day = day
+            self.longest = max(self.longest, self.streak)
+            return
+
+        # Out of order: the day may join two runs together
+        run = self._run_length(day, -1) + 1 + self._run_length(day, 1)
+        self.longest = max(self.longest, run)
+        if day + self._run_length(day, 1) == self.last_day:
+            self.streak = run
+
+    # -----------------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------------
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """Streak as of today: still alive if the last active day was yesterday"""
+        if self.last_day is None:
+            return 0
+        today_ordinal = (today or date.today()).toordinal()
+        return self.streak if today_ordinal - self.last_day <= 1 else 0
+
+    def active_between(self, first: date, last: date) -> int:
+        """Number of active days in [first, last]"""
+        if self.origin is None:
+            return 0
+        start = max(first.toordinal(), self.origin) - self.origin
+        end = min(last.toordinal() - self.origin, len(self.bits) * 8 - 1)
+        if end < start:
+            return 0
+        window = int.from_bytes(self.bits[start >> 3:(end >> 3) + 1], "little")
+        window >>= start & 7
+        return bin(window & ((1 << (end - start + 1)) - 1)).count("1")
+
+    def year_grid(self, today: Optional[date] = None, weeks: int = 53) -> List[List[bool]]:
+        """7 rows (Mon..Sun) x `weeks` columns ending with this week"""
+        today = today or date.today()
+        last_monday = today - timedelta(days=today.weekday())
+        first = (last_monday - timedelta(weeks=weeks - 1)).toordinal()
+        return [[self.is_active(first + week * 7 + weekday) for week in range(weeks)]
+                for weekday in range(7)]
+
+    def render(self, today: Optional[date] = None, weeks: int = 53,
+               active: str = "#", idle: str = ".") -> str:
+        """Plain-text heatmap, one line per weekday"""
+        labels = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+        grid = self.year_grid(today, weeks)
+        return "\n".join(f"{label} " + "".join(active if on else idle for on in row)
+                         for label, row in zip(labels, grid))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly state for snapshots"""
+        return {
+            "origin": self.origin,
+            "bits": base64.b64encode(bytes(self.bits)).decode("ascii"),
+            "last_day": self.last_day,
+            "streak": self.streak,
+            "longest": self.longest,
+            "active_days": self.active_days,
+        }
+
+
+def cohort_streak_stats(calendars: Iterable[ActivityCalendar],
+                        today: Optional[date] = None) -> Dict[str, Any]:
+    """Streak summary for a cohort from each calendar's counters alone"""
+    today = today or date.today()
+    today_ordinal = today.toordinal()
+    recruits = active_today = on_streak = 0
+    streak_total = longest = 0
+    for calendar in calendars:
+        recruits += 1
+        streak = calendar.current_streak(today)
+        if calendar.last_day == today_ordinal:
+            active_today += 1
+        if streak:
+            on_streak += 1
+            streak_total += streak
+        longest = max(longest, calendar.longest)
+    return {
+        "recruits": recruits,
+        "active_today": active_today,
+        "on_streak": on_streak,
+        "average_streak": round(streak_total / on_streak, 2) if on_streak else 0.0,
+        "longest_streak": longest,
+    }
+
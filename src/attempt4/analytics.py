@@ -0,0 +1,342 @@
+import argparse
+import csv
+import html
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# =====================================================================
+# COHORT ANALYTICS - Instructor reports over the stored grade history
+# =====================================================================
+#
+# Streams the submissions table in fixed-size chunks, so memory stays
+# flat whether the cohort has 1k or 1M grades. SQLite hands back plain
+# integers (challenge rowid, emotion index) and every chunk is folded
+# into per-group totals:
+#
+#   per challenge: submissions, pass rate, average quality/completeness,
+#                  emotion distribution
+#   per language:  time from first attempt to first correct submission
+#
+# With NumPy installed a chunk is a handful of np.bincount calls;
+# without it the same totals are summed in plain Python.
+
+
+EMOTIONS = ("exceptional", "proud", "satisfied", "encouraging",
+            "stern", "disappointed", "confused", "neutral")
+
+# Time-to-first-correct is kept as a histogram (upper bounds in minutes),
+# which is what keeps it constant-memory; the last bucket is open-ended
+TTFC_BUCKETS = (1, 5, 15, 30, 60, 120, 240, 480, 1440, 4320, 10080)
+
+CHALLENGE_COLUMNS = ("language", "challenge", "submissions", "pass_rate",
+                     "avg_quality", "avg_completeness") + EMOTIONS
+LANGUAGE_COLUMNS = ("language", "attempted", "solved", "solve_rate",
+                    "avg_minutes_to_correct", "median_minutes_to_correct")
+
+
+def _numpy():
+    """NumPy if it is installed, else None (plain Python fallback)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _emotion_case(column: str) -> str:
+    """SQL expression mapping an emotion name to its EMOTIONS index"""
+    whens = " ".join(f"WHEN '{name}' THEN {i}" for i, name in enumerate(EMOTIONS))
+    return f"CASE {column} {whens} ELSE {EMOTIONS.index('neutral')} END"
+
+
+class _Totals:
+    """Per-group running sums, grown as new groups show up"""
+
+    def __init__(self, np, groups: int, width: int):
+        self.np = np
+        self.width = width
+        if np is not None:
+            self.sums = np.zeros((groups, width))
+        else:
+            self.sums = [[0.0] * width for _ in range(groups)]
+
+    def add_chunk(self, group_ids, columns: Sequence):
+        """Add column values (one sequence per column) into their groups"""
+        np = self.np
+        if np is not None:
+            groups = self.sums.shape[0]
+            for i, values in enumerate(columns):
+                self.sums[:, i] += np.bincount(group_ids, weights=values, minlength=groups)
+            return
+        for row, *values in zip(group_ids, *columns):
+            target = self.sums[row]
+            for i, value in enumerate(values):
+                target[i] += value
+
+    def add_counts(self, group_ids, categories, offset: int, categories_count: int):
+        """Count (group, category) pairs into columns offset.."""
+        np = self.np
+        if np is not None:
+            groups = self.sums.shape[0]
+            flat = np.bincount(group_ids * categories_count + categories,
+                               minlength=groups * categories_count)
+            self.sums[:, offset:offset + categories_count] += flat.reshape(groups, categories_count)
+            return
+        for row, category in zip(group_ids, categories):
+            self.sums[row][offset + category] += 1
+
+    def row(self, group: int) -> List[float]:
+        return [float(v) for v in self.sums[group]]
+
+
+class CohortReport:
+    """Finished per-challenge and per-language tables"""
+
+    def __init__(self, challenges: List[Dict[str, Any]], languages: List[Dict[str, Any]],
+                 submissions: int, elapsed: float, backend: str):
+        self.challenges = challenges
+        self.languages = languages
+        self.submissions = submissions
+        self.elapsed = elapsed
+        self.backend = backend
+
+    # -----------------------------------------------------------------
+    # Output
+    # -----------------------------------------------------------------
+
+    def write(self, path: str):
+        """Write .html (one page) or .csv (plus <name>_languages.csv)"""
+        if path.lower().endswith((".html", ".htm")):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.to_html())
+            return
+        stem, ext = os.path.splitext(path)
+        self._write_csv(path, CHALLENGE_COLUMNS, self.challenges)
+        self._write_csv(f"{stem}_languages{ext or '.csv'}", LANGUAGE_COLUMNS, self.languages)
+
+    @staticmethod
+    def _write_csv(path: str, columns: Sequence[str], rows: List[Dict[str, Any]]):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def to_html(self) -> str:
+        def table(columns, rows):
+            head = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+            body = "".join(
+                "<tr>" + "".join(f"<td>{html.escape(str(row[c]))}</td>" for c in columns) + "</tr>"
+                for row in rows
+            )
+            return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            "<title>Tux Boot Camp - Cohort Report</title><style>"
+            "body{background:#1a1a1a;color:#fff;font-family:Arial}"
+            "h1,h2{color:#ff6b6b}table{border-collapse:collapse;margin-bottom:2em}"
+            "th,td{border:1px solid #3b3b3b;padding:4px 8px;text-align:right}"
+            "th{background:#2b2b2b;color:#ffd93d}td:first-child,td:nth-child(2){text-align:left}"
+            "</style></head><body>"
+            "<h1>COHORT REPORT</h1>"
+            f"<p>{self.submissions} graded submissions, generated"
+            f" {time.strftime('%Y-%m-%d %H:%M')} in {self.elapsed:.2f}s ({self.backend})</p>"
+            "<h2>Challenges</h2>" + table(CHALLENGE_COLUMNS, self.challenges)
+            + "<h2>Time to first correct, per language</h2>"
+            + table(LANGUAGE_COLUMNS, self.languages)
+            + "</body></html>"
+        )
+
+
+# =====================================================================
+# REPORT BUILDER
+# =====================================================================
+
+
+def build_report(db_path: str, chunk_size: int = 20000,
+                 use_numpy: Optional[bool] = None) -> CohortReport:
+    """Stream the grade history once and aggregate it per group"""
+    np = _numpy() if use_numpy is not False else None
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy was requested but is not installed")
+
+    started = time.perf_counter()
+    conn = sqlite3.connect(os.path.expanduser(db_path))
+    try:
+        # challenge rowids are the group ids; they are small and dense
+        challenges = conn.execute(
+            "SELECT rowid, language, name FROM challenges ORDER BY language, name"
+        ).fetchall()
+        group_count = max((row[0] for row in challenges), default=0) + 1
+        language_names = sorted({row[1] for row in challenges})
+        language_ids = {name: i for i, name in enumerate(language_names)}
+        language_of = [0] * group_count
+        for rowid, language, _ in challenges:
+            language_of[rowid] = language_ids[language]
+
+        submissions = _aggregate_challenges(conn, np, group_count, chunk_size)
+        solve_totals, histogram = _aggregate_first_correct(
+            conn, np, group_count, language_of, len(language_names), chunk_size
+        )
+    finally:
+        conn.close()
+
+    challenge_rows = []
+    for rowid, language, name in challenges:
+        count, correct, quality, completeness, *emotions = submissions.row(rowid)
+        if not count:
+            continue
+        row = {
+            "language": language,
+            "challenge": name,
+            "submissions": int(count),
+            "pass_rate": round(correct / count, 4),
+            "avg_quality": round(quality / count, 2),
+            "avg_completeness": round(completeness / count, 2),
+        }
+        row.update({emotion: int(n) for emotion, n in zip(EMOTIONS, emotions)})
+        challenge_rows.append(row)
+
+    language_rows = []
+    for i, language in enumerate(language_names):
+        attempted, solved, minutes = solve_totals.row(i)
+        if not attempted:
+            continue
+        language_rows.append({
+            "language": language,
+            "attempted": int(attempted),
+            "solved": int(solved),
+            "solve_rate": round(solved / attempted, 4),
+            "avg_minutes_to_correct": round(minutes / solved, 1) if solved else "",
+            "median_minutes_to_correct": _histogram_median(histogram.row(i)),
+        })
+
+    total = sum(row["submissions"] for row in challenge_rows)
+    return CohortReport(challenge_rows, language_rows, total,
+                        time.perf_counter() - started, "numpy" if np else "python")
+
+
+def _aggregate_challenges(conn, np, group_count: int, chunk_size: int) -> _Totals:
+    """count, correct, quality, completeness + one column per emotion"""
+    totals = _Totals(np, group_count, 4 + len(EMOTIONS))
+    rows = conn.execute(
+        "SELECT c.rowid, s.correct, s.quality_score, s.completeness, "
+        + _emotion_case("s.emotion")
+        + " FROM submissions s JOIN challenges c ON c.key = s.challenge_key"
+    )
+    while True:
+        chunk = rows.fetchmany(chunk_size)
+        if not chunk:
+            return totals
+        if np is not None:
+            data = np.array(chunk, dtype=np.int64)
+            groups = data[:, 0]
+            totals.add_chunk(groups, (np.ones(len(data)), data[:, 1], data[:, 2], data[:, 3]))
+            totals.add_counts(groups, data[:, 4], 4, len(EMOTIONS))
+        else:
+            groups, correct, quality, completeness, emotions = zip(*chunk)
+            totals.add_chunk(groups, ((1,) * len(chunk), correct, quality, completeness))
+            totals.add_counts(groups, emotions, 4, len(EMOTIONS))
+
+
+def _aggregate_first_correct(conn, np, group_count: int, language_of: List[int],
+                             language_count: int, chunk_size: int):
+    """Per language: (attempted, solved, minutes) sums and a minutes histogram"""
+    solve_totals = _Totals(np, language_count, 3)
+    histogram = _Totals(np, language_count, len(TTFC_BUCKETS) + 1)
+
+    # SQLite does the per (recruit, challenge) grouping; we only see one
+    # row per pair with its first attempt and first correct time (-1: never)
+    rows = conn.execute(
+        "SELECT c.rowid, MIN(s.submitted_at),"
+        " COALESCE(MIN(CASE WHEN s.correct THEN s.submitted_at END), -1)"
+        " FROM submissions s JOIN challenges c ON c.key = s.challenge_key"
+        " GROUP BY s.recruit_id, s.challenge_key"
+    )
+    if np is not None:
+        lookup = np.array(language_of, dtype=np.int64)
+        bounds = np.array(TTFC_BUCKETS, dtype=float)
+
+    while True:
+        chunk = rows.fetchmany(chunk_size)
+        if not chunk:
+            return solve_totals, histogram
+        if np is not None:
+            data = np.array(chunk, dtype=float)
+            languages = lookup[data[:, 0].astype(np.int64)]
+            solved = data[:, 2] >= 0
+            minutes = np.where(solved, (data[:, 2] - data[:, 1]) / 60.0, 0.0)
+            solve_totals.add_chunk(languages, (np.ones(len(data)), solved, minutes))
+            buckets = np.searchsorted(bounds, minutes[solved], side="left")
+            histogram.add_counts(languages[solved], buckets, 0, len(TTFC_BUCKETS) + 1)
+        else:
+            languages, solved, minutes, solved_languages, buckets = [], [], [], [], []
+            for rowid, first, first_correct in chunk:
+                language = language_of[rowid]
+                languages.append(language)
+                if first_correct >= 0:
+                    elapsed = (first_correct - first) / 60.0
+                    solved.append(1)
+                    minutes.append(elapsed)
+                    solved_languages.append(language)
+                    buckets.append(_bucket(elapsed))
+                else:
+                    solved.append(0)
+                    minutes.append(0.0)
+            solve_totals.add_chunk(languages, ((1,) * len(chunk), solved, minutes))
+            histogram.add_counts(solved_languages, buckets, 0, len(TTFC_BUCKETS) + 1)
+
+
+def _bucket(minutes: float) -> int:
+    for i, bound in enumerate(TTFC_BUCKETS):
+        if minutes <= bound:
+            return i
+    return len(TTFC_BUCKETS)
+
+
+def _histogram_median(counts: List[float]) -> str:
+    """Median as the bucket it falls in, e.g. '<= 60' or '> 10080'"""
+    total = sum(counts)
+    if not total:
+        return ""
+    seen = 0.0
+    for i, count in enumerate(counts):
+        seen += count
+        if seen >= total / 2:
+            return f"<= {TTFC_BUCKETS[i]}" if i < len(TTFC_BUCKETS) else f"> {TTFC_BUCKETS[-1]}"
+    return ""
+
+
+# =====================================================================
+# COMMAND LINE - python analytics.py --out cohort.html
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp cohort report")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--out", default="cohort_report.html",
+                        help="report file, .html or .csv")
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    parser.add_argument("--no-numpy", action="store_true",
+                        help="use the plain Python aggregation")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    db_path = args.db or config["paths"]["progress_db"]
+
+    report = build_report(db_path, args.chunk_size, use_numpy=False if args.no_numpy else None)
+    report.write(args.out)
+    print(f"{report.submissions} submissions -> {args.out}"
+          f" in {report.elapsed:.2f}s ({report.backend})")
+
+
+if __name__ == "__main__":
+    main()
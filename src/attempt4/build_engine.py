@@ -0,0 +1,443 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from runner import DEFAULT_LIMITS, RunLimits, RunResult, run_argv
+
+
+# =====================================================================
+# BUILD ENGINE - Compile and run submissions for real
+# =====================================================================
+#
+# A registry of toolchains (TOOLCHAINS) says how to build and run each
+# language. Which compiler is actually used - and its version - is found
+# at runtime, the first time a language is asked for.
+#
+#   build(language, code)   compile in a temp sandbox (interpreted
+#                           languages skip this step)
+#   run(build, stdin)       run the program in another temp sandbox
+#
+# Both steps go through runner.run_argv, so they get the same rlimits,
+# wall-clock timeouts and output caps as the playground (compiles use
+# the roomier "build" limits from command.json).
+#
+# Compile results are cached in paths.build_cache, keyed by
+# sha256(toolchain version + compile command + source). Resubmitting
+# unchanged code - even code that does not compile - skips the
+# compiler. Only verdicts the compiler reached on its own are cached: a
+# compile killed by a limit (or that never started) is retried next
+# time. The cache is pruned oldest-first to build.cache_max_mb.
+
+
+DEFAULT_BUILD_LIMITS = {
+    "cpu_seconds": 60,
+    "wall_seconds": 120,
+    "memory_mb": 0,       # compilers (rustc, go) map far more than they use
+    "file_mb": 256,
+    "output_kb": 256,
+}
+
+# Version-manager shims (pyenv, rbenv, rustup) find the real toolchain
+# through these - the rest of the environment stays behind
+PASSTHROUGH_ENV = ("HOME", "USERPROFILE", "SYSTEMROOT", "PYENV_ROOT", "PYENV_VERSION",
+                   "RBENV_ROOT", "RBENV_VERSION", "RUSTUP_HOME", "RUSTUP_TOOLCHAIN",
+                   "CARGO_HOME", "GOROOT")
+
+DEFAULT_CACHE = "~/.tux_boot_camp/build_cache"
+DEFAULT_CACHE_MAX_MB = 200
+
+
+class Toolchain:
+    """How to build and run one language"""
+
+    __slots__ = ("language", "executables", "source", "compile", "run",
+                 "version_args", "memory_mb", "env")
+
+    def __init__(self, language: str, executables: Sequence[str], source: str,
+                 compile: Optional[Sequence[str]], run: Sequence[str],
+                 version_args: Sequence[str] = ("--version",),
+                 memory_mb: Optional[int] = None, env: Optional[Dict[str, str]] = None):
+        self.language = language
+        self.executables = tuple(executables)  # first one found on PATH wins
+        self.source = source                   # file name the code is saved as
+        self.compile = tuple(compile) if compile else None  # {exe} {src} {out}
+        self.run = tuple(run)                               # {exe} {src} {out}
+        self.version_args = tuple(version_args)
+        self.memory_mb = memory_mb             # overrides the run limit (0 = none)
+        self.env = env or {}                   # {cache} = the build cache dir
+
+
+TOOLCHAINS = {t.language: t for t in (
+    Toolchain("C", ("gcc", "cc", "clang"), "main.c",
+              ("{exe}", "-std=c11", "-O1", "-Wall", "-o", "{out}", "{src}", "-lm"), ("{out}",)),
+    Toolchain("C++", ("g++", "clang++"), "main.cpp",
+              ("{exe}", "-std=c++17", "-O1", "-Wall", "-o", "{out}", "{src}"), ("{out}",)),
+    Toolchain("Rust", ("rustc",), "main.rs",
+              ("{exe}", "--edition", "2021", "-O", "-o", "{out}", "{src}"), ("{out}",)),
+    Toolchain("Go", ("go",), "main.go",
+              ("{exe}", "build", "-o", "{out}", "{src}"), ("{out}",),
+              version_args=("version",), memory_mb=0,
+              env={"GOCACHE": "{cache}/go-build", "GOPATH": "{cache}/gopath",
+                   "GO111MODULE": "off", "CGO_ENABLED": "0"}),
+    Toolchain("Haskell", ("ghc",), "Main.hs",
+              ("{exe}", "-O0", "-o", "{out}", "{src}"), ("{out}",), memory_mb=0),
+    Toolchain("Python", ("python3", "python"), "main.py", None, ("{exe}", "-I", "{src}")),
+    Toolchain("JavaScript", ("node",), "main.js", None, ("{exe}", "{src}"), memory_mb=0),
+    Toolchain("Ruby", ("ruby",), "main.rb", None, ("{exe}", "{src}")),
+    Toolchain("Perl", ("perl",), "main.pl", None, ("{exe}", "{src}")),
+    Toolchain("Bash", ("bash",), "main.sh", None, ("{exe}", "{src}")),
+    Toolchain("Lua", ("lua", "luajit"), "main.lua", None, ("{exe}", "{src}"),
+              version_args=("-v",)),
+    Toolchain("PHP", ("php",), "main.php", None, ("{exe}", "{src}")),
+)}
+
+
+class Build:
+    """One submission's compile step (and, once run, its run)"""
+
+    __slots__ = ("language", "toolchain", "ok", "cached", "output", "compile_ms",
+                 "artifact", "code", "run")
+
+    def __init__(self, language: str, toolchain: str, ok: bool, cached: bool = False,
+                 output: str = "", compile_ms: float = 0.0, artifact: Optional[str] = None,
+                 code: Optional[str] = None):
+        self.language = language
+        self.toolchain = toolchain      # "gcc (Debian 12.2.0-14) 12.2.0"
+        self.ok = ok                    # compiled (always True when interpreted)
+        self.cached = cached
+        self.output = output            # compiler diagnostics
+        self.compile_ms = compile_ms
+        self.artifact = artifact        # cached executable, None if interpreted
+        self.code = code                # source, for interpreted languages
+        self.run: Optional[RunResult] = None
+
+    @property
+    def compiled(self) -> bool:
+        return self.artifact is not None
+
+    @property
+    def passed(self) -> bool:
+        """Built, and (if run) ran cleanly"""
+        return self.ok and (self.run is None or self.run.ok)
+
+    def report(self) -> str:
+        """Plain-text summary for the grader prompt and the verdict window"""
+        lines = [f"Toolchain: {self.toolchain}"]
+        if self.compiled or not self.ok:
+            state = "compiled" if self.ok else "FAILED TO COMPILE"
+            cached = " (cached)" if self.cached else f" in {self.compile_ms:.0f}ms"
+            lines.append(f"Build: {state}{cached}")
+        if self.output.strip():
+            lines.append("Compiler output:\n" + _tail(self.output))
+        if self.run is not None:
+            lines.append(f"Run: {self.run.describe()} in {self.run.duration_ms:.0f}ms")
+            if self.run.stdout.strip():
+                lines.append("Program output:\n" + _tail(self.run.stdout))
+            if self.run.stderr.strip():
+                lines.append("Program errors:\n" + _tail(self.run.stderr))
+        return "\n".join(lines)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-friendly, stored with the graded submission"""
+        run = self.run
+        return {
+            "toolchain": self.toolchain,
+            "compiled": self.ok,
+            "cached": self.cached,
+            "compile_output": _tail(self.output),
+            "compile_ms": round(self.compile_ms, 1),
+            "exit_code": run.returncode if run else None,
+            "killed": run.killed if run else None,
+            "run_ms": round(run.duration_ms, 1) if run else None,
+            "passed": self.passed,
+        }
+
+
+def _tail(text: str, limit: int = 2000) -> str:
+    text = text.strip()
+    return text if len(text) <= limit else "..." + text[-limit:]
+
+
+class BuildEngine:
+    """Toolchain detection, sandboxed compile + run, compile cache"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE, run_limits: Optional[RunLimits] = None,
+                 build_limits: Optional[RunLimits] = None,
+                 cache_max_mb: float = DEFAULT_CACHE_MAX_MB,
+                 toolchains: Optional[Dict[str, Toolchain]] = None):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.run_limits = run_limits or RunLimits()
+        self.build_limits = build_limits or RunLimits(**DEFAULT_BUILD_LIMITS)
+        self.cache_max_mb = cache_max_mb
+        self.toolchains = TOOLCHAINS if toolchains is None else toolchains
+        self._found: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "BuildEngine":
+        build_limits = RunLimits(**{key: config.get("build", key, default=value)
+                                    for key, value in DEFAULT_BUILD_LIMITS.items()})
+        return cls(
+            config.get("paths", "build_cache", default=DEFAULT_CACHE),
+            RunLimits.from_config(config),
+            build_limits,
+            config.get("build", "cache_max_mb", default=DEFAULT_CACHE_MAX_MB),
+        )
+
+    # -----------------------------------------------------------------
+    # Toolchains
+    # -----------------------------------------------------------------
+
+    def toolchain(self, language: str) -> Optional[Tuple[str, str]]:
+        """(executable, version) for a language, or None - detected once"""
+        with self._lock:
+            if language in self._found:
+                return self._found[language]
+        spec = self.toolchains.get(language)
+        found = None
+        if spec:
+            for name in spec.executables:
+                exe = shutil.which(name)
+                if exe:
+                    version = _version(exe, spec.version_args) or ""
+                    if name not in version.lower():
+                        version = f"{name} {version}".strip()  # node says only "v20.1"
+                    found = (exe, version)
+                    break
+        with self._lock:
+            self._found[language] = found
+        return found
+
+    def supports(self, language: str) -> bool:
+        return self.toolchain(language) is not None
+
+    def detect(self) -> Dict[str, Optional[Tuple[str, str]]]:
+        return {language: self.toolchain(language) for language in self.toolchains}
+
+    def _env(self, spec: Toolchain, workdir: str) -> Dict[str, str]:
+        env = {key: os.environ[key] for key in PASSTHROUGH_ENV if key in os.environ}
+        env.update({"PATH": os.environ.get("PATH", os.defpath), "TMPDIR": workdir,
+                    "LANG": "C.UTF-8"})
+        env.update({key: value.format(cache=self.cache_dir) for key, value in spec.env.items()})
+        return env
+
+    # -----------------------------------------------------------------
+    # Compiling
+    # -----------------------------------------------------------------
+
+    def _key(self, spec: Toolchain, version: str, code: str) -> str:
+        digest = hashlib.sha256(json.dumps([spec.language, version, spec.compile]).encode())
+        digest.update(b"\0")
+        digest.update(code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_paths(self, key: str) -> Tuple[str, str]:
+        folder = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(folder, key + ".json"), os.path.join(folder, key + ".bin")
+
+    def build(self, language: str, code: str) -> Build:
+        found = self.toolchain(language)
+        if found is None:
+            raise LookupError(f"no toolchain installed for {language}")
+        exe, version = found
+        spec = self.toolchains[language]
+        if spec.compile is None:
+            return Build(language, version, True, code=code)
+
+        key = self._key(spec, version, code)
+        meta_path, artifact = self._cache_paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not meta["ok"] or os.path.exists(artifact):
+                os.utime(meta_path)  # recently used: prune it last
+                return Build(language, version, meta["ok"], True, meta["output"],
+                             meta["compile_ms"], artifact if meta["ok"] else None)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        workdir = tempfile.mkdtemp(prefix="tux_build_")
+        try:
+            src = os.path.join(workdir, spec.source)
+            out = os.path.join(workdir, "program.exe" if os.name == "nt" else "program")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write(code)
+            argv = [part.format(exe=exe, src=src, out=out) for part in spec.compile]
+            result = run_argv(argv, self.build_limits, cwd=workdir, env=self._env(spec, workdir))
+            ok = result.ok and os.path.exists(out)
+            output = (result.stdout + result.stderr).replace(workdir + os.sep, "")
+            if result.killed:
+                output += f"\n[compiler {result.describe()}]"
+            # A timeout on a busy machine says nothing about the code
+            if result.killed is None and result.returncode is not None:
+                os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+                if ok:
+                    _replace_into(out, artifact)
+                _write_atomic(meta_path, json.dumps({"ok": ok, "output": output,
+                                                     "compile_ms": result.duration_ms}))
+            return Build(language, version, ok, False, output, result.duration_ms,
+                         artifact if ok else None)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    # -----------------------------------------------------------------
+    # Running
+    # -----------------------------------------------------------------
+
+    def run(self, build: Build, stdin: bytes = b"",
+            limits: Optional[RunLimits] = None,
+            files: Optional[Dict[str, str]] = None) -> RunResult:
+        """Run a successful build in a fresh sandbox (blocking)"""
+        if not build.ok:
+            raise ValueError("cannot run a build that failed to compile")
+        exe, _ = self.toolchain(build.language)
+        spec = self.toolchains[build.language]
+        limits = limits or self.run_limits
+        if spec.memory_mb is not None:
+            limits = limits.replace(memory_mb=spec.memory_mb)
+
+        workdir = tempfile.mkdtemp(prefix="tux_run_")
+        try:
+            src = os.path.join(workdir, spec.source)
+            if build.code is not None:
+                with open(src, "w", encoding="utf-8") as f:
+                    f.write(build.code)
+            for name, content in (files or {}).items():
+                path = os.path.abspath(os.path.join(workdir, name))
+                if os.path.commonpath([workdir, path]) != workdir:
+                    raise ValueError(f"fixture outside the sandbox: {name}")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+            argv = [part.format(exe=exe, src=src, out=build.artifact or "")
+                    for part in spec.run]
+            return run_argv(argv, limits, stdin, cwd=workdir, env=self._env(spec, workdir))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def build_and_run(self, language: str, code: str, stdin: bytes = b"") -> Build:
+        build = self.build(language, code)
+        if build.ok:
+            build.run = self.run(build, stdin)
+        return build
+
+    # -----------------------------------------------------------------
+    # Cache upkeep
+    # -----------------------------------------------------------------
+
+    def prune(self, max_mb: Optional[float] = None) -> int:
+        """Drop least recently used cache entries over the size cap"""
+        budget = (self.cache_max_mb if max_mb is None else max_mb) * 1024 * 1024
+        entries = []
+        for folder in os.scandir(self.cache_dir):
+            if not (folder.is_dir() and len(folder.name) == 2):
+                continue  # go-build, gopath, ...
+            for entry in os.scandir(folder.path):
+                if entry.name.endswith(".json"):
+                    meta = entry.path
+                    artifact = meta[:-5] + ".bin"
+                    size = entry.stat().st_size
+                    if os.path.exists(artifact):
+                        size += os.path.getsize(artifact)
+                    entries.append((entry.stat().st_mtime, size, meta, artifact))
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+        for _, size, meta, artifact in sorted(entries):
+            if total <= budget:
+                break
+            for path in (meta, artifact):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            removed += 1
+        return removed
+
+
+def _version(exe: str, args: Sequence[str]) -> Optional[str]:
+    try:
+        result = subprocess.run([exe, *args], capture_output=True, text=True, timeout=15,
+                                stdin=subprocess.DEVNULL)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    for line in (result.stdout + result.stderr).splitlines():
+        if line.strip():
+            return line.strip()
+    return None
+
+
+def _write_atomic(path: str, text: str):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _replace_into(src: str, dest: str):
+    """Copy the artifact into the cache atomically (keeping its mode)"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".tmp")
+    os.close(fd)
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dest)
+
+
+# =====================================================================
+# COMMAND LINE - python build_engine.py [--detect] [--prune] [FILE ...]
+# =====================================================================
+
+
+EXTENSIONS = {os.path.splitext(t.source)[1].lower(): t.language for t in TOOLCHAINS.values()}
+EXTENSIONS.update({".cc": "C++", ".cxx": "C++"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp build-and-run engine")
+    parser.add_argument("files", nargs="*", help="source files to build and run")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--detect", action="store_true", help="list installed toolchains")
+    parser.add_argument("--prune", action="store_true", help="trim the compile cache")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    build = config.get("build", {})
+    engine = BuildEngine(
+        config.get("paths", {}).get("build_cache", DEFAULT_CACHE),
+        RunLimits(**{k: v for k, v in config.get("runner", {}).items() if k in DEFAULT_LIMITS}),
+        RunLimits(**dict(DEFAULT_BUILD_LIMITS,
+                         **{k: v for k, v in build.items() if k in DEFAULT_BUILD_LIMITS})),
+        build.get("cache_max_mb", DEFAULT_CACHE_MAX_MB),
+    )
+
+    if args.detect:
+        for language, found in engine.detect().items():
+            print(f"  {language:<11} {found[1] if found else '-- not installed --'}")
+    if args.prune:
+        print(f"pruned {engine.prune()} cache entries")
+
+    failed = 0
+    for path in args.files:
+        language = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        print(f"\n=== {path} ({language or 'unknown language'})")
+        if not language or not engine.supports(language):
+            print("  no toolchain - skipped")
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            result = engine.build_and_run(language, f.read())
+        print(result.report())
+        failed += not result.passed
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import argparse
+import json
+import math
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# =====================================================================
+# CALIBRATION - Fit real difficulties from every graded attempt
+# =====================================================================
+#
+# Offline batch job. Fits a Rasch (1-parameter IRT) model over all
+# submissions:
+#
+#   P(recruit r gets challenge c correct) = sigmoid(ability[r] - rating[c])
+#
+# with a Newton step for all abilities, then one for all ratings, per
+# iteration (small Gaussian priors keep recruits/challenges with little
+# data near 0). With NumPy every step is a few vectorized passes over the
+# attempts; without it the same math runs in plain Python (fine for a
+# classroom, slow for millions of attempts).
+#
+# Each challenge with enough attempts is then relabelled with the hand
+# label ("Easy", "Medium", ...) whose average rating it is closest to,
+# and the result goes to a sidecar index (paths.calibration) that the
+# ChallengeSelector and the UI read. operations.json is never modified.
+
+
+INDEX_VERSION = 1
+
+ABILITY_PRIOR = 1.0   # precision of the N(0, 1) prior on abilities
+RATING_PRIOR = 0.1    # weaker prior on challenge ratings
+
+
+def _numpy():
+    """NumPy if it is installed, else None (plain Python fallback)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# =====================================================================
+# LOADING
+# =====================================================================
+
+
+def load_attempts(db_path: str, np=None, chunk_size: int = 200000):
+    """(recruit idx, challenge idx, correct) arrays plus the two id lists"""
+    conn = sqlite3.connect(os.path.expanduser(db_path))
+    try:
+        names = dict(conn.execute("SELECT id, name FROM recruits"))
+        rows = conn.execute(
+            "SELECT s.recruit_id, s.challenge_key, s.correct FROM submissions s"
+        )
+        recruit_ids: Dict[int, int] = {}
+        challenge_ids: Dict[str, int] = {}
+        if np is not None:
+            parts = []
+            while True:
+                chunk = rows.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                parts.append(np.array(
+                    [(recruit_ids.setdefault(r, len(recruit_ids)),
+                      challenge_ids.setdefault(k, len(challenge_ids)), c)
+                     for r, k, c in chunk],
+                    dtype=np.int64,
+                ))
+            data = np.concatenate(parts) if parts else np.zeros((0, 3), dtype=np.int64)
+            recruits, challenges, correct = data[:, 0], data[:, 1], data[:, 2].astype(float)
+        else:
+            recruits, challenges, correct = [], [], []
+            for r, k, c in rows:
+                recruits.append(recruit_ids.setdefault(r, len(recruit_ids)))
+                challenges.append(challenge_ids.setdefault(k, len(challenge_ids)))
+                correct.append(float(c))
+    finally:
+        conn.close()
+
+    recruit_names = [names.get(r, str(r)) for r in recruit_ids]
+    return recruits, challenges, correct, recruit_names, list(challenge_ids)
+
+
+# =====================================================================
+# FITTING
+# =====================================================================
+
+
+def fit_rasch(recruits, challenges, correct, recruit_count: int, challenge_count: int,
+              np=None, iterations: int = 50, tolerance: float = 1e-4):
+    """Abilities and ratings (logits); returns (ability, rating, iterations run)"""
+    if np is not None:
+        return _fit_numpy(np, recruits, challenges, correct, recruit_count,
+                          challenge_count, iterations, tolerance)
+    return _fit_python(recruits, challenges, correct, recruit_count,
+                       challenge_count, iterations, tolerance)
+
+
+def _fit_numpy(np, recruits, challenges, correct, recruit_count, challenge_count,
+               iterations, tolerance):
+    ability = np.zeros(recruit_count)
+    rating = np.zeros(challenge_count)
+    for iteration in range(1, iterations + 1):
+        # Newton step for every ability at once...
+        p = 1.0 / (1.0 + np.exp(rating[challenges] - ability[recruits]))
+        gradient = np.bincount(recruits, correct - p, recruit_count) - ABILITY_PRIOR * ability
+        curvature = np.bincount(recruits, p * (1 - p), recruit_count) + ABILITY_PRIOR
+        step_a = gradient / curvature
+        ability += step_a
+
+        # ...then for every rating (d/d rating has the opposite sign)
+        p = 1.0 / (1.0 + np.exp(rating[challenges] - ability[recruits]))
+        gradient = np.bincount(challenges, p - correct, challenge_count) - RATING_PRIOR * rating
+        curvature = np.bincount(challenges, p * (1 - p), challenge_count) + RATING_PRIOR
+        step_r = gradient / curvature
+        rating += step_r
+
+        if max(np.abs(step_a).max(initial=0), np.abs(step_r).max(initial=0)) < tolerance:
+            break
+    return ability.tolist(), rating.tolist(), iteration
+
+
+def _fit_python(recruits, challenges, correct, recruit_count, challenge_count,
+                iterations, tolerance):
+    ability = [0.0] * recruit_count
+    rating = [0.0] * challenge_count
+    attempts = list(zip(recruits, challenges, correct))
+    for iteration in range(1, iterations + 1):
+        largest = 0.0
+        for params, index, sign, prior in (
+            (ability, 0, 1.0, ABILITY_PRIOR),
+            (rating, 1, -1.0, RATING_PRIOR),
+        ):
+            gradient = [-prior * v for v in params]
+            curvature = [prior] * len(params)
+            for attempt in attempts:
+                r, c, y = attempt
+                p = 1.0 / (1.0 + math.exp(rating[c] - ability[r]))
+                i = attempt[index]
+                gradient[i] += sign * (y - p)
+                curvature[i] += p * (1 - p)
+            for i in range(len(params)):
+                step = gradient[i] / curvature[i]
+                params[i] += step
+                largest = max(largest, abs(step))
+        if largest < tolerance:
+            break
+    return ability, rating, iteration
+
+
+# =====================================================================
+# LABELS AND THE SIDECAR INDEX
+# =====================================================================
+
+
+def relabel(ratings: Dict[str, float], hand_labels: Dict[str, str],
+            order: Sequence[str]) -> Dict[str, str]:
+    """Closest hand label by average rating, for every rated challenge"""
+    sums: Dict[str, List[float]] = {}
+    for key, rating in ratings.items():
+        label = hand_labels.get(key)
+        if label:
+            sums.setdefault(label, []).append(rating)
+    centroids = {label: sum(v) / len(v) for label, v in sums.items()}
+    if not centroids:
+        return {}
+
+    # Labels in difficulty_order must stay in that order on the rating scale
+    ordered = [label for label in order if label in centroids]
+    for label in ordered[1:]:
+        previous = ordered[ordered.index(label) - 1]
+        centroids[label] = max(centroids[label], centroids[previous])
+    return {key: min(centroids, key=lambda label: abs(centroids[label] - rating))
+            for key, rating in ratings.items()}
+
+
+def calibrate(db_path: str, catalog=None, difficulty_order: Sequence[str] = ("Easy", "Medium", "Hard"),
+              min_attempts: int = 20, iterations: int = 50,
+              use_numpy: Optional[bool] = None) -> Dict[str, Any]:
+    """Run the whole job and return the sidecar index (not yet written)"""
+    np = _numpy() if use_numpy is not False else None
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy was requested but is not installed")
+
+    started = time.perf_counter()
+    recruits, challenges, correct, recruit_names, challenge_keys = load_attempts(db_path, np)
+    ability, rating, ran = fit_rasch(recruits, challenges, correct, len(recruit_names),
+                                     len(challenge_keys), np, iterations)
+
+    if np is not None:
+        attempts = np.bincount(challenges, minlength=len(challenge_keys)).tolist()
+        passes = np.bincount(challenges, correct, len(challenge_keys)).tolist()
+    else:
+        attempts = [0] * len(challenge_keys)
+        passes = [0.0] * len(challenge_keys)
+        for c, y in zip(challenges, correct):
+            attempts[c] += 1
+            passes[c] += y
+
+    rated = {key: rating[i] for i, key in enumerate(challenge_keys)
+             if attempts[i] >= min_attempts}
+    hand_labels = {}
+    if catalog is not None:
+        hand_labels = {c.key: c.difficulty for c in catalog.challenges()}
+    labels = relabel(rated, hand_labels, difficulty_order)
+
+    index_challenges = {}
+    for i, key in enumerate(challenge_keys):
+        index_challenges[key] = {
+            "rating": round(rating[i], 4),
+            "attempts": int(attempts[i]),
+            "pass_rate": round(passes[i] / attempts[i], 4) if attempts[i] else None,
+            "label": hand_labels.get(key),
+            "difficulty": labels.get(key, hand_labels.get(key)),
+        }
+
+    return {
+        "version": INDEX_VERSION,
+        "model": "rasch",
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "attempts": len(correct),
+        "iterations": ran,
+        "seconds": round(time.perf_counter() - started, 2),
+        "backend": "numpy" if np is not None else "python",
+        "challenges": index_challenges,
+        "recruits": {name: round(ability[i], 4) for i, name in enumerate(recruit_names)},
+    }
+
+
+def write_index(index: Dict[str, Any], path: str):
+    """Atomically replace the sidecar index"""
+    path = os.path.expanduser(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def load_index(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The sidecar index, or None if it was never generated"""
+    if not path:
+        return None
+    try:
+        with open(os.path.expanduser(path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+def calibrated_difficulties(index: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """challenge key -> calibrated difficulty label"""
+    if not index:
+        return {}
+    return {key: entry["difficulty"] for key, entry in index.get("challenges", {}).items()
+            if entry.get("difficulty")}
+
+
+# =====================================================================
+# COMMAND LINE - python calibration.py
+# =====================================================================
+
+
+def main():
+    from catalog import Catalog
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Tux Boot Camp difficulty calibration")
+    parser.add_argument("--config", default=os.path.join(here, "command.json"))
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--out", help="sidecar index (default: paths.calibration)")
+    parser.add_argument("--min-attempts", type=int, default=20,
+                        help="attempts a challenge needs before it is relabelled")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--no-numpy", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    paths = config.get("paths", {})
+    catalog = Catalog.load(os.path.join(here, paths.get("armory", "armory")))
+
+    index = calibrate(
+        args.db or paths["progress_db"],
+        catalog,
+        config.get("challenges", {}).get("difficulty_order", ["Easy", "Medium", "Hard"]),
+        min_attempts=args.min_attempts,
+        iterations=args.iterations,
+        use_numpy=False if args.no_numpy else None,
+    )
+    out = args.out or paths["calibration"]
+    write_index(index, out)
+
+    moved = sum(1 for entry in index["challenges"].values()
+                if entry["label"] and entry["difficulty"] != entry["label"])
+    print(f"{index['attempts']} attempts, {len(index['challenges'])} challenges,"
+          f" {len(index['recruits'])} recruits -> {out}")
+    print(f"{index['iterations']} iterations in {index['seconds']}s ({index['backend']});"
+          f" {moved} challenges relabelled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import json
+import marshal
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+# =====================================================================
+# CATALOG - Compact, read-only view of ordnance.json + operations.json
+# =====================================================================
+#
+# Every language and challenge is loaded ONCE into slotted records with
+# interned strings (difficulty labels, use cases and challenge names repeat
+# a lot), and every lookup the UI needs is precomputed:
+#
+#   get_language(name)     -> dict lookup
+#   get_all_languages()    -> tuple sorted at build time
+#   get_challenges(name)   -> tuple stored on the Language record
+#
+# Catalog.load() also keeps one instance per armory directory, so every
+# seat on a multi-seat server shares the same records.
+
+
+_intern = sys.intern
+
+
+class Resource:
+    """A learning resource link for a language"""
+
+    __slots__ = ("url",)
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def __repr__(self):
+        return f"Resource({self.url!r})"
+
+
+class TestCase:
+    """One entry of a challenge's optional "tests" list (see testbench.py)"""
+
+    __slots__ = ("name", "stdin", "stdout", "stdout_contains", "exit_code", "files", "hidden")
+
+    def __init__(self, data: Dict[str, Any], index: int = 0):
+        self.name = data.get("name") or f"case {index + 1}"
+        self.stdin = data.get("stdin", "")
+        self.stdout = data.get("stdout")                      # exact, if given
+        self.stdout_contains = tuple(data.get("stdout_contains", ()))
+        self.exit_code = data.get("exit_code", 0)             # None = any
+        self.files = dict(data.get("files", {}))              # fixtures: name -> text
+        self.hidden = data.get("hidden", True)
+
+    def __repr__(self):
+        return f"TestCase({self.name!r})"
+
+
+class Challenge:
+    """A single mission from operations.json"""
+
+    __slots__ = ("language", "name", "description", "difficulty", "index", "key", "tests")
+
+    def __init__(self, language: str, name: str, description: str,
+                 difficulty: str, index: int, tests: Tuple[TestCase, ...] = ()):
+        self.language = _intern(language)
+        self.name = _intern(name)
+        self.description = description
+        self.difficulty = _intern(difficulty)
+        self.index = index
+        # Stable identifier used by progress, grading and leaderboards
+        self.key = _intern(f"{language}/{name}")
+        self.tests = tests
+
+    def __repr__(self):
+        return f"Challenge({self.key!r}, {self.difficulty!r})"
+
+
+class Language:
+    """A language from ordnance.json plus its challenges"""
+
+    __slots__ = ("name", "description", "difficulty", "drill_sergeant_take",
+                 "use_cases", "sample_code", "resources", "challenges")
+
+    def __init__(self, name: str, data: Dict[str, Any],
+                 challenges: Tuple[Challenge, ...] = ()):
+        self.name = _intern(name)
+        self.description = data.get("description", "")
+        self.difficulty = _intern(data.get("difficulty", ""))
+        self.drill_sergeant_take = data.get("drill_sergeant_take", "")
+        self.use_cases = tuple(_intern(u) for u in data.get("use_cases", ()))
+        self.sample_code = data.get("sample_code", "")
+        self.resources = tuple(Resource(url) for url in data.get("learning_resources", ()))
+        self.challenges = challenges
+
+    def __repr__(self):
+        return f"Language({self.name!r}, {len(self.challenges)} challenges)"
+
+
+class Catalog:
+    """Languages and challenges, built once and never re-sorted"""
+
+    BUNDLE_VERSION = 1
+    SOURCE_FILES = ("ordnance.json", "operations.json")
+
+    # armory dir / locale source files -> Catalog, shared by the process
+    _loaded: Dict[Any, "Catalog"] = {}
+
+    def __init__(self, languages: Dict[str, Any], challenges: Dict[str, Any]):
+        self._languages: Dict[str, Language] = {}
+        self._challenges: Dict[str, Challenge] = {}
+
+        for name in sorted(languages):
+            missions = tuple(
+                Challenge(name, c["name"], c.get("description", ""),
+                          c.get("difficulty", ""), i,
+                          tuple(TestCase(t, j) for j, t in enumerate(c.get("tests", ()))))
+                for i, c in enumerate(challenges.get(name, ()))
+            )
+            self._languages[name] = Language(name, languages[name], missions)
+            for challenge in missions:
+                self._challenges[challenge.key] = challenge
+
+        self._names = tuple(self._languages)
+
+    # -----------------------------------------------------------------
+    # Building
+    # -----------------------------------------------------------------
+
+    @classmethod
+    def load(cls, armory_dir: str = "armory", bundle_file: Optional[str] = None) -> "Catalog":
+        """Shared catalog for an armory dir, from the bundle when it is fresh"""
+        armory = Path(armory_dir).resolve()
+        catalog = cls._loaded.get(armory)
+        if catalog is not None:
+            return catalog
+
+        sources = [armory / filename for filename in cls.SOURCE_FILES]
+        bundle = Path(bundle_file) if bundle_file else armory / ".catalog.bundle"
+
+        raw = cls._read_bundle(bundle, sources)
+        if raw is None:
+            raw = []
+            for filepath in sources:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    raw.append(json.load(f))
+            cls._write_bundle(bundle, raw)
+
+        catalog = cls(*raw)
+        cls._loaded[armory] = catalog
+        return catalog
+
+    @classmethod
+    def from_resources(cls, resources) -> "Catalog":
+        """Shared catalog for a ResourceManager's current locale"""
+        key = (resources.source_files('languages'), resources.source_files('challenges'))
+        catalog = cls._loaded.get(key)
+        if catalog is None:
+            catalog = cls(resources.get_all('languages'), resources.get_all('challenges'))
+            cls._loaded[key] = catalog
+        return catalog
+
+    @classmethod
+    def _read_bundle(cls, bundle: Path, sources) -> Optional[list]:
+        """Return the compiled (languages, challenges) if newer than the JSON"""
+        try:
+            bundle_mtime = bundle.stat().st_mtime_ns
+            if any(src.stat().st_mtime_ns > bundle_mtime for src in sources):
+                return None
+            with open(bundle, "rb") as f:
+                version, raw = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return raw if version == cls.BUNDLE_VERSION else None
+
+    @classmethod
+    def _write_bundle(cls, bundle: Path, raw: list):
+        try:
+            with open(bundle, "wb") as f:
+                marshal.dump((cls.BUNDLE_VERSION, raw), f)
+        except OSError:
+            pass  # Read-only armory - we just parse the JSON next time
+
+    # -----------------------------------------------------------------
+    # Views
+    # -----------------------------------------------------------------
+
+    def get_language(self, name: str) -> Optional[Language]:
+        """Get language record by name"""
+        return self._languages.get(name)
+
+    def get_all_languages(self) -> Tuple[str, ...]:
+        """All language names, sorted once at build time"""
+        return self._names
+
+    def get_challenges(self, language: str) -> Tuple[Challenge, ...]:
+        """Challenges for a language, in operations.json order"""
+        record = self._languages.get(language)
+        return record.challenges if record else ()
+
+    def has_challenges(self, language: str) -> bool:
+        """Check if language has challenges available"""
+        return bool(self.get_challenges(language))
+
+    def get_challenge(self, key: str) -> Optional[Challenge]:
+        """Look up a challenge by its 'Language/Name' key"""
+        return self._challenges.get(key)
+
+    def languages(self):
+        """Iterate over every Language record"""
+        return iter(self._languages.values())
+
+    def challenges(self):
+        """Iterate over every Challenge record"""
+        return iter(self._challenges.values())
+
+    def __len__(self):
+        return len(self._languages)
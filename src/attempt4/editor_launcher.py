@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+
+# =====================================================================
+# EDITOR LAUNCHER - Open challenge files without stalling the UI
+# =====================================================================
+#
+# The editor is picked in this order:
+#
+#   $VISUAL, $EDITOR       the recruit's own choice
+#   editor.command         command.json (string or argv list)
+#   system opener          xdg-open / open / os.startfile
+#
+# Commands are split with shlex and run with subprocess.Popen - never
+# through a shell - so paths with quotes or spaces are passed verbatim.
+# Everything happens on a daemon thread: launch() returns at once, and
+# the thread also reaps the child when it exits.
+#
+# Editors that can hand a file to a window that is already open get
+# their "reuse" flag (REUSE_ARGS). Terminal editors (vim, nano, ...)
+# are wrapped in editor.terminal, as a GUI app has no terminal of its
+# own; without one configured we fall through to the system opener.
+#
+# Each launch reports a LaunchResult with the spawn latency.
+
+
+REUSE_ARGS: Dict[str, List[str]] = {
+    "code": ["--reuse-window"],
+    "codium": ["--reuse-window"],
+    "code-insiders": ["--reuse-window"],
+    "gvim": ["--remote-tab-silent"],
+    "mvim": ["--remote-tab-silent"],
+    "emacsclient": ["--no-wait"],
+    "kate": ["--use"],
+}
+
+TERMINAL_EDITORS = {"vi", "vim", "nvim", "nano", "micro", "hx", "helix",
+                    "kak", "joe", "ne", "mg", "ed", "pico"}
+
+DEFAULT_TERMINALS = (["x-terminal-emulator", "-e"], ["gnome-terminal", "--"],
+                     ["konsole", "-e"], ["xterm", "-e"])
+
+Command = Union[str, Sequence[str]]
+
+
+class LaunchResult:
+    """What was run to open a file and how long the spawn took"""
+
+    __slots__ = ("path", "argv", "source", "latency_ms", "error")
+
+    def __init__(self, path: str, argv: List[str], source: str,
+                 latency_ms: float, error: Optional[str] = None):
+        self.path = path
+        self.argv = argv
+        self.source = source
+        self.latency_ms = latency_ms
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error: {self.error}"
+        return f"LaunchResult({self.source} {self.argv[:1]} {self.latency_ms:.1f}ms {status})"
+
+
+def _split(command: Optional[Command]) -> List[str]:
+    if not command:
+        return []
+    if isinstance(command, str):
+        return shlex.split(command, posix=os.name != "nt")
+    return list(command)
+
+
+def _program(argv: List[str]) -> str:
+    name = os.path.basename(argv[0]).lower()
+    return name[:-4] if name.endswith(".exe") else name
+
+
+def system_opener(path: str) -> List[str]:
+    """Desktop default handler (empty on Windows - os.startfile is used)"""
+    if os.name == "nt":
+        return []
+    if sys.platform == "darwin":
+        return ["open", path]
+    return ["xdg-open", path]
+
+
+class EditorLauncher:
+    """Resolve the editor once, launch files asynchronously"""
+
+    def __init__(self, command: Optional[Command] = None, terminal: Optional[Command] = None,
+                 reuse: bool = True, env: Optional[Dict[str, str]] = None):
+        self.command = _split(command)
+        self.terminal = _split(terminal)
+        self.reuse = reuse
+        self.env = os.environ if env is None else env
+        self.last: Optional[LaunchResult] = None
+
+    @classmethod
+    def from_config(cls, config) -> "EditorLauncher":
+        return cls(
+            config.get("editor", "command", default=None),
+            config.get("editor", "terminal", default=None),
+            config.get("editor", "reuse_instance", default=True),
+        )
+
+    # -----------------------------------------------------------------
+    # Resolving
+    # -----------------------------------------------------------------
+
+    def _terminal(self) -> List[str]:
+        if self.terminal:
+            return self.terminal
+        for candidate in DEFAULT_TERMINALS:
+            if shutil.which(candidate[0]):
+                return candidate
+        return []
+
+    def _usable(self, argv: List[str]) -> Optional[List[str]]:
+        """argv ready to run (reuse flag / terminal added), or None"""
+        if not argv or not shutil.which(argv[0]):
+            return None
+        program = _program(argv)
+        if self.reuse:
+            argv = argv[:1] + [a for a in REUSE_ARGS.get(program, []) if a not in argv] + argv[1:]
+        if program in TERMINAL_EDITORS and os.name != "nt":
+            terminal = self._terminal()
+            if not terminal:
+                return None
+            argv = terminal + argv
+        return argv
+
+    def resolve(self, path: str) -> Tuple[List[str], str]:
+        """(argv, source) for opening path; argv is [] for os.startfile"""
+        candidates = (
+            ("VISUAL", _split(self.env.get("VISUAL"))),
+            ("EDITOR", _split(self.env.get("EDITOR"))),
+            ("config", self.command),
+        )
+        for source, argv in candidates:
+            argv = self._usable(argv)
+            if argv:
+                return argv + [path], source
+        return system_opener(path), "system"
+
+    # -----------------------------------------------------------------
+    # Launching
+    # -----------------------------------------------------------------
+
+    def launch(self, path: str,
+               on_result: Optional[Callable[[LaunchResult], None]] = None) -> threading.Thread:
+        """Open path in the editor; returns immediately"""
+        thread = threading.Thread(target=self._launch, args=(os.path.abspath(path), on_result),
+                                  name="editor-launch", daemon=True)
+        thread.start()
+        return thread
+
+    def _launch(self, path: str, on_result):
+        start = time.perf_counter()
+        argv, source = self.resolve(path)
+        process = None
+        error = None
+        try:
+            if argv:
+                process = subprocess.Popen(
+                    argv,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    start_new_session=os.name != "nt",
+                )
+            else:
+                os.startfile(path)
+        except OSError as e:
+            error = str(e)
+        result = LaunchResult(path, argv or ["startfile", path], source,
+                              (time.perf_counter() - start) * 1000, error)
+        self.last = result
+        if on_result:
+            try:
+                on_result(result)
+            except Exception as e:  # a broken callback must not hide the editor
+                print(f"Editor launch callback failed: {e}")
+        if process is not None:
+            process.wait()  # reap; the editor may stay open for hours
+
+
+# =====================================================================
+# COMMAND LINE - python editor_launcher.py FILE [--dry-run]
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp editor launcher")
+    parser.add_argument("file")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--dry-run", action="store_true", help="only show what would run")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        editor = json.load(f).get("editor", {})
+    launcher = EditorLauncher(editor.get("command"), editor.get("terminal"),
+                              editor.get("reuse_instance", True))
+    if args.dry_run:
+        argv, source = launcher.resolve(os.path.abspath(args.file))
+        print(f"{source}: {argv or ['startfile', args.file]}")
+        return
+    done = threading.Event()
+
+    def report(result):
+        print(result)
+        done.set()
+
+    launcher.launch(args.file, report)
+    done.wait(30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+import argparse
+import csv
+import gzip
+import json
+import os
+import sqlite3
+from datetime import datetime
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# =====================================================================
+# GRADEBOOK EXPORT - One row per recruit per challenge, for the LMS
+# =====================================================================
+#
+# A pipeline of generators, so memory stays flat for any cohort size:
+#
+#   submission_rows()   stored grades, ordered by (recruit, challenge, time)
+#   gradebook_records() fold each (recruit, challenge) group into a record
+#   map_columns()       rename/select fields per the configured mapping
+#   export()            stream into CSV or JSONL files, optionally gzipped
+#                       and split every `rows_per_file` rows
+#
+# The fields come from CodeAnalyzer._parse_ai_response as stored by
+# ProgressStore: correct, completeness, quality_score and tux_emotion.
+
+
+# Every field a column mapping can use
+GRADEBOOK_FIELDS = (
+    "recruit",
+    "language",
+    "challenge",
+    "challenge_key",
+    "attempts",
+    "correct",            # any attempt graded correct
+    "best_completeness",
+    "best_quality",
+    "last_completeness",
+    "last_quality",
+    "last_emotion",
+    "last_summary",
+    "first_submitted",
+    "last_submitted",
+)
+
+# Used when command.json has no export.gradebook.columns
+DEFAULT_COLUMNS = {
+    "Student": "recruit",
+    "Language": "language",
+    "Assignment": "challenge",
+    "Attempts": "attempts",
+    "Correct": "correct",
+    "Completeness": "best_completeness",
+    "Quality": "best_quality",
+    "Emotion": "last_emotion",
+    "Last Submitted": "last_submitted",
+}
+
+FORMATS = ("csv", "jsonl")
+
+
+# =====================================================================
+# PIPELINE
+# =====================================================================
+
+
+def submission_rows(conn: sqlite3.Connection, chunk_size: int = 5000) -> Iterator[tuple]:
+    """Stored grades in gradebook order, fetched a chunk at a time"""
+    rows = conn.execute(
+        "SELECT r.name, s.challenge_key, s.submitted_at, s.correct, s.completeness,"
+        " s.quality_score, s.emotion, s.summary"
+        " FROM submissions s JOIN recruits r ON r.id = s.recruit_id"
+        " ORDER BY s.recruit_id, s.challenge_key, s.submitted_at"
+    )
+    while True:
+        chunk = rows.fetchmany(chunk_size)
+        if not chunk:
+            return
+        yield from chunk
+
+
+def gradebook_records(rows: Iterable[tuple]) -> Iterator[Dict[str, Any]]:
+    """Fold consecutive rows of one (recruit, challenge) into a record"""
+    for (recruit, key), attempts in groupby(rows, key=lambda row: (row[0], row[1])):
+        count = any_correct = best_completeness = best_quality = 0
+        for row in attempts:
+            if not count:
+                first = row
+            count += 1
+            any_correct |= row[3]
+            best_completeness = max(best_completeness, row[4])
+            best_quality = max(best_quality, row[5])
+
+        # `row` is the latest attempt
+        language, _, challenge = key.partition("/")
+        yield {
+            "recruit": recruit,
+            "language": language,
+            "challenge": challenge,
+            "challenge_key": key,
+            "attempts": count,
+            "correct": bool(any_correct),
+            "best_completeness": best_completeness,
+            "best_quality": best_quality,
+            "last_completeness": row[4],
+            "last_quality": row[5],
+            "last_emotion": row[6],
+            "last_summary": row[7] or "",
+            "first_submitted": _stamp(first[2]),
+            "last_submitted": _stamp(row[2]),
+        }
+
+
+def _stamp(ts: float) -> str:
+    return datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+
+
+def map_columns(records: Iterable[Dict[str, Any]],
+                columns: Dict[str, str]) -> Iterator[tuple]:
+    """Select record fields as tuples, in the order of {output column: field}"""
+    unknown = sorted(set(columns.values()) - set(GRADEBOOK_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown gradebook field(s): {', '.join(unknown)}")
+    fields = tuple(columns.values())
+    for record in records:
+        yield tuple(record[field] for field in fields)
+
+
+# =====================================================================
+# WRITERS
+# =====================================================================
+
+
+class ChunkedWriter:
+    """Writes rows to <prefix>-0001.<ext>[.gz], starting a new file every N rows"""
+
+    def __init__(self, prefix: str, fmt: str, columns: List[str], compress: bool = False,
+                 rows_per_file: int = 0):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown gradebook format {fmt!r} (use {' or '.join(FORMATS)})")
+        self.prefix = prefix
+        self.fmt = fmt
+        self.columns = columns
+        self.compress = compress
+        self.rows_per_file = rows_per_file
+        self.paths: List[str] = []
+        self.rows = 0
+
+        self._file = None
+        self._csv = None
+        self._rows_in_file = 0
+
+    def _path(self, number: int) -> str:
+        suffix = f".{self.fmt}" + (".gz" if self.compress else "")
+        if self.rows_per_file:
+            return f"{self.prefix}-{number:04d}{suffix}"
+        return self.prefix + suffix
+
+    def _open_next(self):
+        self.close()
+        path = self._path(len(self.paths) + 1)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.compress:
+            self._file = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            self._file = open(path, "w", encoding="utf-8", newline="")
+        self.paths.append(path)
+        self._rows_in_file = 0
+        if self.fmt == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(self.columns)
+
+    def write(self, row: tuple):
+        if self._file is None or (self.rows_per_file and self._rows_in_file >= self.rows_per_file):
+            self._open_next()
+        if self.fmt == "csv":
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False) + "\n")
+        self._rows_in_file += 1
+        self.rows += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv = None
+
+
+def export(db_path: str, prefix: str, fmt: str = "csv", compress: bool = False,
+           rows_per_file: int = 0, columns: Optional[Dict[str, str]] = None,
+           chunk_size: int = 5000) -> Tuple[int, List[str]]:
+    """Stream the gradebook to disk; returns (rows written, files written)"""
+    columns = columns or DEFAULT_COLUMNS
+    conn = sqlite3.connect(os.path.expanduser(db_path))
+    writer = ChunkedWriter(prefix, fmt, list(columns), compress, rows_per_file)
+    try:
+        pipeline = map_columns(gradebook_records(submission_rows(conn, chunk_size)), columns)
+        for row in pipeline:
+            writer.write(row)
+        if not writer.paths:
+            writer._open_next()  # an empty gradebook still gets its header
+    finally:
+        writer.close()
+        conn.close()
+    return writer.rows, writer.paths
+
+
+# =====================================================================
+# COMMAND LINE - python gradebook.py --out exports/gradebook --gzip
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp gradebook export")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--out", default="gradebook", help="output path without extension")
+    parser.add_argument("--format", choices=FORMATS)
+    parser.add_argument("--gzip", action=argparse.BooleanOptionalAction,
+                        help="compress the output (default: export.gradebook.gzip)")
+    parser.add_argument("--rows-per-file", type=int, help="split output (0: one file)")
+    parser.add_argument("--columns", help="JSON file with a {column: field} mapping")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    settings = config.get("export", {}).get("gradebook", {})
+
+    columns = settings.get("columns")
+    if args.columns:
+        with open(args.columns, "r", encoding="utf-8") as f:
+            columns = json.load(f)
+
+    rows, paths = export(
+        args.db or config["paths"]["progress_db"],
+        args.out,
+        fmt=args.format or settings.get("format", "csv"),
+        compress=settings.get("gzip", False) if args.gzip is None else args.gzip,
+        rows_per_file=(settings.get("rows_per_file", 0) if args.rows_per_file is None
+                       else args.rows_per_file),
+        columns=columns,
+    )
+    print(f"{rows} gradebook rows -> {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# =====================================================================
+# ACTIVITY JOURNAL - Append-only log of everything a recruit does
+# =====================================================================
+#
+# Every action that changes progress (committing to a language, accepting
+# or skipping a challenge, getting code graded) becomes an event with its
+# motivation delta. Progress is never stored directly - it is the result
+# of replaying the events with apply_event(), starting from the last
+# compacted snapshot:
+#
+#   <journal_dir>/<recruit>.jsonl          one JSON event per line
+#   <journal_dir>/<recruit>.snapshot.json  {"state": ..., "offset": bytes}
+#
+# Appends are buffered and fsync'd in batches (every `batch_size` events or
+# `sync_interval` seconds, whichever comes first, plus on sync()/close()).
+# A crash can leave a torn last line: opening the journal cuts it off, and
+# replay skips any line that still fails to parse.
+
+
+EVENT_TYPES = (
+    "enroll",
+    "commit_language",
+    "accept_challenge",
+    "skip_challenge",
+    "code_graded",
+    "motivation",
+)
+
+
+def make_event(kind: str, delta: int = 0, ts: Optional[float] = None, **data) -> Dict[str, Any]:
+    """Build a journal event; `data` must be JSON serializable"""
+    if kind not in EVENT_TYPES:
+        raise ValueError(f"Unknown journal event type: {kind}")
+    event = {"ts": time.time() if ts is None else ts, "type": kind}
+    if delta:
+        event["delta"] = delta
+    event.update(data)
+    return event
+
+
+def apply_event(state, event: Dict[str, Any], stamp: bool = True):
+    """Fold one event into a progress object (StudentProgress or similar)
+
+    The state needs motivation_level, languages_started,
+    languages_completed, completion_attempts and last_session attributes.
+    If it has an `activity` calendar (activity.ActivityCalendar) the event
+    marks its day and streak_days follows it; a `medals` case
+    (achievements.MedalCase) and a `mastery` record (selector.Mastery) see
+    the event too. Replays pass stamp=False and set last_session once at
+    the end.
+    """
+    delta = event.get("delta", 0)
+    if delta:
+        state.motivation_level = max(0, min(100, state.motivation_level + delta))
+
+    kind = event["type"]
+    if kind == "commit_language":
+        if event["language"] not in state.languages_started:
+            state.languages_started.append(event["language"])
+    elif kind == "code_graded":
+        key = f"{event['language']}/{event['challenge']}"
+        state.completion_attempts[key] = state.completion_attempts.get(key, 0) + 1
+
+    activity = getattr(state, "activity", None)
+    if activity is not None:
+        activity.record(event["ts"])
+        state.streak_days = activity.streak
+
+    medals = getattr(state, "medals", None)
+    if medals is not None:
+        medals.observe(event)
+
+    mastery = getattr(state, "mastery", None)
+    if mastery is not None:
+        mastery.observe(event)
+
+    if stamp:
+        state.last_session = _session_stamp(event["ts"])
+
+
+def _session_stamp(ts: float) -> str:
+    return datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+
+
+def journal_basename(recruit: str) -> str:
+    """Filesystem-safe, collision-free name for a recruit's journal"""
+    safe = re.sub(r"[^A-Za-z0-9_-]+", "_", recruit)[:40] or "recruit"
+    digest = hashlib.sha1(recruit.encode("utf-8")).hexdigest()[:8]
+    return f"{safe}_{digest}"
+
+
+class Journal:
+    """One recruit's append-only event log plus its compacted snapshot"""
+
+    def __init__(self, journal_dir: str, recruit: str, batch_size: int = 32,
+                 sync_interval: float = 5.0, compact_every: int = 1000):
+        self.journal_dir = os.path.expanduser(journal_dir)
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+        base = os.path.join(self.journal_dir, journal_basename(recruit))
+        self.recruit = recruit
+        self.log_path = base + ".jsonl"
+        self.snapshot_path = base + ".snapshot.json"
+
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.compact_every = compact_every
+
+        self._drop_torn_tail()
+        self._file = open(self.log_path, "ab")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.events_since_snapshot = 0
+
+    def _drop_torn_tail(self):
+        """Cut a torn last line (crash mid-append) so appends start clean"""
+        try:
+            with open(self.log_path, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size == 0:
+                    return
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return
+                # Walk back to the last complete line
+                end = size
+                while end > 0:
+                    start = max(0, end - 4096)
+                    f.seek(start)
+                    newline = f.read(end - start).rfind(b"\n")
+                    if newline != -1:
+                        end = start + newline + 1
+                        break
+                    end = start
+                f.truncate(end)
+                f.flush()
+                os.fsync(f.fileno())
+        except FileNotFoundError:
+            pass
+
+    # -----------------------------------------------------------------
+    # Writing
+    # -----------------------------------------------------------------
+
+    def append(self, event: Dict[str, Any]):
+        """Buffer one event; fsync once the batch is full or old enough"""
+        line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+        self._file.write(line.encode("utf-8") + b"\n")
+        self._unsynced += 1
+        self.events_since_snapshot += 1
+
+        if (self._unsynced >= self.batch_size
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+    def sync(self):
+        """Flush buffered events and fsync them to disk"""
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def needs_compaction(self) -> bool:
+        return self.events_since_snapshot >= self.compact_every
+
+    def compact(self, state: Dict[str, Any]):
+        """Snapshot `state` so replay can skip everything logged so far"""
+        self.sync()
+        snapshot = {"state": state, "offset": self._file.tell()}
+
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self.events_since_snapshot = 0
+
+    def close(self):
+        self.sync()
+        self._file.close()
+
+    # -----------------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------------
+
+    def load_snapshot(self) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Return (state, byte offset) of the last snapshot, or (None, 0)"""
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            return snapshot["state"], snapshot["offset"]
+        except (OSError, ValueError, KeyError):
+            return None, 0
+
+    def events(self, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Events logged after `offset`, oldest first"""
+        self.sync()
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+
+        # A torn last line (crash mid-append) is ignored
+        end = data.rfind(b"\n")
+        data = data[:end] if end != -1 else b""
+        if not data:
+            return iter(())
+        # One lines -> JSON array parse is far cheaper than a loads() per line
+        try:
+            return iter(json.loads(b"[" + data.replace(b"\n", b",") + b"]"))
+        except ValueError:
+            return self._parse_lines(data)
+
+    @staticmethod
+    def _parse_lines(data: bytes) -> Iterator[Dict[str, Any]]:
+        """Slow path: one loads() per line, skipping any damaged line"""
+        for line in data.split(b"\n"):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                yield event
+
+    def replay(self, state) -> int:
+        """Apply every event after the last snapshot to `state`
+
+        `state` should already hold the snapshot (see load_snapshot()).
+        Returns the number of events replayed.
+        """
+        _, offset = self.load_snapshot()
+        count = 0
+        event = None
+        for event in self.events(offset):
+            apply_event(state, event, stamp=False)
+            count += 1
+        if event is not None:
+            state.last_session = _session_stamp(event["ts"])
+        self.events_since_snapshot = count
+        return count
+
+    def history(self, kinds: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Full activity history (ignores snapshots), optionally filtered"""
+        for event in self.events(0):
+            if kinds is None or event["type"] in kinds:
+                yield event
@@ -0,0 +1,243 @@
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# =====================================================================
+# LEADERBOARD - Incrementally ranked recruits, never re-sorted
+# =====================================================================
+#
+# A recruit's score on a challenge is their BEST graded submission,
+# weighted with ai.analysis_criteria from command.json:
+#
+#   correctness_weight * (100 if correct else 0)
+#   + completeness_weight * completeness
+#   + quality_weight * quality_score
+#
+# A language board sums the challenge scores in that language and the
+# global board sums everything. Each board is a RankedSet (an indexable
+# skip list), so a new grade costs O(log n) per board it touches and
+# top-K / rank reads never sort the cohort.
+
+
+DEFAULT_WEIGHTS = {
+    "correctness_weight": 0.4,
+    "completeness_weight": 0.3,
+    "quality_weight": 0.3,
+}
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # width[i]: how many level-0 steps next[i] jumps over
+        self.width: List[int] = [1] * level
+
+
+class RankedSet:
+    """Members ordered by score (highest first) with O(log n) rank/update"""
+
+    MAX_LEVEL = 24  # comfortably more than log2 of any cohort
+
+    def __init__(self):
+        self._head = _Node(None, self.MAX_LEVEL)
+        self._scores: Dict[str, float] = {}
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, member):
+        return member in self._scores
+
+    def score(self, member: str) -> Optional[float]:
+        return self._scores.get(member)
+
+    # -----------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------
+
+    def set(self, member: str, score: float):
+        """Insert a member or move it to a new score"""
+        old = self._scores.get(member)
+        if old is not None:
+            if old == score:
+                return
+            self._remove((-old, member))
+        self._scores[member] = score
+        self._insert((-score, member))
+
+    def discard(self, member: str):
+        old = self._scores.pop(member, None)
+        if old is not None:
+            self._remove((-old, member))
+
+    def _path(self, key) -> Tuple[List[_Node], List[int]]:
+        """Last node before `key` on every level, and its level-0 position"""
+        chain = [self._head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        node, position = self._head, 0
+        for level in range(self.MAX_LEVEL - 1, -1, -1):
+            nxt = node.next[level]
+            while nxt is not None and nxt.key < key:
+                position += node.width[level]
+                node, nxt = nxt, nxt.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def _insert(self, key):
+        chain, positions = self._path(key)
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < 0.5:
+            level += 1
+
+        new = _Node(key, level)
+        position = positions[0] + 1
+        for i in range(level):
+            prev = chain[i]
+            new.next[i] = prev.next[i]
+            prev.next[i] = new
+            new.width[i] = prev.width[i] - (position - positions[i]) + 1
+            prev.width[i] = position - positions[i]
+        for i in range(level, self.MAX_LEVEL):
+            chain[i].width[i] += 1
+
+    def _remove(self, key):
+        chain, _ = self._path(key)
+        target = chain[0].next[0]
+        for i in range(self.MAX_LEVEL):
+            prev = chain[i]
+            if prev.next[i] is target:
+                prev.width[i] += target.width[i] - 1
+                prev.next[i] = target.next[i]
+            else:
+                prev.width[i] -= 1
+
+    # -----------------------------------------------------------------
+    # Reads
+    # -----------------------------------------------------------------
+
+    def rank(self, member: str) -> Optional[int]:
+        """1-based position of a member, or None if it isn't ranked"""
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        _, positions = self._path((-score, member))
+        return positions[0] + 1
+
+    def at(self, rank: int) -> Tuple[str, float]:
+        """(member, score) at a 1-based rank"""
+        if not 1 <= rank <= len(self._scores):
+            raise IndexError(rank)
+        node, remaining = self._head, rank
+        for level in range(self.MAX_LEVEL - 1, -1, -1):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        score, member = node.key
+        return member, -score
+
+    def top(self, k: int = 10) -> List[Tuple[str, float]]:
+        """The k best (member, score) pairs, best first"""
+        result = []
+        node = self._head.next[0]
+        while node is not None and len(result) < k:
+            result.append((node.key[1], -node.key[0]))
+            node = node.next[0]
+        return result
+
+    def around(self, member: str, span: int = 2) -> List[Tuple[int, str, float]]:
+        """(rank, member, score) for a member and its neighbours"""
+        rank = self.rank(member)
+        if rank is None:
+            return []
+        first = max(1, rank - span)
+        last = min(len(self._scores), rank + span)
+        return [(r, *self.at(r)) for r in range(first, last + 1)]
+
+
+class Leaderboard:
+    """Global, per-language and per-challenge boards fed one grade at a time"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        self.weights.update(weights or {})
+
+        self.global_board = RankedSet()
+        self._languages: Dict[str, RankedSet] = {}
+        self._challenges: Dict[str, RankedSet] = {}
+
+    @classmethod
+    def from_config(cls, config, store=None) -> "Leaderboard":
+        """Leaderboard weighted per command.json, seeded from saved submissions"""
+        board = cls(config.get("ai", "analysis_criteria"))
+        if store is not None:
+            board.load(store.iter_graded())
+        return board
+
+    # -----------------------------------------------------------------
+    # Scoring
+    # -----------------------------------------------------------------
+
+    def score(self, result: Dict[str, Any]) -> float:
+        """Weighted 0-100 score for one CodeAnalyzer result"""
+        w = self.weights
+        return round(
+            w["correctness_weight"] * (100 if result.get("correct") else 0)
+            + w["completeness_weight"] * result.get("completeness", 0)
+            + w["quality_weight"] * result.get("quality_score", 0),
+            2,
+        )
+
+    def record(self, recruit: str, language: str, challenge_name: str,
+               result: Dict[str, Any]) -> float:
+        """Fold in one graded submission; returns the points it added"""
+        return self._record(recruit, language, f"{language}/{challenge_name}",
+                            self.score(result))
+
+    def load(self, graded: Iterable[Tuple[str, str, Dict[str, Any]]]):
+        """Seed from (recruit, challenge key, result) rows"""
+        for recruit, key, result in graded:
+            language = key.partition("/")[0]
+            self._record(recruit, language, key, self.score(result))
+
+    def _record(self, recruit: str, language: str, key: str, score: float) -> float:
+        challenge_board = self._challenges.get(key)
+        if challenge_board is None:
+            challenge_board = self._challenges[key] = RankedSet()
+
+        best = challenge_board.score(recruit)
+        if best is not None and best >= score:
+            return 0.0
+        gained = score - (best or 0.0)
+        challenge_board.set(recruit, score)
+
+        language_board = self._languages.get(language)
+        if language_board is None:
+            language_board = self._languages[language] = RankedSet()
+        for board in (language_board, self.global_board):
+            board.set(recruit, round((board.score(recruit) or 0.0) + gained, 2))
+        return gained
+
+    # -----------------------------------------------------------------
+    # Reads
+    # -----------------------------------------------------------------
+
+    def board(self, language: Optional[str] = None,
+              challenge: Optional[str] = None) -> RankedSet:
+        """The global board, a language board or a 'Language/Name' board"""
+        if challenge is not None:
+            return self._challenges.get(challenge) or RankedSet()
+        if language is not None:
+            return self._languages.get(language) or RankedSet()
+        return self.global_board
+
+    def top(self, k: int = 10, language: Optional[str] = None,
+            challenge: Optional[str] = None) -> List[Tuple[str, float]]:
+        return self.board(language, challenge).top(k)
+
+    def rank(self, recruit: str, language: Optional[str] = None,
+             challenge: Optional[str] = None) -> Optional[int]:
+        return self.board(language, challenge).rank(recruit)
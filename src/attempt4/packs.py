@@ -0,0 +1,277 @@
+import argparse
+import csv
+import json
+import os
+import re
+import stat
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from catalog import Catalog, Challenge
+from template_engine import CompiledTemplate, TemplateEngine
+
+
+# =====================================================================
+# CHALLENGE PACKS - Pre-generate challenge files for a whole class
+# =====================================================================
+#
+# Before a lab, every recruit gets one file per challenge in their
+# language, e.g. packs/Jane_Doe/Python_BEGINNER_DRILL.py.
+#
+#   plan()      (recruit, challenge) -> output path, collision-free:
+#               names are sanitized and any clash gets a -2, -3 suffix
+#   PackRenderer fills a (language, challenge) template from
+#               template_engine ONCE, leaving only the recruit slot, so each
+#               recruit's copy is a single join
+#   generate()  renders, then writes through a thread pool; every file is
+#               written to a temp file in the same directory and renamed
+#               into place, so a half-written file is never visible (the
+#               temp file is re-moded first: mkstemp makes it 0600)
+#
+# Existing files are left alone unless overwrite=True - recruits may have
+# started on them already.
+
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def safe_name(text: str) -> str:
+    """Filesystem-safe version of a recruit/challenge/language name"""
+    return _UNSAFE.sub("_", text.replace("+", "p").replace("#", "sharp")).strip("._") or "_"
+
+
+class PackJob:
+    """One file to write: a recruit's copy of a challenge"""
+
+    __slots__ = ("recruit", "challenge", "path")
+
+    def __init__(self, recruit: str, challenge: Challenge, path: str):
+        self.recruit = recruit
+        self.challenge = challenge
+        self.path = path
+
+    def __repr__(self):
+        return f"PackJob({self.recruit!r}, {self.challenge.key!r}, {self.path!r})"
+
+
+class PackReport:
+    """What generate() did"""
+
+    __slots__ = ("written", "skipped", "rendered", "seconds")
+
+    def __init__(self):
+        self.written: List[str] = []
+        self.skipped: List[str] = []
+        self.rendered = 0  # distinct (language, challenge) renders
+        self.seconds = 0.0
+
+
+# =====================================================================
+# PLANNING
+# =====================================================================
+
+
+def plan(assignments: Iterable[Tuple[str, str]], catalog: Catalog, out_dir: str,
+         extensions: Dict[str, str], per_recruit: Optional[int] = None,
+         difficulties: Optional[Sequence[str]] = None) -> List[PackJob]:
+    """Expand (recruit, language) pairs into one job per challenge file"""
+    jobs: List[PackJob] = []
+    claimed: Set[str] = set()
+    seen: Set[Tuple[str, str]] = set()
+    for recruit, language in assignments:
+        challenges = [c for c in catalog.get_challenges(language)
+                      if not difficulties or c.difficulty in difficulties]
+        if per_recruit is not None:
+            challenges = challenges[:per_recruit]
+        for challenge in challenges:
+            if (recruit, challenge.key) in seen:
+                continue
+            seen.add((recruit, challenge.key))
+            base = os.path.join(out_dir, safe_name(recruit),
+                                f"{safe_name(language)}_{safe_name(challenge.name)}")
+            path = _claim(base, extensions.get(language, ".txt"), claimed)
+            jobs.append(PackJob(recruit, challenge, path))
+    return jobs
+
+
+def _claim(base: str, extension: str, claimed: Set[str]) -> str:
+    """First of base.ext, base-2.ext, ... not already planned"""
+    path, n = base + extension, 1
+    while os.path.normcase(path) in claimed:
+        n += 1
+        path = f"{base}-{n}{extension}"
+    claimed.add(os.path.normcase(path))
+    return path
+
+
+# =====================================================================
+# RENDERING
+# =====================================================================
+
+
+class PackRenderer:
+    """Challenge templates with everything but the recruit filled in, per challenge"""
+
+    def __init__(self, engine: TemplateEngine, difficulty_of=None, date: Optional[str] = None):
+        self.engine = engine
+        self.difficulty_of = difficulty_of or (lambda challenge: challenge.difficulty)
+        self.date = date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # challenge key -> template whose only slot left is "student"
+        self._cache: Dict[str, CompiledTemplate] = {}
+
+    def template(self, challenge: Challenge) -> CompiledTemplate:
+        template = self._cache.get(challenge.key)
+        if template is None:
+            template = self._cache[challenge.key] = self.engine.partial(
+                challenge.language,
+                challenge=challenge.name,
+                difficulty=self.difficulty_of(challenge),
+                date=self.date,
+                description=challenge.description,
+            )
+        return template
+
+    def render(self, recruit: str, challenge: Challenge) -> str:
+        return self.template(challenge).render({"student": recruit})
+
+    @property
+    def rendered(self) -> int:
+        return len(self._cache)
+
+
+# =====================================================================
+# WRITING
+# =====================================================================
+
+
+# Read once: os.umask() can only be read by setting it, which is not
+# safe once generate()'s writer threads are running
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def file_mode(path: str) -> int:
+    """Mode for a file written to path: the existing file's, else 0666 & ~umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_atomic(path: str, text: str, overwrite: bool = True) -> bool:
+    """Write via temp file + rename; False if the file existed and was kept"""
+    directory = os.path.dirname(path) or "."
+    if not overwrite and os.path.exists(path):
+        return False
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def generate(jobs: Sequence[PackJob], renderer: PackRenderer, overwrite: bool = False,
+             workers: int = 8) -> PackReport:
+    """Render every job's file and write them all through a thread pool"""
+    report = PackReport()
+    started = time.perf_counter()
+
+    # Rendering is CPU-bound and cached - do it up front, in this thread
+    texts = [renderer.render(job.recruit, job.challenge) for job in jobs]
+    report.rendered = renderer.rendered
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = pool.map(lambda pair: write_atomic(pair[0].path, pair[1], overwrite),
+                           zip(jobs, texts))
+        for job, written in zip(jobs, results):
+            (report.written if written else report.skipped).append(job.path)
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+# =====================================================================
+# COMMAND LINE - python packs.py --roster class.csv --out packs
+# =====================================================================
+
+
+def _roster_assignments(path: str, default_language: Optional[str]) -> List[Tuple[str, str]]:
+    """(recruit, language) from a CSV with recruit[,language] columns"""
+    assignments = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            language = (row.get("language") or default_language or "").strip()
+            if row.get("recruit") and language:
+                assignments.append((row["recruit"].strip(), language))
+    return assignments
+
+
+def _db_assignments(db_path: str, language: Optional[str]) -> List[Tuple[str, str]]:
+    """(recruit, language) for every recruit in the progress database"""
+    from roster import Roster
+
+    roster = Roster(db_path)
+    try:
+        return [(entry.name, lang)
+                for page in roster.pages(language=language)
+                for entry in page.entries
+                for lang in entry.languages
+                if language is None or lang == language]
+    finally:
+        roster.close()
+
+
+def main():
+    from calibration import calibrated_difficulties, load_index
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Tux Boot Camp challenge pack generator")
+    parser.add_argument("--config", default=os.path.join(here, "command.json"))
+    parser.add_argument("--roster", help="CSV with recruit[,language] columns"
+                                         " (default: every recruit in paths.progress_db)")
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--language", help="only this language (or the default for the CSV)")
+    parser.add_argument("--difficulty", action="append", help="only these difficulties")
+    parser.add_argument("--per-recruit", type=int, help="at most N challenges per language")
+    parser.add_argument("--out", default="packs")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--overwrite", action="store_true", help="replace existing files")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    paths = config.get("paths", {})
+    catalog = Catalog.load(os.path.join(here, paths.get("armory", "armory")))
+    engine = TemplateEngine.from_file(
+        os.path.join(here, paths.get("templates", "armory/templates.json"))
+    )
+    calibrated = calibrated_difficulties(load_index(paths.get("calibration")))
+
+    if args.roster:
+        assignments = _roster_assignments(args.roster, args.language)
+    else:
+        assignments = _db_assignments(args.db or paths["progress_db"], args.language)
+
+    jobs = plan(assignments, catalog, args.out, engine.extensions,
+                args.per_recruit, args.difficulty)
+    renderer = PackRenderer(engine, lambda c: calibrated.get(c.key, c.difficulty))
+    report = generate(jobs, renderer, args.overwrite, args.workers)
+
+    print(f"{len(report.written)} files written, {len(report.skipped)} kept"
+          f" ({report.rendered} challenges rendered) in {report.seconds:.2f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+from typing import List, Optional
+
+from submission_store import canonicalize, content_hash
+
+
+# =====================================================================
+# PRE-SCREEN - Instant local checks before Sergeant Tux sees the code
+# =====================================================================
+#
+# Runs on every save in watch mode, so it must stay cheap and offline:
+#
+#   - TODO markers from the challenge template still in the file
+#   - how many lines of actual code there are (not blank, not starting
+#     with the language's comment token - TemplateEngine.comment())
+#   - Python: does it compile?
+#   - brace languages: are (), [] and {} balanced (strings and comments
+#     skipped)?
+#
+# The fingerprint is the submission store's canonical hash, so saving
+# without real changes (whitespace, line endings) is not "new code".
+
+
+BRACE_LANGUAGES = {
+    "C", "C++", "C#", "Holy C", "JavaScript", "Go", "Rust", "Kotlin", "Swift",
+    "Scala", "Dart", "PHP", "Zig", "D",
+}
+
+TODO_MARKER = "TODO:"
+
+
+class PreScreen:
+    """Result of the local checks on one version of a file"""
+
+    __slots__ = ("fingerprint", "todos", "code_lines", "issues")
+
+    def __init__(self, fingerprint: str, todos: int, code_lines: int, issues: List[str]):
+        self.fingerprint = fingerprint
+        self.todos = todos
+        self.code_lines = code_lines
+        self.issues = issues
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def summary(self) -> str:
+        parts = [f"{self.code_lines} lines of code"]
+        if self.todos:
+            parts.append(f"{self.todos} TODO{'s' if self.todos != 1 else ''} left")
+        parts += self.issues
+        if self.ok and not self.todos:
+            parts.append("looks ready")
+        return ", ".join(parts)
+
+
+def fingerprint(code: str) -> str:
+    """Hex content fingerprint - same as SubmissionStore's blob hash"""
+    return content_hash(canonicalize(code)).hex()
+
+
+def prescreen(language: str, code: str, comment: str = "#") -> PreScreen:
+    canonical = canonicalize(code)
+    lines = canonical.split("\n")
+    todos = sum(1 for line in lines if TODO_MARKER in line)
+    code_lines = sum(1 for line in lines
+                     if line.strip() and not (comment and line.lstrip().startswith(comment)))
+
+    issues: List[str] = []
+    if language == "Python":
+        issue = _python_syntax(canonical)
+        if issue:
+            issues.append(issue)
+    elif language in BRACE_LANGUAGES:
+        issue = _unbalanced(canonical, lifetimes=language == "Rust")
+        if issue:
+            issues.append(issue)
+    return PreScreen(content_hash(canonical).hex(), todos, code_lines, issues)
+
+
+def _python_syntax(code: str) -> Optional[str]:
+    try:
+        compile(code, "<challenge>", "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return f"syntax error on line {e.lineno}: {e.msg}"
+    except ValueError as e:  # e.g. null bytes
+        return f"cannot compile: {e}"
+    return None
+
+
+_CLOSERS = {")": "(", "]": "[", "}": "{"}
+
+
+def _unbalanced(code: str, lifetimes: bool = False) -> Optional[str]:
+    """First unbalanced bracket, skipping strings and // /* */ comments
+
+    With lifetimes (Rust), a ' only opens a char literal ('x', '\\n');
+    otherwise it is a lifetime or loop label ('a, 'outer).
+    """
+    stack: List[tuple] = []
+    line = 1
+    i, n = 0, len(code)
+    while i < n:
+        ch = code[i]
+        if ch == "\n":
+            line += 1
+        elif code.startswith("//", i):
+            i = code.find("\n", i)
+            if i < 0:
+                break
+            continue
+        elif code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            line += code.count("\n", i, end)
+            i = end
+            continue
+        elif ch == "'" and lifetimes and not (
+                code.startswith("\\", i + 1) or code.startswith("'", i + 2)):
+            pass  # 'a: nothing to skip
+        elif ch in "\"'`":
+            i += 1
+            while i < n and code[i] != ch and code[i] != "\n":
+                i += 2 if code[i] == "\\" else 1
+        elif ch in "([{":
+            stack.append((ch, line))
+        elif ch in _CLOSERS:
+            if not stack or stack[-1][0] != _CLOSERS[ch]:
+                return f"unexpected '{ch}' on line {line}"
+            stack.pop()
+        i += 1
+    if stack:
+        opener, opened = stack[-1]
+        return f"'{opener}' on line {opened} is never closed"
+    return None
@@ -0,0 +1,396 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# =====================================================================
+# PROGRESS STORE - Recruit progress that survives closing the window
+# =====================================================================
+#
+# SQLite in WAL mode, so the UI can read while the writer thread commits.
+# Nothing is written on the Tk thread: callers stage snapshots and
+# submissions, and flush() hands the whole batch to a background writer
+# that commits it in ONE transaction. Staging the same recruit twice
+# before a flush only keeps the newest snapshot.
+#
+# A write that fails with a transient error ("database is locked", disk
+# I/O) is retried with exponential backoff; if it still fails, the batch
+# is re-staged under anything newer, so the next flush() (or close())
+# tries again. Failures are reported to on_error(error, kept) - kept is
+# False only for errors retrying can't fix - or logged without one.
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recruits (
+    id                      INTEGER PRIMARY KEY,
+    name                    TEXT NOT NULL UNIQUE,
+    joined_date             TEXT NOT NULL,
+    motivation_level        INTEGER NOT NULL,
+    decision_struggle_count INTEGER NOT NULL DEFAULT 0,
+    streak_days             INTEGER NOT NULL DEFAULT 0,
+    last_session            TEXT,
+    last_active_at          REAL NOT NULL DEFAULT 0,
+    last_submission_at      REAL NOT NULL DEFAULT 0,
+    updated_at              REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS recruit_languages (
+    recruit_id  INTEGER NOT NULL REFERENCES recruits(id),
+    language    TEXT NOT NULL,
+    position    INTEGER NOT NULL,
+    completed   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (recruit_id, language)
+);
+
+CREATE TABLE IF NOT EXISTS challenges (
+    key         TEXT PRIMARY KEY,
+    language    TEXT NOT NULL,
+    name        TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS challenge_attempts (
+    recruit_id      INTEGER NOT NULL REFERENCES recruits(id),
+    challenge_key   TEXT NOT NULL REFERENCES challenges(key),
+    attempts        INTEGER NOT NULL,
+    PRIMARY KEY (recruit_id, challenge_key)
+);
+
+CREATE TABLE IF NOT EXISTS submissions (
+    id              INTEGER PRIMARY KEY,
+    recruit_id      INTEGER NOT NULL REFERENCES recruits(id),
+    challenge_key   TEXT NOT NULL REFERENCES challenges(key),
+    submitted_at    REAL NOT NULL,
+    correct         INTEGER NOT NULL,
+    completeness    INTEGER NOT NULL,
+    quality_score   INTEGER NOT NULL,
+    emotion         TEXT NOT NULL,
+    summary         TEXT,
+    analysis        TEXT
+);
+
+CREATE INDEX IF NOT EXISTS submissions_by_recruit
+    ON submissions (recruit_id, submitted_at);
+
+CREATE INDEX IF NOT EXISTS submissions_by_recruit_challenge
+    ON submissions (recruit_id, challenge_key, submitted_at);
+"""
+
+# Columns added after the first release: (name, definition)
+MIGRATIONS = (
+    ("last_active_at", "REAL NOT NULL DEFAULT 0"),
+    ("last_submission_at", "REAL NOT NULL DEFAULT 0"),
+)
+
+# Indexes the instructor roster queries lean on
+ROSTER_INDEXES = """
+CREATE INDEX IF NOT EXISTS recruits_by_motivation
+    ON recruits (motivation_level, id);
+CREATE INDEX IF NOT EXISTS recruits_by_last_active
+    ON recruits (last_active_at, id);
+CREATE INDEX IF NOT EXISTS recruits_by_last_submission
+    ON recruits (last_submission_at, id);
+CREATE INDEX IF NOT EXISTS recruit_languages_by_language
+    ON recruit_languages (language, recruit_id);
+"""
+
+
+WRITE_RETRIES = 3
+RETRY_BACKOFF = 0.05  # seconds before the first retry, doubled after each
+
+ErrorCallback = Callable[[sqlite3.Error, bool], None]
+
+
+def challenge_key(language: str, challenge_name: str) -> str:
+    """Same 'Language/Name' key the catalog uses"""
+    return f"{language}/{challenge_name}"
+
+
+class ProgressStore:
+    """SQLite-backed recruit progress with batched, off-thread writes"""
+
+    def __init__(self, db_path: str, on_error: Optional[ErrorCallback] = None):
+        self.db_path = os.path.expanduser(db_path)
+        self.on_error = on_error
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Reads happen on the caller's thread with their own connection
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._migrate(self._reader)
+
+        self._lock = threading.Lock()
+        self._pending_recruits: Dict[str, Dict[str, Any]] = {}
+        self._pending_submissions: List[Dict[str, Any]] = []
+
+        self._batches: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer",
+                                        daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(recruits)")}
+        with conn:
+            for name, definition in MIGRATIONS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE recruits ADD COLUMN {name} {definition}")
+            conn.executescript(ROSTER_INDEXES)
+
+    # -----------------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------------
+
+    def load_recruit(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a recruit record (see StudentProgress.to_record) or None"""
+        with self._lock:
+            staged = self._pending_recruits.get(name)
+        if staged is not None:
+            return dict(staged)
+
+        row = self._reader.execute(
+            "SELECT id, joined_date, motivation_level, decision_struggle_count,"
+            " streak_days, last_session FROM recruits WHERE name = ?",
+            (name,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        recruit_id = row[0]
+        languages = self._reader.execute(
+            "SELECT language, completed FROM recruit_languages"
+            " WHERE recruit_id = ? ORDER BY position",
+            (recruit_id,),
+        ).fetchall()
+        attempts = self._reader.execute(
+            "SELECT challenge_key, attempts FROM challenge_attempts WHERE recruit_id = ?",
+            (recruit_id,),
+        ).fetchall()
+
+        return {
+            "name": name,
+            "joined_date": row[1],
+            "motivation_level": row[2],
+            "decision_struggle_count": row[3],
+            "streak_days": row[4],
+            "last_session": row[5],
+            "languages_started": [lang for lang, _ in languages],
+            "languages_completed": [lang for lang, done in languages if done],
+            "completion_attempts": dict(attempts),
+        }
+
+    def submission_history(self, name: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent graded submissions for a recruit, newest first"""
+        rows = self._reader.execute(
+            "SELECT s.challenge_key, s.submitted_at, s.correct, s.completeness,"
+            " s.quality_score, s.emotion, s.summary"
+            " FROM submissions s JOIN recruits r ON r.id = s.recruit_id"
+            " WHERE r.name = ? ORDER BY s.submitted_at DESC LIMIT ?",
+            (name, limit),
+        ).fetchall()
+        columns = ("challenge_key", "submitted_at", "correct", "completeness",
+                   "quality_score", "emotion", "summary")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def iter_graded(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Every stored grade as (recruit, challenge key, result), oldest first"""
+        rows = self._reader.execute(
+            "SELECT r.name, s.challenge_key, s.correct, s.completeness, s.quality_score"
+            " FROM submissions s JOIN recruits r ON r.id = s.recruit_id ORDER BY s.id"
+        )
+        for name, key, correct, completeness, quality_score in rows:
+            yield name, key, {"correct": bool(correct), "completeness": completeness,
+                              "quality_score": quality_score}
+
+    # -----------------------------------------------------------------
+    # Staging (cheap, safe to call from the Tk thread)
+    # -----------------------------------------------------------------
+
+    def stage_recruit(self, record: Dict[str, Any]):
+        """Queue a recruit snapshot; later snapshots replace earlier ones"""
+        with self._lock:
+            self._pending_recruits[record["name"]] = record
+
+    def stage_submission(self, name: str, language: str, challenge_name: str,
+                         result: Dict[str, Any]):
+        """Queue one graded submission (a result from CodeAnalyzer)"""
+        with self._lock:
+            self._pending_submissions.append({
+                "name": name,
+                "language": language,
+                "challenge_name": challenge_name,
+                "submitted_at": time.time(),
+                "result": result,
+            })
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending_recruits or self._pending_submissions)
+
+    def flush(self):
+        """Hand everything staged so far to the writer thread"""
+        batch = self._take_pending()
+        if batch:
+            self._batches.put(batch)
+
+    def _take_pending(self) -> Optional[tuple]:
+        with self._lock:
+            if not (self._pending_recruits or self._pending_submissions):
+                return None
+            batch = (self._pending_recruits, self._pending_submissions)
+            self._pending_recruits = {}
+            self._pending_submissions = []
+        return batch
+
+    def _restage(self, batch: tuple):
+        """Put a failed batch back, under anything staged since"""
+        recruits, submissions = batch
+        with self._lock:
+            recruits = dict(recruits)
+            recruits.update(self._pending_recruits)
+            self._pending_recruits = recruits
+            self._pending_submissions = submissions + self._pending_submissions
+
+    def close(self):
+        """Flush, wait for the writer to finish and close the database"""
+        self.flush()
+        self._batches.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    # -----------------------------------------------------------------
+    # Writer thread
+    # -----------------------------------------------------------------
+
+    def _write_loop(self):
+        conn = self._connect()
+        try:
+            while True:
+                batch = self._batches.get()
+                if batch is None:
+                    # Closing: last chance for a batch re-staged after a failure
+                    batch = self._take_pending()
+                    if batch:
+                        self._write(conn, batch, restage=False)
+                    break
+                self._write(conn, batch)
+        finally:
+            conn.close()
+
+    def _write(self, conn, batch: tuple, restage: bool = True):
+        """Commit one batch, retrying transient errors with backoff"""
+        delay = RETRY_BACKOFF
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                with conn:
+                    self._write_batch(conn, *batch)
+                return
+            except sqlite3.OperationalError as e:  # locked, busy, disk I/O
+                error = e
+                if attempt < WRITE_RETRIES:
+                    time.sleep(delay)
+                    delay *= 2
+            except sqlite3.Error as e:  # e.g. a constraint: retrying can't help
+                self._report(e, False)
+                return
+        if restage:
+            self._restage(batch)
+        self._report(error, restage)
+
+    def _report(self, error: sqlite3.Error, kept: bool):
+        if self.on_error is not None:
+            try:
+                self.on_error(error, kept)
+                return
+            except Exception:
+                pass  # a broken callback must not kill the writer
+        import logging
+
+        logging.getLogger(__name__).warning(
+            "progress write failed (%s): %s",
+            "kept for the next flush" if kept else "batch dropped", error,
+        )
+
+    def _recruit_id(self, conn, name: str) -> int:
+        row = conn.execute("SELECT id FROM recruits WHERE name = ?", (name,)).fetchone()
+        if row:
+            return row[0]
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        return conn.execute(
+            "INSERT INTO recruits (name, joined_date, motivation_level, updated_at)"
+            " VALUES (?, ?, 50, ?)",
+            (name, now, time.time()),
+        ).lastrowid
+
+    def _write_batch(self, conn, recruits: Dict[str, Dict[str, Any]],
+                     submissions: List[Dict[str, Any]]):
+        for record in recruits.values():
+            recruit_id = self._recruit_id(conn, record["name"])
+            last_session = record["last_session"]
+            last_active = datetime.fromisoformat(last_session).timestamp() if last_session else 0
+            conn.execute(
+                "UPDATE recruits SET joined_date = ?, motivation_level = ?,"
+                " decision_struggle_count = ?, streak_days = ?, last_session = ?,"
+                " last_active_at = ?, updated_at = ? WHERE id = ?",
+                (record["joined_date"], record["motivation_level"],
+                 record["decision_struggle_count"], record["streak_days"],
+                 last_session, last_active, time.time(), recruit_id),
+            )
+
+            completed = set(record["languages_completed"])
+            conn.execute("DELETE FROM recruit_languages WHERE recruit_id = ?", (recruit_id,))
+            conn.executemany(
+                "INSERT INTO recruit_languages (recruit_id, language, position, completed)"
+                " VALUES (?, ?, ?, ?)",
+                [(recruit_id, lang, i, lang in completed)
+                 for i, lang in enumerate(record["languages_started"])],
+            )
+
+            for key, attempts in record["completion_attempts"].items():
+                language, _, name = key.partition("/")
+                conn.execute(
+                    "INSERT OR IGNORE INTO challenges (key, language, name) VALUES (?, ?, ?)",
+                    (key, language, name),
+                )
+                conn.execute(
+                    "INSERT INTO challenge_attempts (recruit_id, challenge_key, attempts)"
+                    " VALUES (?, ?, ?) ON CONFLICT (recruit_id, challenge_key)"
+                    " DO UPDATE SET attempts = excluded.attempts",
+                    (recruit_id, key, attempts),
+                )
+
+        for sub in submissions:
+            recruit_id = self._recruit_id(conn, sub["name"])
+            key = challenge_key(sub["language"], sub["challenge_name"])
+            result = sub["result"]
+            conn.execute(
+                "INSERT OR IGNORE INTO challenges (key, language, name) VALUES (?, ?, ?)",
+                (key, sub["language"], sub["challenge_name"]),
+            )
+            conn.execute(
+                "INSERT INTO submissions (recruit_id, challenge_key, submitted_at, correct,"
+                " completeness, quality_score, emotion, summary, analysis)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (recruit_id, key, sub["submitted_at"], bool(result.get("correct")),
+                 int(result.get("completeness", 0)), int(result.get("quality_score", 0)),
+                 result.get("tux_emotion", "neutral"), result.get("summary", ""),
+                 json.dumps(result)),
+            )
+            conn.execute(
+                "UPDATE recruits SET last_submission_at = MAX(last_submission_at, ?)"
+                " WHERE id = ?",
+                (sub["submitted_at"], recruit_id),
+            )
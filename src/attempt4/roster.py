@@ -0,0 +1,293 @@
+import argparse
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from progress_store import ProgressStore
+
+
+# =====================================================================
+# ROSTER - Instructor view over every recruit in the progress database
+# =====================================================================
+#
+# The app tracks one recruit per process; instructors need the whole
+# cohort. The roster reads the same SQLite file ProgressStore writes and
+# only runs queries the indexes can answer:
+#
+#   name prefix        -> recruits.name (UNIQUE)
+#   language           -> recruit_languages (language, recruit_id)
+#   motivation band    -> recruits (motivation_level, id)
+#   last activity      -> recruits (last_active_at, id)
+#   last submission    -> recruits (last_submission_at, id)
+#
+# Pages use keyset pagination (WHERE (sort, id) > cursor), so page 200 is
+# as cheap as page 1.
+
+
+DAY = 86400
+
+# motivation.thresholds from command.json: a level is in the first band
+# whose threshold is above it ("high" also takes the maximum)
+DEFAULT_THRESHOLDS = {"low": 20, "medium_low": 50, "medium_high": 80, "high": 100}
+
+# order_by name -> column; every one is indexed together with the id
+SORT_COLUMNS = {
+    "name": "r.name",
+    "motivation": "r.motivation_level",
+    "last_active": "r.last_active_at",
+    "last_submission": "r.last_submission_at",
+}
+
+
+class RosterEntry:
+    """One recruit as the roster shows it"""
+
+    __slots__ = ("id", "name", "motivation_level", "band", "streak_days",
+                 "last_active_at", "last_submission_at", "languages")
+
+    def __init__(self, row: tuple, band: str, languages: List[str]):
+        (self.id, self.name, self.motivation_level, self.streak_days,
+         self.last_active_at, self.last_submission_at) = row
+        self.band = band
+        self.languages = languages
+
+    def __repr__(self):
+        return f"RosterEntry({self.name!r}, {self.motivation_level}, {self.band!r})"
+
+
+class RosterPage(NamedTuple):
+    entries: List[RosterEntry]
+    # Pass back as `cursor` for the next page; None on the last page
+    next_cursor: Optional[Tuple[Any, int]]
+
+
+class Roster:
+    """Paginated, index-backed queries over every recruit"""
+
+    PAGE_SIZE = 50
+
+    def __init__(self, db_path: str, thresholds: Optional[Dict[str, int]] = None):
+        self.db_path = os.path.expanduser(db_path)
+        # Opening a store once creates/migrates the schema and indexes
+        if not os.path.exists(self.db_path):
+            ProgressStore(self.db_path).close()
+        else:
+            conn = sqlite3.connect(self.db_path)
+            ProgressStore._migrate(conn)
+            conn.close()
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA query_only=ON")
+
+        thresholds = thresholds or DEFAULT_THRESHOLDS
+        self._bands = sorted(thresholds.items(), key=lambda item: item[1])
+
+    @classmethod
+    def from_config(cls, config) -> "Roster":
+        """Roster for the database and bands configured in command.json"""
+        return cls(config.get("paths", "progress_db", default="~/.tux_boot_camp/progress.db"),
+                   config.get("motivation", "thresholds"))
+
+    def close(self):
+        self._conn.close()
+
+    # -----------------------------------------------------------------
+    # Motivation bands
+    # -----------------------------------------------------------------
+
+    def band(self, level: int) -> str:
+        """Name of the band a motivation level falls in"""
+        for name, threshold in self._bands:
+            if level < threshold:
+                return name
+        return self._bands[-1][0]
+
+    def band_range(self, band: str) -> Tuple[int, int]:
+        """[low, high) motivation range of a band"""
+        low = 0
+        for i, (name, threshold) in enumerate(self._bands):
+            if name == band:
+                last = i == len(self._bands) - 1
+                return low, threshold + 1 if last else threshold
+            low = threshold
+        raise ValueError(f"Unknown motivation band: {band}")
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def query(self, name_prefix: Optional[str] = None, language: Optional[str] = None,
+              band: Optional[str] = None, min_motivation: Optional[int] = None,
+              below_motivation: Optional[int] = None,
+              no_submission_days: Optional[float] = None,
+              inactive_days: Optional[float] = None,
+              order_by: str = "name", page_size: Optional[int] = None,
+              cursor: Optional[Tuple[Any, int]] = None) -> RosterPage:
+        """One page of recruits matching every filter given"""
+        where, params = self._filters(name_prefix, language, band, min_motivation,
+                                      below_motivation, no_submission_days, inactive_days)
+
+        column = SORT_COLUMNS.get(order_by)
+        if column is None:
+            raise ValueError(f"Cannot order the roster by {order_by!r}")
+        if cursor is not None:
+            where.append(f"({column}, r.id) > (?, ?)")
+            params.extend(cursor)
+
+        page_size = page_size or self.PAGE_SIZE
+        sql = ("SELECT r.id, r.name, r.motivation_level, r.streak_days,"
+               " r.last_active_at, r.last_submission_at, " + column + " FROM recruits r")
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {column}, r.id LIMIT ?"
+        # One extra row tells us whether there is a next page
+        rows = self._conn.execute(sql, params + [page_size + 1]).fetchall()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = (rows[-1][-1], rows[-1][0])
+
+        languages = self._languages_for([row[0] for row in rows])
+        entries = [RosterEntry(row[:-1], self.band(row[2]), languages.get(row[0], []))
+                   for row in rows]
+        return RosterPage(entries, next_cursor)
+
+    def count(self, **filters) -> int:
+        """How many recruits match (same filters as query())"""
+        where, params = self._filters(**filters)
+        sql = "SELECT COUNT(*) FROM recruits r"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._conn.execute(sql, params).fetchone()[0]
+
+    def pages(self, **kwargs):
+        """Iterate page by page through everything a query matches"""
+        cursor = kwargs.pop("cursor", None)
+        while True:
+            page = self.query(cursor=cursor, **kwargs)
+            yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def no_submission_since(self, days: float, **kwargs) -> RosterPage:
+        """Recruits who haven't submitted code in `days` days, stalest first"""
+        kwargs.setdefault("order_by", "last_submission")
+        return self.query(no_submission_days=days, **kwargs)
+
+    def struggling(self, language: Optional[str] = None, below: Optional[int] = None,
+                   **kwargs) -> RosterPage:
+        """Recruits below a motivation level (default: the 'low' band)"""
+        if below is None:
+            below = self._bands[0][1]
+        kwargs.setdefault("order_by", "motivation")
+        return self.query(language=language, below_motivation=below, **kwargs)
+
+    # -----------------------------------------------------------------
+    # Helpers
+    # -----------------------------------------------------------------
+
+    def _filters(self, name_prefix=None, language=None, band=None, min_motivation=None,
+                 below_motivation=None, no_submission_days=None, inactive_days=None):
+        where: List[str] = []
+        params: List[Any] = []
+
+        if name_prefix:
+            # A range instead of LIKE so the UNIQUE name index is used
+            where.append("r.name >= ? AND r.name < ?")
+            params += [name_prefix, name_prefix + "\U0010ffff"]
+        if language:
+            where.append("r.id IN (SELECT recruit_id FROM recruit_languages"
+                         " WHERE language = ?)")
+            params.append(language)
+        if band:
+            low, high = self.band_range(band)
+            min_motivation = low if min_motivation is None else max(min_motivation, low)
+            below_motivation = high if below_motivation is None else min(below_motivation, high)
+        if min_motivation is not None:
+            where.append("r.motivation_level >= ?")
+            params.append(min_motivation)
+        if below_motivation is not None:
+            where.append("r.motivation_level < ?")
+            params.append(below_motivation)
+
+        now = time.time()
+        if no_submission_days is not None:
+            # Recruits who never submitted have last_submission_at = 0
+            where.append("r.last_submission_at < ?")
+            params.append(now - no_submission_days * DAY)
+        if inactive_days is not None:
+            where.append("r.last_active_at < ?")
+            params.append(now - inactive_days * DAY)
+
+        return where, params
+
+    def _languages_for(self, recruit_ids: List[int]) -> Dict[int, List[str]]:
+        if not recruit_ids:
+            return {}
+        marks = ",".join("?" * len(recruit_ids))
+        rows = self._conn.execute(
+            f"SELECT recruit_id, language FROM recruit_languages"
+            f" WHERE recruit_id IN ({marks}) ORDER BY recruit_id, position",
+            recruit_ids,
+        ).fetchall()
+        languages: Dict[int, List[str]] = {}
+        for recruit_id, language in rows:
+            languages.setdefault(recruit_id, []).append(language)
+        return languages
+
+
+# =====================================================================
+# COMMAND LINE - python roster.py --language Rust --below 20
+# =====================================================================
+
+
+def _format_time(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else "never"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp instructor roster")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--name", help="name prefix")
+    parser.add_argument("--language")
+    parser.add_argument("--band", help="motivation band (low, medium_low, ...)")
+    parser.add_argument("--below", type=int, help="motivation below this level")
+    parser.add_argument("--no-submission-days", type=float,
+                        help="no code submitted in this many days")
+    parser.add_argument("--inactive-days", type=float, help="no activity in this many days")
+    parser.add_argument("--order-by", choices=sorted(SORT_COLUMNS), default="name")
+    parser.add_argument("--page-size", type=int, default=Roster.PAGE_SIZE)
+    parser.add_argument("--all", action="store_true", help="print every page")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    db_path = args.db or config["paths"]["progress_db"]
+    roster = Roster(db_path, config.get("motivation", {}).get("thresholds"))
+
+    filters = dict(name_prefix=args.name, language=args.language, band=args.band,
+                   below_motivation=args.below,
+                   no_submission_days=args.no_submission_days,
+                   inactive_days=args.inactive_days)
+    print(f"{roster.count(**filters)} recruits match")
+
+    for page in roster.pages(order_by=args.order_by, page_size=args.page_size, **filters):
+        for entry in page.entries:
+            print(f"  {entry.name:<24} {entry.motivation_level:>3} {entry.band:<12}"
+                  f" active {_format_time(entry.last_active_at):<16}"
+                  f" submitted {_format_time(entry.last_submission_at):<16}"
+                  f" {', '.join(entry.languages)}")
+        if not args.all:
+            break
+    roster.close()
+
+
+if __name__ == "__main__":
+    main()
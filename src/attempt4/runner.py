@@ -0,0 +1,377 @@
+import argparse
+import codecs
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+# =====================================================================
+# RUNNER - Recruit code runs in its own process, never in ours
+# =====================================================================
+#
+# Every run gets a fresh process in a throwaway working directory with
+# hard limits applied via resource.setrlimit before the code starts:
+#
+#   cpu_seconds   RLIMIT_CPU    runaway loops die with SIGXCPU
+#   memory_mb     RLIMIT_AS     allocations fail (MemoryError); 0 = no
+#                               limit, for runtimes that reserve huge
+#                               address ranges up front (node, go)
+#   file_mb       RLIMIT_FSIZE  no filling the disk
+#   (core dumps)  RLIMIT_CORE   0
+#
+# and two limits the parent enforces while streaming the output:
+#
+#   wall_seconds  sleeping / blocked code is killed too
+#   output_kb     print-forever is killed once it has said enough
+#
+# Python runs go to a WorkerPool of pre-started interpreters: each
+# worker is spawned ahead of time and blocks reading its job, so a run
+# only pays for a pipe write. A worker runs ONE job and exits (recruit
+# code may leave anything behind in its interpreter); the pool starts
+# its replacement in the background. run_argv() applies the same limits
+# to any command (compiled programs, other interpreters).
+#
+# Output is streamed as it arrives: on_output(stream, text) is called
+# from reader threads - Tk callers must hop to the UI thread themselves.
+#
+# No `resource` module (Windows): only the wall and output limits apply.
+
+
+DEFAULT_LIMITS = {
+    "cpu_seconds": 5,
+    "wall_seconds": 10,
+    "memory_mb": 256,
+    "file_mb": 1,
+    "output_kb": 64,
+}
+
+OutputCallback = Callable[[str, str], None]
+
+
+def _resource():
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource
+
+
+class RunLimits:
+    """Per-run resource limits"""
+
+    __slots__ = tuple(DEFAULT_LIMITS)
+
+    def __init__(self, **limits: float):
+        for key, value in dict(DEFAULT_LIMITS, **limits).items():
+            setattr(self, key, value)
+
+    @classmethod
+    def from_config(cls, config) -> "RunLimits":
+        return cls(**{key: config.get("runner", key, default=value)
+                      for key, value in DEFAULT_LIMITS.items()})
+
+    def as_dict(self) -> Dict[str, float]:
+        return {key: getattr(self, key) for key in DEFAULT_LIMITS}
+
+    def replace(self, **changes: float) -> "RunLimits":
+        return RunLimits(**dict(self.as_dict(), **changes))
+
+    def apply(self):
+        """setrlimit in the child, before the recruit's code runs"""
+        resource = _resource()
+        if resource is None:
+            return
+        cpu = int(self.cpu_seconds)
+        limits = [
+            (resource.RLIMIT_CPU, (cpu, cpu + 1)),
+            (resource.RLIMIT_FSIZE, (int(self.file_mb * 1024 * 1024),) * 2),
+            (resource.RLIMIT_CORE, (0, 0)),
+        ]
+        if self.memory_mb and hasattr(resource, "RLIMIT_AS"):
+            limits.append((resource.RLIMIT_AS, (int(self.memory_mb * 1024 * 1024),) * 2))
+        for which, value in limits:
+            try:
+                resource.setrlimit(which, value)
+            except (ValueError, OSError):
+                pass  # cannot raise above the hard limit we were given
+
+
+class RunResult:
+    """How a run ended, and everything it printed"""
+
+    __slots__ = ("returncode", "stdout", "stderr", "killed", "duration_ms", "start_ms")
+
+    def __init__(self, returncode: Optional[int], stdout: str, stderr: str,
+                 killed: Optional[str], duration_ms: float, start_ms: float):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.killed = killed  # None, "timeout", "output", "cpu"
+        self.duration_ms = duration_ms
+        self.start_ms = start_ms
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and self.killed is None
+
+    def describe(self) -> str:
+        if self.killed == "timeout":
+            return "killed: ran out of time"
+        if self.killed == "output":
+            return "killed: too much output"
+        if self.killed == "cpu":
+            return "killed: CPU time limit"
+        return f"exit code {self.returncode}"
+
+    def __repr__(self):
+        return f"RunResult({self.describe()}, {self.duration_ms:.0f}ms)"
+
+
+# ---------------------------------------------------------------------
+# Supervising a child process
+# ---------------------------------------------------------------------
+
+def _kill(process: subprocess.Popen):
+    try:
+        if os.name == "nt":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _supervise(process: subprocess.Popen, limits: RunLimits, stdin: bytes,
+               on_output: Optional[OutputCallback], started: float,
+               start_ms: float) -> RunResult:
+    """Feed stdin, stream output, kill on wall time or output limit"""
+    budget = [int(limits.output_kb * 1024)]
+    killed: List[Optional[str]] = [None]
+    chunks: Dict[str, List[str]] = {"stdout": [], "stderr": []}
+    lock = threading.Lock()
+
+    def read(stream, name):
+        # Incremental: a character split across two reads stays whole
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            data = os.read(stream.fileno(), 4096)
+            if not data:
+                break
+            with lock:
+                if killed[0]:
+                    continue  # drain, but drop
+                if len(data) > budget[0]:
+                    data = data[:max(budget[0], 0)]
+                    killed[0] = "output"
+                budget[0] -= len(data)
+            text = decoder.decode(data)
+            chunks[name].append(text)
+            if on_output and text:
+                on_output(name, text)
+            if killed[0] == "output":
+                _kill(process)
+        text = decoder.decode(b"", final=True)
+        if text:
+            chunks[name].append(text)
+            if on_output:
+                on_output(name, text)
+        stream.close()
+
+    readers = [threading.Thread(target=read, args=(process.stdout, "stdout"), daemon=True),
+               threading.Thread(target=read, args=(process.stderr, "stderr"), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        if stdin:
+            process.stdin.write(stdin)
+        process.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass  # it exited (or stopped reading) before taking its input
+
+    deadline = started + limits.wall_seconds
+    try:
+        process.wait(max(0.0, deadline - time.perf_counter()))
+    except subprocess.TimeoutExpired:
+        with lock:
+            killed[0] = killed[0] or "timeout"
+        _kill(process)
+        process.wait()
+    _kill(process)  # whatever it forked goes too (and lets go of the pipes)
+    for reader in readers:
+        reader.join(1.0)
+
+    returncode = process.returncode
+    if killed[0] is None and os.name != "nt" and returncode in (-signal.SIGXCPU,
+                                                                  -signal.SIGKILL):
+        killed[0] = "cpu"
+    return RunResult(returncode, "".join(chunks["stdout"]), "".join(chunks["stderr"]),
+                     killed[0], (time.perf_counter() - started) * 1000, start_ms)
+
+
+def _popen(argv: Sequence[str], cwd: Optional[str], preexec=None,
+           env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    return subprocess.Popen(
+        list(argv),
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=True,
+        start_new_session=os.name != "nt",
+        preexec_fn=preexec if os.name != "nt" else None,
+    )
+
+
+def run_argv(argv: Sequence[str], limits: Optional[RunLimits] = None, stdin: bytes = b"",
+             cwd: Optional[str] = None, on_output: Optional[OutputCallback] = None,
+             env: Optional[Dict[str, str]] = None) -> RunResult:
+    """Run any command under the limits (blocking; call from a worker thread)"""
+    limits = limits or RunLimits()
+    started = time.perf_counter()
+    try:
+        process = _popen(argv, cwd, limits.apply, env)
+    except OSError as e:
+        return RunResult(None, "", f"cannot start {argv[0]}: {e}\n", None, 0.0, 0.0)
+    return _supervise(process, limits, stdin, on_output, started,
+                      (time.perf_counter() - started) * 1000)
+
+
+# ---------------------------------------------------------------------
+# Pre-started Python workers
+# ---------------------------------------------------------------------
+
+def _worker_argv() -> List[str]:
+    # -I: ignore PYTHON* env vars, user site and the cwd; -u: stream output
+    return [sys.executable, "-I", "-u", os.path.abspath(__file__), "--worker"]
+
+
+def _worker():
+    """Child side: wait for one job, lock down, run it"""
+    header = sys.stdin.buffer.readline()
+    if not header:
+        return  # pool shut down before using us
+    job = json.loads(header)
+    os.chdir(job["cwd"])
+    RunLimits(**job["limits"]).apply()
+    sys.argv = ["main.py"]
+    sys.path[0:0] = [job["cwd"]]
+    namespace = {"__name__": "__main__", "__file__": "main.py", "__builtins__": __builtins__}
+    del header
+    try:
+        exec(compile(job.pop("code"), "main.py", "exec", dont_inherit=True), namespace)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        # The recruit's traceback, without this function's frame
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        sys.exit(1)
+
+
+class WorkerPool:
+    """Warm Python interpreters, one job each"""
+
+    def __init__(self, size: int = 2, limits: Optional[RunLimits] = None):
+        self.size = max(1, size)
+        self.limits = limits or RunLimits()
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._refill()
+
+    @classmethod
+    def from_config(cls, config) -> "WorkerPool":
+        return cls(config.get("runner", "workers", default=2), RunLimits.from_config(config))
+
+    def _spawn(self) -> subprocess.Popen:
+        return _popen(_worker_argv(), None)
+
+    def _refill(self):
+        with self._lock:
+            while not self._closed and len(self._idle) < self.size:
+                self._idle.append(self._spawn())
+
+    def _take(self) -> subprocess.Popen:
+        with self._lock:
+            while self._idle:
+                process = self._idle.popleft()
+                if process.poll() is None:
+                    return process
+        return self._spawn()
+
+    def run(self, code: str, stdin: bytes = b"", on_output: Optional[OutputCallback] = None,
+            limits: Optional[RunLimits] = None) -> RunResult:
+        """Run Python source in a warm worker (blocking; call from a thread)"""
+        limits = limits or self.limits
+        started = time.perf_counter()
+        process = self._take()
+        threading.Thread(target=self._refill, daemon=True).start()
+
+        workdir = tempfile.mkdtemp(prefix="tux_run_")
+        try:
+            job = json.dumps({"code": code, "cwd": workdir, "limits": limits.as_dict()})
+            try:
+                process.stdin.write(job.encode("utf-8") + b"\n")
+                process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                pass  # surfaces as the worker's exit code
+            start_ms = (time.perf_counter() - started) * 1000
+            return _supervise(process, limits, stdin, on_output, started, start_ms)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for process in idle:
+            _kill(process)
+            process.wait()
+            for stream in (process.stdin, process.stdout, process.stderr):
+                stream.close()
+
+
+# =====================================================================
+# COMMAND LINE - python runner.py FILE.py [--stdin TEXT]
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp sandboxed runner")
+    parser.add_argument("file", help="Python file to run")
+    parser.add_argument("--stdin", default="", help="text fed to the program")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        runner = json.load(f).get("runner", {})
+    limits = RunLimits(**{k: v for k, v in runner.items() if k in DEFAULT_LIMITS})
+    pool = WorkerPool(1, limits)
+    try:
+        with open(args.file, "r", encoding="utf-8") as f:
+            code = f.read()
+        result = pool.run(code, args.stdin.encode("utf-8"),
+                          lambda stream, text: (sys.stdout if stream == "stdout"
+                                                else sys.stderr).write(text))
+        print(f"\n[{result.describe()} - started in {result.start_ms:.1f}ms,"
+              f" {result.duration_ms:.0f}ms total]")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--worker"]:
+        _worker()
+    else:
+        main()
@@ -0,0 +1,405 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from journal import journal_basename
+from packs import file_mode, safe_name
+from progress_store import ProgressStore
+
+
+# =====================================================================
+# SANDBOX ARCHIVE - One zip per recruit: code, submissions, journal
+# =====================================================================
+#
+#   files/<path>        the recruit's challenge files
+#   submissions.jsonl   every graded submission, verdict included
+#   journal.jsonl       the recruit's activity journal
+#   manifest.json       recruit, counts and a sha256 per member (last)
+#
+# Export streams every member straight into the zip (ZipFile.open "w"),
+# hashing as it goes - nothing is staged on disk and only one chunk or one
+# row is in memory at a time, however many attempts the recruit has.
+#
+# Import reads the manifest first and skips any file whose content is
+# already in the recruit's folder (by sha256, under any name); new files
+# are streamed to a temp file and renamed into place. Submissions are
+# deduplicated by a hash of the row, so importing twice adds nothing.
+# File names are untrusted: one that is absolute, contains ".." or has
+# no files/ member rejects the whole archive before anything is written.
+
+
+ARCHIVE_VERSION = 1
+CHUNK_SIZE = 1 << 16
+HEADER_BYTES = 4096  # enough of a challenge file to find its "Recruit:" line
+
+SUBMISSION_COLUMNS = ("challenge_key", "submitted_at", "correct", "completeness",
+                      "quality_score", "emotion", "summary", "analysis")
+
+
+# =====================================================================
+# EXPORT
+# =====================================================================
+
+
+def recruit_files(directory: str, recruit: str) -> Iterator[Tuple[str, str]]:
+    """(path on disk, path in the archive) for the recruit's files
+
+    A per-recruit folder (<directory>/<recruit>/, as packs.py writes) is
+    taken whole; otherwise files directly in <directory> count if their
+    header says "Recruit: <name>" (ChallengeFileManager's layout).
+    """
+    directory = os.path.expanduser(directory)
+    own = os.path.join(directory, safe_name(recruit))
+    if os.path.isdir(own):
+        for root, dirs, names in os.walk(own):
+            dirs.sort()
+            for name in sorted(names):
+                if not name.startswith("."):
+                    path = os.path.join(root, name)
+                    yield path, os.path.relpath(path, own).replace(os.sep, "/")
+        return
+
+    marker = f"Recruit: {recruit}".encode("utf-8")
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_file() and not entry.name.startswith("."):
+            with open(entry.path, "rb") as f:
+                head = f.read(HEADER_BYTES)
+            if any(line.rstrip().endswith(marker) for line in head.splitlines()):
+                yield entry.path, entry.name
+
+
+def _copy(source: BinaryIO, target: BinaryIO) -> Tuple[str, int]:
+    """Stream source into target; returns (sha256, bytes)"""
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return digest.hexdigest(), size
+        digest.update(chunk)
+        target.write(chunk)
+        size += len(chunk)
+
+
+def _member(name: str, mtime: Optional[float] = None) -> zipfile.ZipInfo:
+    """Zip entry stamped with a file's mtime (default: now)"""
+    info = zipfile.ZipInfo(name, time.localtime(mtime)[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def _submission_rows(conn: sqlite3.Connection, recruit: str,
+                     chunk_size: int = 1000) -> Iterator[tuple]:
+    rows = conn.execute(
+        f"SELECT {', '.join('s.' + c for c in SUBMISSION_COLUMNS)}"
+        " FROM submissions s JOIN recruits r ON r.id = s.recruit_id"
+        " WHERE r.name = ? ORDER BY s.submitted_at, s.id",
+        (recruit,),
+    )
+    while True:
+        chunk = rows.fetchmany(chunk_size)
+        if not chunk:
+            return
+        yield from chunk
+
+
+def export_sandbox(recruit: str, out: Union[str, BinaryIO], files_dir: Optional[str] = None,
+                   db_path: Optional[str] = None,
+                   journal_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Stream a recruit's sandbox into a zip (path or writable stream)"""
+    manifest: Dict[str, Any] = {
+        "version": ARCHIVE_VERSION,
+        "recruit": recruit,
+        "exported": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "files": {},
+        "submissions": 0,
+        "journal": None,
+    }
+
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        if files_dir:
+            for path, name in recruit_files(files_dir, recruit):
+                member = _member("files/" + name, os.path.getmtime(path))
+                with open(path, "rb") as source, zf.open(member, "w") as target:
+                    manifest["files"][name] = _copy(source, target)[0]
+
+        if db_path and os.path.exists(os.path.expanduser(db_path)):
+            conn = sqlite3.connect(os.path.expanduser(db_path))
+            try:
+                with zf.open(_member("submissions.jsonl"), "w") as target:
+                    for row in _submission_rows(conn, recruit):
+                        target.write(json.dumps(dict(zip(SUBMISSION_COLUMNS, row)),
+                                                ensure_ascii=False).encode("utf-8") + b"\n")
+                        manifest["submissions"] += 1
+            finally:
+                conn.close()
+
+        if journal_dir:
+            log_path = os.path.join(os.path.expanduser(journal_dir),
+                                    journal_basename(recruit) + ".jsonl")
+            if os.path.exists(log_path):
+                member = _member("journal.jsonl", os.path.getmtime(log_path))
+                with open(log_path, "rb") as source, zf.open(member, "w") as target:
+                    manifest["journal"] = _copy(source, target)[0]
+
+        zf.writestr("manifest.json", json.dumps(manifest, indent=1, ensure_ascii=False))
+    return manifest
+
+
+# =====================================================================
+# IMPORT
+# =====================================================================
+
+
+class ImportReport:
+    """What import_sandbox() did"""
+
+    __slots__ = ("recruit", "files_added", "files_duplicate", "submissions_added",
+                 "submissions_duplicate", "journal")
+
+    def __init__(self, recruit: str):
+        self.recruit = recruit
+        self.files_added: List[str] = []
+        self.files_duplicate: List[str] = []
+        self.submissions_added = 0
+        self.submissions_duplicate = 0
+        self.journal = "none"  # "none", "added", "identical" or "kept existing"
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hashes_under(directory: str) -> Set[str]:
+    hashes = set()
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if not name.startswith("."):
+                hashes.add(_file_hash(os.path.join(root, name)))
+    return hashes
+
+
+def _stream_to(zf: zipfile.ZipFile, member: str, path: str) -> str:
+    """Extract one member via a temp file + rename; returns its sha256"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with zf.open(member) as source, os.fdopen(fd, "wb") as target:
+            digest = _copy(source, target)[0]
+        os.chmod(tmp_path, file_mode(path))  # not mkstemp's 0600
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return digest
+
+
+def _free_path(path: str) -> str:
+    base, extension = os.path.splitext(path)
+    n = 1
+    while os.path.exists(path):
+        n += 1
+        path = f"{base}-{n}{extension}"
+    return path
+
+
+def _member_path(own: str, name: str, members: Set[str]) -> str:
+    """Where manifest file `name` goes under `own`; ValueError if it escapes"""
+    parts = name.split("/")
+    if (not name or name.startswith("/") or "\\" in name or ".." in parts
+            or os.path.isabs(name) or os.path.splitdrive(name)[0]):
+        raise ValueError(f"Unsafe file name in sandbox archive: {name!r}")
+    if "files/" + name not in members:
+        raise ValueError(f"Sandbox archive lists {name!r} but has no files/{name}")
+    path = os.path.realpath(os.path.join(own, *parts))
+    if os.path.commonpath([own, path]) != own:
+        raise ValueError(f"Unsafe file name in sandbox archive: {name!r}")
+    return path
+
+
+def _submission_hash(row: Dict[str, Any]) -> bytes:
+    return hashlib.sha256(json.dumps([row.get(c) for c in SUBMISSION_COLUMNS],
+                                     ensure_ascii=False).encode("utf-8")).digest()[:16]
+
+
+def import_sandbox(archive: str, files_dir: Optional[str] = None,
+                   db_path: Optional[str] = None, journal_dir: Optional[str] = None,
+                   recruit: Optional[str] = None, batch_size: int = 500) -> ImportReport:
+    """Stream an exported sandbox back in, skipping content already there"""
+    with zipfile.ZipFile(archive, "r") as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+        if manifest.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported sandbox archive version {manifest.get('version')}")
+        recruit = recruit or manifest["recruit"]
+        report = ImportReport(recruit)
+        members = set(zf.namelist())
+
+        if files_dir and manifest["files"]:
+            own = os.path.realpath(
+                os.path.join(os.path.expanduser(files_dir), safe_name(recruit)))
+            # Every name is checked before anything is written
+            paths = {name: _member_path(own, name, members) for name in manifest["files"]}
+            existing = _hashes_under(own)
+            for name, digest in manifest["files"].items():
+                if digest in existing:
+                    report.files_duplicate.append(name)
+                    continue
+                path = _free_path(paths[name])
+                existing.add(_stream_to(zf, "files/" + name, path))
+                report.files_added.append(name)
+
+        if db_path and "submissions.jsonl" in members:
+            _import_submissions(zf, db_path, recruit, report, batch_size)
+
+        if journal_dir and "journal.jsonl" in members:
+            journal_dir = os.path.expanduser(journal_dir)
+            log_path = os.path.join(journal_dir, journal_basename(recruit) + ".jsonl")
+            if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+                _stream_to(zf, "journal.jsonl", log_path)
+                report.journal = "added"
+            elif _file_hash(log_path) == manifest.get("journal"):
+                report.journal = "identical"
+            else:
+                # Merging two diverged journals would rewrite history - keep ours
+                report.journal = "kept existing"
+    return report
+
+
+def _import_submissions(zf: zipfile.ZipFile, db_path: str, recruit: str,
+                        report: ImportReport, batch_size: int):
+    ProgressStore(db_path).close()  # creates/migrates the schema
+    conn = sqlite3.connect(os.path.expanduser(db_path))
+    try:
+        with conn:
+            row = conn.execute("SELECT id FROM recruits WHERE name = ?", (recruit,)).fetchone()
+            if row:
+                recruit_id = row[0]
+            else:
+                recruit_id = conn.execute(
+                    "INSERT INTO recruits (name, joined_date, motivation_level, updated_at)"
+                    " VALUES (?, ?, 50, ?)",
+                    (recruit, time.strftime("%Y-%m-%dT%H:%M:%S"), time.time()),
+                ).lastrowid
+
+            # 16 bytes of hash per stored submission, not the rows themselves
+            seen = {
+                _submission_hash(dict(zip(SUBMISSION_COLUMNS, existing)))
+                for existing in conn.execute(
+                    f"SELECT {', '.join(SUBMISSION_COLUMNS)} FROM submissions"
+                    " WHERE recruit_id = ?", (recruit_id,))
+            }
+
+            batch: List[tuple] = []
+            latest = 0.0
+            with zf.open("submissions.jsonl") as raw:
+                for line in io.TextIOWrapper(raw, encoding="utf-8"):
+                    if not line.strip():
+                        continue
+                    submission = json.loads(line)
+                    digest = _submission_hash(submission)
+                    if digest in seen:
+                        report.submissions_duplicate += 1
+                        continue
+                    seen.add(digest)
+                    batch.append((recruit_id,)
+                                 + tuple(submission.get(c) for c in SUBMISSION_COLUMNS))
+                    latest = max(latest, submission["submitted_at"])
+                    if len(batch) >= batch_size:
+                        _insert_submissions(conn, batch)
+                        report.submissions_added += len(batch)
+                        batch = []
+            if batch:
+                _insert_submissions(conn, batch)
+                report.submissions_added += len(batch)
+            if latest:
+                conn.execute(
+                    "UPDATE recruits SET last_submission_at = MAX(last_submission_at, ?)"
+                    " WHERE id = ?", (latest, recruit_id))
+    finally:
+        conn.close()
+
+
+def _insert_submissions(conn: sqlite3.Connection, batch: List[tuple]):
+    conn.executemany(
+        "INSERT OR IGNORE INTO challenges (key, language, name) VALUES (?, ?, ?)",
+        [(row[1],) + tuple(row[1].split("/", 1)) for row in batch],
+    )
+    conn.executemany(
+        f"INSERT INTO submissions (recruit_id, {', '.join(SUBMISSION_COLUMNS)})"
+        f" VALUES ({', '.join('?' * (len(SUBMISSION_COLUMNS) + 1))})",
+        batch,
+    )
+
+
+# =====================================================================
+# COMMAND LINE - python sandbox_archive.py export|import ...
+# =====================================================================
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Tux Boot Camp sandbox export/import")
+    parser.add_argument("--config", default=os.path.join(here, "command.json"))
+    parser.add_argument("--db", help="progress database (default: paths.progress_db)")
+    parser.add_argument("--files", help="challenge files directory"
+                                        " (default: paths.challenge_files, as attempt3 uses)")
+    parser.add_argument("--journal-dir", help="default: paths.journal_dir")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="write a recruit's sandbox to a zip")
+    export_parser.add_argument("recruit")
+    export_parser.add_argument("--out", help="zip path, '-' for stdout (default: <recruit>.zip)")
+
+    import_parser = commands.add_parser("import", help="load a sandbox zip")
+    import_parser.add_argument("archive")
+    import_parser.add_argument("--as", dest="recruit", help="import under another name")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    paths = config.get("paths", {})
+    # The folder attempt3 writes to; it is run from its own directory
+    files_dir = args.files or os.path.join(
+        here, os.pardir, "attempt3", paths.get("challenge_files", "TuxBootCamp_Challenges"))
+    db_path = args.db or paths["progress_db"]
+    journal_dir = args.journal_dir or paths.get("journal_dir")
+
+    if args.command == "export":
+        out = args.out or f"{safe_name(args.recruit)}.zip"
+        if out == "-":
+            manifest = export_sandbox(args.recruit, sys.stdout.buffer, files_dir, db_path,
+                                      journal_dir)
+            out = "stdout"
+        else:
+            manifest = export_sandbox(args.recruit, out, files_dir, db_path, journal_dir)
+        print(f"{args.recruit}: {len(manifest['files'])} files, {manifest['submissions']}"
+              f" submissions, journal {'yes' if manifest['journal'] else 'no'} -> {out}",
+              file=sys.stderr if out == "stdout" else None)
+    else:
+        report = import_sandbox(args.archive, files_dir, db_path, journal_dir, args.recruit)
+        print(f"{report.recruit}: {len(report.files_added)} files added,"
+              f" {len(report.files_duplicate)} already present;"
+              f" {report.submissions_added} submissions added,"
+              f" {report.submissions_duplicate} duplicates; journal {report.journal}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from submission_store import header_fields
+
+
+# =====================================================================
+# SANDBOX INDEX - What is in the challenge folder, and what can go
+# =====================================================================
+#
+# One row per challenge file (path, recruit, language, challenge, size,
+# mtime, sha256, last used, graded) in <sandbox>/.sandbox_index.db, kept
+# current by ChallengeFileManager as files are created, opened and
+# submitted - nothing needs to scan the folder to list a recruit's files.
+#
+# Quotas (command.json "sandbox") are enforced by evicting STALE, UNGRADED
+# files, least recently used first:
+#
+#   quota_per_recruit_mb / quota_files_per_recruit   per recruit
+#   quota_total_mb                                   whole sandbox
+#   stale_after_days                                 never evict newer
+#
+# Graded files are never evicted - they are the recruit's record (and
+# their code is also in the submission store). Each candidate is
+# re-stat'ed right before removal: a file edited outside the app (watch
+# mode off, app closed) since it was indexed is refreshed and kept. reconcile() does the one
+# full scan, for files created before the index or outside the app.
+
+
+INDEX_FILE = ".sandbox_index.db"
+
+DEFAULT_QUOTAS = {
+    "quota_per_recruit_mb": 20,
+    "quota_files_per_recruit": 200,
+    "quota_total_mb": 1000,
+    "stale_after_days": 14,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path        TEXT PRIMARY KEY,      -- relative to the sandbox directory
+    recruit     TEXT NOT NULL,
+    language    TEXT NOT NULL,
+    challenge   TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime       REAL NOT NULL,
+    hash        TEXT NOT NULL,
+    last_used   REAL NOT NULL,
+    graded      INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS files_by_recruit
+    ON files (recruit, last_used);
+CREATE INDEX IF NOT EXISTS files_by_last_used
+    ON files (graded, last_used);
+"""
+
+COLUMNS = ("path", "recruit", "language", "challenge", "size", "mtime", "hash",
+           "last_used", "graded")
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SandboxIndex:
+    """Index of a sandbox folder plus quota enforcement"""
+
+    def __init__(self, directory: str, quotas: Optional[Dict[str, float]] = None):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.quotas = dict(DEFAULT_QUOTAS, **(quotas or {}))
+        self._conn = sqlite3.connect(os.path.join(self.directory, INDEX_FILE),
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config, directory: str) -> "SandboxIndex":
+        quotas = {key: config.get("sandbox", key, default=value)
+                  for key, value in DEFAULT_QUOTAS.items()}
+        return cls(directory, quotas)
+
+    def close(self):
+        self._conn.close()
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.directory)
+
+    def _absolute(self, relative: str) -> str:
+        return os.path.join(self.directory, relative)
+
+    # -----------------------------------------------------------------
+    # Updating
+    # -----------------------------------------------------------------
+
+    def add(self, path: str, recruit: str, language: str, challenge: str):
+        """Register a file the app just created"""
+        st = os.stat(path)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files"
+                " (path, recruit, language, challenge, size, mtime, hash, last_used, graded)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (self._relative(path), recruit, language, challenge, st.st_size,
+                 st.st_mtime, file_hash(path), time.time()),
+            )
+
+    def touch(self, path: str):
+        """The file was opened or picked - it is not stale"""
+        with self._conn:
+            self._conn.execute("UPDATE files SET last_used = ? WHERE path = ?",
+                               (time.time(), self._relative(path)))
+
+    def refresh(self, path: str):
+        """Re-stat a file (rehashing only if its mtime/size changed)"""
+        relative = self._relative(path)
+        row = self._conn.execute("SELECT size, mtime FROM files WHERE path = ?",
+                                 (relative,)).fetchone()
+        if row is None:
+            return
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.forget(path)
+            return
+        if (st.st_size, st.st_mtime) != tuple(row):
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE files SET size = ?, mtime = ?, hash = ?, last_used = ?"
+                    " WHERE path = ?",
+                    (st.st_size, st.st_mtime, file_hash(path), time.time(), relative),
+                )
+
+    def mark_graded(self, path: str):
+        self.refresh(path)
+        with self._conn:
+            self._conn.execute("UPDATE files SET graded = 1, last_used = ? WHERE path = ?",
+                               (time.time(), self._relative(path)))
+
+    def forget(self, path: str):
+        with self._conn:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (self._relative(path),))
+
+    def reconcile(self) -> Dict[str, int]:
+        """Full scan: index unknown challenge files, drop vanished ones"""
+        known = {path: (size, mtime) for path, size, mtime in
+                 self._conn.execute("SELECT path, size, mtime FROM files")}
+        added = refreshed = 0
+        seen = set()
+        for root, dirs, names in os.walk(self.directory):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                if name.startswith("."):
+                    continue
+                path = os.path.join(root, name)
+                relative = self._relative(path)
+                seen.add(relative)
+                if relative in known:
+                    st = os.stat(path)
+                    if (st.st_size, st.st_mtime) != known[relative]:
+                        self.refresh(path)
+                        refreshed += 1
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        fields = header_fields(f.read(4096))
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if {"Recruit", "Challenge", "Language"} <= set(fields):
+                    self.add(path, fields["Recruit"], fields["Language"], fields["Challenge"])
+                    with self._conn:
+                        self._conn.execute("UPDATE files SET last_used = ? WHERE path = ?",
+                                           (os.stat(path).st_mtime, relative))
+                    added += 1
+        vanished = [path for path in known if path not in seen]
+        with self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?",
+                                   [(path,) for path in vanished])
+        return {"added": added, "refreshed": refreshed, "removed": len(vanished)}
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def _rows(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        return [dict(zip(COLUMNS, row)) for row in
+                self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM files {sql}", params)]
+
+    def recent(self, recruit: str, language: Optional[str] = None,
+               limit: int = 20) -> List[Dict[str, Any]]:
+        """A recruit's files, most recently used first (absolute paths)"""
+        sql, params = "WHERE recruit = ?", (recruit,)
+        if language:
+            sql, params = sql + " AND language = ?", params + (language,)
+        entries = []
+        for entry in self._rows(sql + " ORDER BY last_used DESC LIMIT ?", params + (limit,)):
+            entry["path"] = self._absolute(entry["path"])
+            if os.path.exists(entry["path"]):
+                entries.append(entry)
+            else:
+                self.forget(entry["path"])
+        return entries
+
+    def usage(self, recruit: Optional[str] = None) -> Dict[str, int]:
+        sql, params = ("WHERE recruit = ?", (recruit,)) if recruit else ("", ())
+        files, size = self._conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files {sql}", params
+        ).fetchone()
+        return {"files": files, "bytes": size}
+
+    # -----------------------------------------------------------------
+    # Eviction
+    # -----------------------------------------------------------------
+
+    def enforce_quotas(self, recruit: Optional[str] = None, now: Optional[float] = None,
+                       dry_run: bool = False) -> List[str]:
+        """Evict stale, ungraded files (LRU) until within quota; returns paths"""
+        now = time.time() if now is None else now
+        stale_before = now - self.quotas["stale_after_days"] * 86400
+        evicted: List[str] = []
+
+        recruits = [recruit] if recruit else [
+            r for (r,) in self._conn.execute("SELECT DISTINCT recruit FROM files")
+        ]
+        for name in recruits:
+            usage = self.usage(name)
+            evicted += self._evict(
+                "AND recruit = ?", (name,), stale_before,
+                usage["bytes"] - self.quotas["quota_per_recruit_mb"] * 1024 * 1024,
+                usage["files"] - self.quotas["quota_files_per_recruit"], dry_run,
+            )
+
+        usage = self.usage()
+        evicted += self._evict("", (), stale_before,
+                               usage["bytes"] - self.quotas["quota_total_mb"] * 1024 * 1024, 0,
+                               dry_run)
+        return evicted
+
+    def _evict(self, where: str, params: tuple, stale_before: float,
+               excess_bytes: float, excess_files: int, dry_run: bool) -> List[str]:
+        if excess_bytes <= 0 and excess_files <= 0:
+            return []
+        candidates = self._conn.execute(
+            f"SELECT path, size, mtime FROM files WHERE graded = 0 AND last_used < ? {where}"
+            " ORDER BY last_used",
+            (stale_before,) + params,
+        )
+        evicted = []
+        for relative, size, mtime in candidates.fetchall():
+            if excess_bytes <= 0 and excess_files <= 0:
+                break
+            if self._edited_since_indexed(relative, size, mtime, stale_before, dry_run):
+                continue
+            if not dry_run:
+                try:
+                    os.remove(self._absolute(relative))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue  # locked/read-only: leave it indexed, try the next one
+            evicted.append(relative)
+            excess_bytes -= size
+            excess_files -= 1
+        if not dry_run:
+            with self._conn:
+                self._conn.executemany("DELETE FROM files WHERE path = ?",
+                                       [(path,) for path in evicted])
+        return evicted
+
+    def _edited_since_indexed(self, relative: str, size: int, mtime: float,
+                              stale_before: float, dry_run: bool) -> bool:
+        """True (and the row updated) if the file on disk is not what was indexed"""
+        path = self._absolute(relative)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False  # already gone: evicting just drops the row
+        if st.st_mtime < stale_before and (st.st_size, st.st_mtime) == (size, mtime):
+            return False
+        if not dry_run:
+            self.refresh(path)
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE files SET last_used = MAX(last_used, ?) WHERE path = ?",
+                    (st.st_mtime, relative),
+                )
+        return True
+
+
+# =====================================================================
+# COMMAND LINE - python sandbox_index.py DIR [--reconcile] [--enforce]
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp sandbox index")
+    parser.add_argument("directory", help="sandbox / challenge files directory")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--reconcile", action="store_true", help="scan for unindexed files")
+    parser.add_argument("--enforce", action="store_true", help="evict to within quota")
+    parser.add_argument("--dry-run", action="store_true", help="with --enforce: only list")
+    parser.add_argument("--recruit")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    index = SandboxIndex(args.directory, config.get("sandbox"))
+    try:
+        if args.reconcile:
+            print("reconcile:", index.reconcile())
+        if args.enforce:
+            verb = "would evict" if args.dry_run else "evicted"
+            for path in index.enforce_quotas(args.recruit, dry_run=args.dry_run):
+                print(f"  {verb} {path}")
+        usage = index.usage(args.recruit)
+        print(f"{usage['files']} files, {usage['bytes'] / 1024 / 1024:.1f} MB indexed")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
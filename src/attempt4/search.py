@@ -0,0 +1,210 @@
+import bisect
+import heapq
+import re
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from catalog import Catalog, Challenge, Language
+
+
+# =====================================================================
+# SEARCH INDEX - Search-as-you-type over languages and challenges
+# =====================================================================
+#
+# An inverted index (token -> {doc: weight}) answers exact and prefix
+# matches; a trigram index (trigram -> tokens) catches typos ("javscript"
+# still finds "JavaScript"). It does not match fragments from the middle
+# of a word - those share too few trigrams with the whole token. Name
+# hits are also kept in their own postings for short queries. Everything
+# is built once up front, so a keystroke only touches the postings of
+# the tokens it matches.
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9#+]+")
+
+# How much a hit in each field counts
+FIELD_WEIGHTS = {
+    "name": 10.0,
+    "use_cases": 4.0,
+    "difficulty": 3.0,
+    "language": 2.0,
+    "description": 1.0,
+}
+
+# How much each kind of match counts
+EXACT_BOOST = 3.0
+PREFIX_BOOST = 2.0
+TRIGRAM_BOOST = 0.5
+
+# Below this a trigram match is noise
+MIN_TRIGRAM_SIMILARITY = 0.4
+
+# Words shorter than this only prefix-match names ("co" finds COBOL, not
+# every description that says "concurrent")
+MIN_FULL_PREFIX = 3
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchHit(NamedTuple):
+    score: float
+    language: str
+    challenge: Optional[Challenge]
+
+
+class SearchIndex:
+    """Ranked prefix + trigram search over a Catalog"""
+
+    def __init__(self, catalog: Optional[Catalog] = None, max_cache: int = 256):
+        # doc id -> (language name, Challenge or None)
+        self._docs: List[Tuple[str, Optional[Challenge]]] = []
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._sorted_tokens: List[str] = []
+        # name field only: what short words are matched against
+        self._name_postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._sorted_name_tokens: List[str] = []
+        self._dirty = False
+
+        self._cache: Dict[Tuple[str, int], List[SearchHit]] = {}
+        self._max_cache = max_cache
+
+        if catalog is not None:
+            for language in catalog.languages():
+                self.add_language(language)
+                for challenge in language.challenges:
+                    self.add_challenge(challenge)
+
+    # -----------------------------------------------------------------
+    # Building
+    # -----------------------------------------------------------------
+
+    def add_language(self, language: Language):
+        """Index a language by name, description, use cases and difficulty"""
+        self._add_document((language.name, None), {
+            "name": language.name,
+            "description": language.description,
+            "use_cases": " ".join(language.use_cases),
+            "difficulty": language.difficulty,
+        })
+
+    def add_challenge(self, challenge: Challenge):
+        """Index a challenge (community packs can be added at any time)"""
+        self._add_document((challenge.language, challenge), {
+            "name": challenge.name,
+            "description": challenge.description,
+            "difficulty": challenge.difficulty,
+            "language": challenge.language,
+        })
+
+    def _add_document(self, doc, fields: Dict[str, str]):
+        doc_id = len(self._docs)
+        self._docs.append(doc)
+
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                postings = self._postings[token]
+                if not postings:
+                    for gram in trigrams(token):
+                        self._trigrams[gram].add(token)
+                    self._dirty = True
+                postings[doc_id] = max(postings.get(doc_id, 0.0), weight)
+                if field == "name":
+                    if token not in self._name_postings:
+                        self._dirty = True
+                    self._name_postings[token][doc_id] = weight
+
+        self._cache.clear()
+
+    # -----------------------------------------------------------------
+    # Querying
+    # -----------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 50) -> List[SearchHit]:
+        """Ranked hits for a query; every query word must match something"""
+        key = " ".join(tokenize(query))
+        if not key:
+            return []
+
+        cache_key = (key, limit)
+        hits = self._cache.get(cache_key)
+        if hits is None:
+            hits = self._search(key.split(), limit)
+            if len(self._cache) >= self._max_cache:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[cache_key] = hits
+        return hits
+
+    def _search(self, words: List[str], limit: int) -> List[SearchHit]:
+        if self._dirty:
+            self._sorted_tokens = sorted(self._postings)
+            self._sorted_name_tokens = sorted(self._name_postings)
+            self._dirty = False
+
+        scores: Optional[Dict[int, float]] = None
+        for word in words:
+            word_scores = self._match_word(word)
+            if scores is None:
+                scores = word_scores
+            else:
+                # AND semantics: keep docs that matched every word so far
+                scores = {d: s + word_scores[d] for d, s in scores.items() if d in word_scores}
+            if not scores:
+                return []
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [SearchHit(score, *self._docs[doc_id]) for doc_id, score in ranked]
+
+    def _match_word(self, word: str) -> Dict[int, float]:
+        """Score every doc for one query word: exact > prefix > trigram"""
+        scores: Dict[int, float] = {}
+
+        if len(word) < MIN_FULL_PREFIX:
+            tokens, postings = self._sorted_name_tokens, self._name_postings
+        else:
+            tokens, postings = self._sorted_tokens, self._postings
+
+        def credit(token, boost):
+            for doc_id, weight in postings[token].items():
+                score = weight * boost
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+
+        start = bisect.bisect_left(tokens, word)
+        for i in range(start, len(tokens)):
+            token = tokens[i]
+            if not token.startswith(word):
+                break
+            credit(token, EXACT_BOOST if token == word else PREFIX_BOOST)
+
+        if len(word) >= 3:
+            grams = trigrams(word)
+            counts: Dict[str, int] = defaultdict(int)
+            for gram in grams:
+                for token in self._trigrams.get(gram, ()):
+                    counts[token] += 1
+            for token, shared in counts.items():
+                if token.startswith(word):
+                    continue  # already credited as a prefix hit
+                similarity = shared / len(grams | trigrams(token))
+                if similarity >= MIN_TRIGRAM_SIMILARITY:
+                    credit(token, TRIGRAM_BOOST * similarity)
+
+        return scores
+
+    def matching_languages(self, query: str, limit: int = 200) -> List[Tuple[str, List[Challenge]]]:
+        """Languages ranked by their best hit, with the challenges that matched"""
+        grouped: Dict[str, List[Challenge]] = {}
+        for hit in self.search(query, limit):
+            challenges = grouped.setdefault(hit.language, [])
+            if hit.challenge is not None:
+                challenges.append(hit.challenge)
+        return list(grouped.items())
@@ -0,0 +1,194 @@
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from calibration import calibrated_difficulties, load_index
+from catalog import Catalog, Challenge
+
+
+# =====================================================================
+# CHALLENGE SELECTOR - Next challenge by mastery, not by dice roll
+# =====================================================================
+#
+# Every language's challenges are split ONCE into pools per difficulty,
+# ordered by challenges.difficulty_order from command.json (labels not in
+# the order go last). Each recruit gets a Mastery record that:
+#
+#   - counts attempts / correct answers per (language, difficulty)
+#   - remembers every challenge they ACED, which is never served again
+#   - keeps its own copy of the pools minus aced challenges, built the
+#     first time a language is asked for; an ace removes the challenge
+#     with a swap-and-pop, so picking stays O(1)
+#
+# With difficulty_scaling on, a recruit gets the easiest difficulty that
+# still has something left for them; with it off, anything not aced.
+#
+# If calibration.py has written its sidecar index (paths.calibration),
+# challenges are filed under their calibrated difficulty instead of the
+# hand label from operations.json.
+
+
+# An "ace": correct and (nearly) perfect - the same bar as Tux's "proud"
+ACE_MIN_COMPLETENESS = 90
+ACE_MIN_QUALITY = 80
+
+ALL_DIFFICULTIES = "*"
+
+
+def is_ace(event: Dict[str, Any]) -> bool:
+    """Did a code_graded event ace its challenge?"""
+    return (bool(event.get("correct"))
+            and event.get("completeness", 0) >= ACE_MIN_COMPLETENESS
+            and event.get("quality_score", 0) >= ACE_MIN_QUALITY)
+
+
+class _Pool:
+    """Challenges with O(1) random pick and O(1) removal by key"""
+
+    __slots__ = ("items", "positions")
+
+    def __init__(self, challenges: Sequence[Challenge]):
+        self.items: List[Challenge] = list(challenges)
+        self.positions: Dict[str, int] = {c.key: i for i, c in enumerate(self.items)}
+
+    def __len__(self):
+        return len(self.items)
+
+    def remove(self, key: str):
+        position = self.positions.pop(key, None)
+        if position is None:
+            return
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last.key] = position
+
+    def pick(self, rng: random.Random, avoid: Optional[str] = None) -> Optional[Challenge]:
+        count = len(self.items)
+        if not count:
+            return None
+        position = int(rng.random() * count)
+        if count > 1 and self.items[position].key == avoid:
+            position = (position + 1) % count
+        return self.items[position]
+
+
+class ChallengeSelector:
+    """Precomputed per-difficulty pools shared by every recruit"""
+
+    def __init__(self, catalog: Catalog, difficulty_order: Sequence[str] = ("Easy", "Medium", "Hard"),
+                 scaling: bool = True, rng: Optional[random.Random] = None,
+                 calibration: Optional[Dict[str, str]] = None):
+        self.catalog = catalog
+        self.calibration = calibration or {}
+        self.scaling = scaling
+        self.rng = rng or random.Random()
+        self.difficulty_order = tuple(difficulty_order)
+
+        # language -> ((difficulty, challenges), ...) easiest first
+        self._pools: Dict[str, Tuple[Tuple[str, Tuple[Challenge, ...]], ...]] = {}
+        for language in catalog.languages():
+            self._pools[language.name] = self._split(language.challenges)
+
+    @classmethod
+    def from_config(cls, config, catalog: Catalog) -> "ChallengeSelector":
+        return cls(
+            catalog,
+            config.get("challenges", "difficulty_order", default=["Easy", "Medium", "Hard"]),
+            scaling=config.get("challenges", "difficulty_scaling", default=True),
+            calibration=calibrated_difficulties(load_index(config.get("paths", "calibration"))),
+        )
+
+    def difficulty_of(self, challenge: Challenge) -> str:
+        """Difficulty the selector files a challenge under (calibrated if known)"""
+        return self.calibration.get(challenge.key, challenge.difficulty)
+
+    def _split(self, challenges: Sequence[Challenge]) -> Tuple[Tuple[str, Tuple[Challenge, ...]], ...]:
+        if not self.scaling:
+            return ((ALL_DIFFICULTIES, tuple(challenges)),)
+        by_difficulty: Dict[str, List[Challenge]] = {}
+        for challenge in challenges:
+            by_difficulty.setdefault(self.difficulty_of(challenge), []).append(challenge)
+        rank = {name: i for i, name in enumerate(self.difficulty_order)}
+        ordered = sorted(by_difficulty, key=lambda d: (rank.get(d, len(rank)), d))
+        return tuple((d, tuple(by_difficulty[d])) for d in ordered)
+
+    def new_mastery(self, state: Optional[Dict[str, Any]] = None) -> "Mastery":
+        return Mastery(self, state)
+
+    def next_challenge(self, mastery: "Mastery", language: str) -> Optional[Challenge]:
+        """Next challenge for a recruit, or None once they aced everything"""
+        pools = mastery._pools_for(language)
+        level = mastery._level[language]
+        while level < len(pools):
+            challenge = pools[level][1].pick(self.rng, mastery.last_served.get(language))
+            if challenge is not None:
+                mastery._level[language] = level
+                mastery.last_served[language] = challenge.key
+                return challenge
+            # Everything at this difficulty is aced - move up for good
+            level += 1
+        mastery._level[language] = level
+        return None
+
+
+class Mastery:
+    """One recruit's results per (language, difficulty) and aced challenges"""
+
+    def __init__(self, selector: ChallengeSelector, state: Optional[Dict[str, Any]] = None):
+        self.selector = selector
+        state = state or {}
+        # "Language/Difficulty" -> [attempts, correct]
+        self.stats: Dict[str, List[int]] = {k: list(v) for k, v in state.get("stats", {}).items()}
+        self.aced = set(state.get("aced", ()))
+        self.last_served: Dict[str, str] = {}
+
+        # Built lazily per language: pools minus aced, and the current level
+        self._available: Dict[str, Tuple[Tuple[str, _Pool], ...]] = {}
+        self._level: Dict[str, int] = {}
+
+    def _pools_for(self, language: str) -> Tuple[Tuple[str, _Pool], ...]:
+        pools = self._available.get(language)
+        if pools is None:
+            pools = []
+            for difficulty, challenges in self.selector._pools.get(language, ()):
+                pools.append((difficulty, _Pool([c for c in challenges if c.key not in self.aced])))
+            pools = self._available[language] = tuple(pools)
+            self._level[language] = 0
+        return pools
+
+    def observe(self, event: Dict[str, Any]):
+        """Fold in a code_graded journal event"""
+        if event["type"] != "code_graded":
+            return
+        key = f"{event['language']}/{event['challenge']}"
+        challenge = self.selector.catalog.get_challenge(key)
+        if challenge is None:
+            return  # freestyle code or a retired challenge
+
+        stats = self.stats.setdefault(
+            f"{challenge.language}/{self.selector.difficulty_of(challenge)}", [0, 0]
+        )
+        stats[0] += 1
+        stats[1] += bool(event.get("correct"))
+
+        if is_ace(event) and key not in self.aced:
+            self.aced.add(key)
+            for _, pool in self._available.get(challenge.language, ()):
+                pool.remove(key)
+
+    def level(self, language: str) -> Optional[str]:
+        """Difficulty the recruit is currently being served in a language"""
+        pools = self._pools_for(language)
+        for difficulty, pool in pools[self._level[language]:]:
+            if len(pool):
+                return difficulty
+        return None
+
+    def success_rate(self, language: str, difficulty: str) -> Optional[float]:
+        attempts, correct = self.stats.get(f"{language}/{difficulty}", (0, 0))
+        return correct / attempts if attempts else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly state for snapshots"""
+        return {"stats": {k: list(v) for k, v in self.stats.items()},
+                "aced": sorted(self.aced)}
@@ -0,0 +1,356 @@
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# =====================================================================
+# SUBMISSION STORE - Every attempt's code, content-addressed and delta'd
+# =====================================================================
+#
+#   blobs    one row per distinct program, keyed by the sha256 of its
+#            CANONICAL text (LF line endings, no trailing whitespace,
+#            one final newline). A resubmission of identical code - by
+#            anyone - stores nothing new.
+#   history  (recruit, challenge, attempt N) -> blob hash
+#
+# A new blob is stored as a zlib-compressed line delta against the
+# recruit's previous attempt at that challenge (or, for a first attempt,
+# the latest version anyone submitted - they all start from the same
+# template), unless the plain compressed text is smaller. Delta chains
+# are capped at MAX_DEPTH, so "show attempt N" applies at most that many
+# deltas; recently rebuilt texts are kept in a small LRU cache.
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash        BLOB PRIMARY KEY,               -- raw sha256, 32 bytes
+    base        BLOB REFERENCES blobs(hash),    -- NULL: data is the full text
+    depth       INTEGER NOT NULL,               -- deltas to apply to rebuild
+    size        INTEGER NOT NULL,               -- canonical text, bytes
+    data        BLOB NOT NULL                   -- zlib(text) or zlib(delta)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS history (
+    recruit         TEXT NOT NULL,
+    challenge_key   TEXT NOT NULL,
+    attempt         INTEGER NOT NULL,
+    hash            BLOB NOT NULL REFERENCES blobs(hash),
+    submitted_at    REAL NOT NULL,
+    PRIMARY KEY (recruit, challenge_key, attempt)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS history_by_challenge
+    ON history (challenge_key, submitted_at);
+"""
+
+MAX_DEPTH = 16
+CACHE_SIZE = 64
+
+
+def canonicalize(code: str) -> str:
+    """Text whose hash identifies a program regardless of line endings/whitespace"""
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n") + "\n"
+
+
+def content_hash(canonical: str) -> bytes:
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+# =====================================================================
+# DELTAS
+# =====================================================================
+#
+# A delta is a JSON list of ops against the base text's lines:
+#   [a, b]   copy base lines a..b-1
+#   "text"   insert these lines (joined, newline-terminated)
+
+
+def make_delta(base: str, text: str) -> list:
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+    ops: list = []
+    matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:  # replace / insert
+            ops.append("".join(lines[j1:j2]))
+    return ops
+
+
+def apply_delta(base: str, ops: list) -> str:
+    base_lines = base.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_lines[op[0]:op[1]])
+    return "".join(parts)
+
+
+# =====================================================================
+# STORE
+# =====================================================================
+
+
+class SubmissionStore:
+    """Content-addressed, delta-compressed history of submitted code"""
+
+    def __init__(self, db_path: str):
+        self.db_path = os.path.expanduser(db_path)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        # add() runs on grading threads; one transaction at a time
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # -----------------------------------------------------------------
+    # Writing
+    # -----------------------------------------------------------------
+
+    def add(self, recruit: str, challenge_key: str, code: str,
+            submitted_at: Optional[float] = None) -> Tuple[int, str]:
+        """Record one attempt; returns (attempt number, blob hash as hex)"""
+        text = canonicalize(code)
+        digest = content_hash(text)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT attempt, hash FROM history WHERE recruit = ? AND challenge_key = ?"
+                " ORDER BY attempt DESC LIMIT 1",
+                (recruit, challenge_key),
+            ).fetchone()
+            attempt = row[0] + 1 if row else 1
+            base = row[1] if row else self._latest_for(challenge_key)
+
+            if not self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone():
+                self._store_blob(digest, text, base)
+
+            self._conn.execute(
+                "INSERT INTO history (recruit, challenge_key, attempt, hash, submitted_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (recruit, challenge_key, attempt, digest,
+                 time.time() if submitted_at is None else submitted_at),
+            )
+        return attempt, digest.hex()
+
+    def _latest_for(self, challenge_key: str) -> Optional[bytes]:
+        row = self._conn.execute(
+            "SELECT hash FROM history WHERE challenge_key = ?"
+            " ORDER BY submitted_at DESC LIMIT 1",
+            (challenge_key,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store_blob(self, digest: bytes, text: str, base: Optional[bytes]):
+        full = zlib.compress(text.encode("utf-8"), 9)
+        data, depth = full, 0
+        if base is not None:
+            base_depth = self._conn.execute(
+                "SELECT depth FROM blobs WHERE hash = ?", (base,)
+            ).fetchone()[0]
+            if base_depth < MAX_DEPTH:
+                delta = json.dumps(make_delta(self._text(base), text),
+                                   separators=(",", ":"), ensure_ascii=False)
+                packed = zlib.compress(delta.encode("utf-8"), 9)
+                if len(packed) < len(full):
+                    data, depth = packed, base_depth + 1
+        self._conn.execute(
+            "INSERT INTO blobs (hash, base, depth, size, data) VALUES (?, ?, ?, ?, ?)",
+            (digest, base if depth else None, depth, len(text.encode("utf-8")), data),
+        )
+        self._remember(digest, text)
+
+    # -----------------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------------
+
+    def text(self, digest: str) -> str:
+        """Canonical text of a blob (hex hash), rebuilt from its delta chain"""
+        return self._text(bytes.fromhex(digest))
+
+    def _text(self, digest: bytes) -> str:
+        cached = self._cache.get(digest)
+        if cached is not None:
+            self._cache.move_to_end(digest)
+            return cached
+
+        # Walk back to a full text (or a cached one), then replay forward
+        chain: List[bytes] = []
+        current = digest
+        while True:
+            cached = self._cache.get(current)
+            if cached is not None:
+                text = cached
+                break
+            row = self._conn.execute(
+                "SELECT base, data FROM blobs WHERE hash = ?", (current,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Unknown submission blob {current.hex()}")
+            base, data = row
+            if base is None:
+                text = zlib.decompress(data).decode("utf-8")
+                break
+            chain.append(data)
+            current = base
+
+        for data in reversed(chain):
+            text = apply_delta(text, json.loads(zlib.decompress(data)))
+        self._remember(digest, text)
+        return text
+
+    def _remember(self, digest: bytes, text: str):
+        self._cache[digest] = text
+        self._cache.move_to_end(digest)
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def attempts(self, recruit: str, challenge_key: str) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT attempt, hash, submitted_at FROM history"
+            " WHERE recruit = ? AND challenge_key = ? ORDER BY attempt",
+            (recruit, challenge_key),
+        ).fetchall()
+        return [{"attempt": a, "hash": h.hex(), "submitted_at": ts} for a, h, ts in rows]
+
+    def show(self, recruit: str, challenge_key: str, attempt: int = -1) -> str:
+        """Code of attempt N (1-based; negative counts back from the latest)"""
+        if attempt < 0:
+            row = self._conn.execute(
+                "SELECT hash FROM history WHERE recruit = ? AND challenge_key = ?"
+                " ORDER BY attempt DESC LIMIT 1 OFFSET ?",
+                (recruit, challenge_key, -attempt - 1),
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT hash FROM history WHERE recruit = ? AND challenge_key = ?"
+                " AND attempt = ?",
+                (recruit, challenge_key, attempt),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"{recruit} has no attempt {attempt} at {challenge_key}")
+        return self._text(row[0])
+
+    def stats(self) -> Dict[str, int]:
+        """Logical vs stored bytes"""
+        versions, logical = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(b.size), 0)"
+            " FROM history h JOIN blobs b ON b.hash = h.hash"
+        ).fetchone()
+        blobs, deltas, stored = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(base IS NOT NULL), 0),"
+            " COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+        ).fetchone()
+        return {"versions": versions, "blobs": blobs, "deltas": deltas,
+                "logical_bytes": logical, "stored_bytes": stored}
+
+
+# =====================================================================
+# INGEST - existing challenge files into the store
+# =====================================================================
+
+
+def header_fields(code: str) -> Dict[str, str]:
+    """Recruit/Challenge/Language from a ChallengeFileManager header"""
+    fields = {}
+    for line in code.split("\n", 12)[:12]:
+        for name in ("Recruit", "Challenge", "Language"):
+            _, marker, value = line.partition(f" {name}: ")
+            if marker and name not in fields:
+                fields[name] = value.strip()
+    return fields
+
+
+def ingest_directory(store: SubmissionStore, directory: str) -> int:
+    """Add every challenge file under `directory`, oldest first"""
+    paths = []
+    for root, _, names in os.walk(os.path.expanduser(directory)):
+        paths += [os.path.join(root, n) for n in names if not n.startswith(".")]
+    paths.sort(key=os.path.getmtime)
+
+    added = 0
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                code = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        fields = header_fields(code)
+        if "Recruit" in fields and "Challenge" in fields and "Language" in fields:
+            store.add(fields["Recruit"], f"{fields['Language']}/{fields['Challenge']}",
+                      code, os.path.getmtime(path))
+            added += 1
+    return added
+
+
+# =====================================================================
+# COMMAND LINE - python submission_store.py show "Jane" Python/NAME 3
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp submission history")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--db", help="submission store (default: paths.submissions)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="print one attempt")
+    show.add_argument("recruit")
+    show.add_argument("challenge", help="Language/Challenge")
+    show.add_argument("attempt", type=int, nargs="?", default=-1,
+                      help="1-based; negative counts back from the latest")
+
+    log = commands.add_parser("log", help="list a recruit's attempts at a challenge")
+    log.add_argument("recruit")
+    log.add_argument("challenge")
+
+    ingest = commands.add_parser("ingest", help="add existing challenge files")
+    ingest.add_argument("directory")
+
+    commands.add_parser("stats", help="logical vs stored size")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    store = SubmissionStore(args.db or config["paths"]["submissions"])
+    try:
+        if args.command == "show":
+            print(store.show(args.recruit, args.challenge, args.attempt), end="")
+        elif args.command == "log":
+            for entry in store.attempts(args.recruit, args.challenge):
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["submitted_at"]))
+                print(f"  #{entry['attempt']:<4} {stamp}  {entry['hash'][:12]}")
+        elif args.command == "ingest":
+            print(f"{ingest_directory(store, args.directory)} files added")
+        if args.command in ("ingest", "stats"):
+            stats = store.stats()
+            ratio = stats["logical_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+            print(f"{stats['versions']} versions, {stats['blobs']} blobs"
+                  f" ({stats['deltas']} deltas): {stats['logical_bytes']} bytes"
+                  f" stored in {stats['stored_bytes']} ({ratio:.1f}x)")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
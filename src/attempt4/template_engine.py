@@ -0,0 +1,198 @@
+import json
+import os
+from string import Formatter
+from typing import Any, Dict, List, Tuple
+
+
+# =====================================================================
+# TEMPLATE ENGINE - Challenge files from templates.json, compiled once
+# =====================================================================
+#
+# Each language's challenge file (header_lines + language_templates) is
+# compiled ONCE into a segment list: literal strings with a few slots
+# (student, challenge, language, difficulty, date, description) in
+# between. Rendering copies the list, drops the values into the slot
+# positions and does a single "".join - no f-strings, dict lookups or
+# concatenation per file.
+#
+#   engine.render("Python", student=..., challenge=..., ...)
+#   engine.partial("Python", challenge=..., ...)  -> fewer slots left, so
+#       bulk generation (packs.py) fills everything but the recruit once
+#
+# Only header field strings are parsed for {slots}; code templates are
+# taken literally, braces and all. Languages without a template get the
+# generic one in their comment style.
+
+
+SLOTS = ("student", "challenge", "language", "difficulty", "date", "description")
+
+HEADER_FIELDS = ("recruit", "challenge", "language", "difficulty", "date")
+
+GENERIC_TEMPLATE = """
+{comment} Main function - This is your entry point!
+{comment} Purpose: Implement the challenge requirements here
+
+{comment} TODO: Write your code here, recruit!
+
+
+{comment} Helper function - Break it down into manageable pieces!
+
+{comment} TODO: Implement helper logic
+
+
+{comment} SERGEANT TUX SAYS: "Show me what you've got, recruit!"
+"""
+
+
+class CompiledTemplate:
+    """Literal segments with slot positions, rendered by a single join"""
+
+    __slots__ = ("segments", "slots")
+
+    def __init__(self, parts: List[Tuple[bool, str]]):
+        # parts: (is_slot, literal text or slot name); adjacent literals merge
+        segments: List[str] = []
+        slots: List[Tuple[int, str]] = []
+        literal = False
+        for is_slot, text in parts:
+            if is_slot:
+                slots.append((len(segments), text))
+                segments.append("")
+                literal = False
+            elif text:
+                if literal:
+                    segments[-1] += text
+                else:
+                    segments.append(text)
+                    literal = True
+        self.segments = segments
+        self.slots = tuple(slots)
+
+    def render(self, values: Dict[str, str]) -> str:
+        segments = self.segments[:]
+        for position, name in self.slots:
+            segments[position] = values[name]
+        return "".join(segments)
+
+    def partial(self, values: Dict[str, str]) -> "CompiledTemplate":
+        """Same template with the given slots filled in for good"""
+        slot_at = dict(self.slots)
+        parts = []
+        for position, segment in enumerate(self.segments):
+            name = slot_at.get(position)
+            if name is None:
+                parts.append((False, segment))
+            elif name in values:
+                parts.append((False, values[name]))
+            else:
+                parts.append((True, name))
+        return CompiledTemplate(parts)
+
+    @property
+    def slot_names(self) -> Tuple[str, ...]:
+        return tuple(name for _, name in self.slots)
+
+
+class TemplateEngine:
+    """Every language's challenge file, compiled from templates.json"""
+
+    _shared: Dict[str, "TemplateEngine"] = {}
+
+    def __init__(self, templates: Dict[str, Any]):
+        self.extensions: Dict[str, str] = dict(templates.get("file_extensions", {}))
+        self.comments: Dict[str, str] = {
+            language: style.get("start", "#")
+            for language, style in templates.get("comment_styles", {}).items()
+        }
+        self._header_lines = templates["header_lines"]
+        self._bodies: Dict[str, str] = dict(templates.get("language_templates", {}))
+
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        for language in set(self._bodies) | set(self.comments):
+            self._compiled[language] = self._compile(language)
+
+    @classmethod
+    def from_file(cls, path: str) -> "TemplateEngine":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def load(cls, armory_dir: str = "armory") -> "TemplateEngine":
+        """One shared engine per armory directory"""
+        path = os.path.abspath(os.path.join(armory_dir, "templates.json"))
+        engine = cls._shared.get(path)
+        if engine is None:
+            engine = cls._shared[path] = cls.from_file(path)
+        return engine
+
+    # -----------------------------------------------------------------
+    # Compiling
+    # -----------------------------------------------------------------
+
+    def _compile(self, language: str) -> CompiledTemplate:
+        comment = self.comment(language)
+        lines = self._header_lines
+        separator = lines["separator"]
+        prefix = comment + " "
+
+        parts: List[Tuple[bool, str]] = [
+            (False, f"{comment}{separator}\n{prefix}{lines['title']}\n{prefix}{separator}\n"),
+        ]
+        for field in HEADER_FIELDS:
+            parts.append((False, prefix))
+            parts += _parse_field(lines["fields"][field])
+            parts.append((False, "\n"))
+        parts.append((False, f"{prefix}{separator}\n{comment}\n"
+                             f"{prefix}{lines['mission_briefing_header']}\n{prefix}"))
+        parts.append((True, "description"))
+        parts.append((False, f"\n{comment}\n{prefix}{lines['orders_header']}\n"))
+        parts += [(False, f"{prefix}{order}\n") for order in lines["orders"]]
+        parts.append((False, f"{comment}\n{prefix}{lines['reminder']}\n{prefix}{separator}\n\n"))
+
+        body = self._bodies.get(language)
+        if body is None:
+            body = GENERIC_TEMPLATE.replace("{comment}", comment)
+        parts.append((False, body))
+        return CompiledTemplate(parts)
+
+    # -----------------------------------------------------------------
+    # Rendering
+    # -----------------------------------------------------------------
+
+    def compiled(self, language: str) -> CompiledTemplate:
+        template = self._compiled.get(language)
+        if template is None:
+            # Unknown language: generic body, "#" comments
+            template = self._compiled[language] = self._compile(language)
+        return template
+
+    def render(self, language: str, **values: str) -> str:
+        """Full challenge file text; every slot in SLOTS must be given"""
+        values["language"] = language
+        return self.compiled(language).render(values)
+
+    def partial(self, language: str, **values: str) -> CompiledTemplate:
+        values["language"] = language
+        return self.compiled(language).partial(values)
+
+    def comment(self, language: str) -> str:
+        return self.comments.get(language, "#")
+
+    def extension(self, language: str) -> str:
+        return self.extensions.get(language, ".txt")
+
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._compiled))
+
+
+def _parse_field(text: str) -> List[Tuple[bool, str]]:
+    """'Recruit: {student}' -> [(False, 'Recruit: '), (True, 'student')]"""
+    parts: List[Tuple[bool, str]] = []
+    for literal, name, _, _ in Formatter().parse(text):
+        if literal:
+            parts.append((False, literal))
+        if name is not None:
+            if name not in SLOTS:
+                raise ValueError(f"Unknown template slot {{{name}}} in {text!r}")
+            parts.append((True, name))
+    return parts
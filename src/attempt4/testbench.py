@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from build_engine import Build, BuildEngine
+from catalog import Catalog, TestCase
+from runner import RunResult
+
+
+# =====================================================================
+# TESTBENCH - Objective pass/fail from a challenge's hidden tests
+# =====================================================================
+#
+# A challenge in operations.json may carry a "tests" list:
+#
+#   {"name": "precedence",            optional, defaults to "case N"
+#    "stdin": "2 + 3 * 4\n",          fed to the program
+#    "stdout": "14\n",                exact match (trailing blanks ignored)
+#    "stdout_contains": ["14"],       ...or substrings that must appear
+#    "exit_code": 0,                  default 0; null accepts any
+#    "files": {"words.txt": "..."},   fixtures in the working directory
+#    "hidden": true}                  default true: never show expected
+#
+# The submission is built once (BuildEngine, so the compile cache
+# applies) and every case then runs concurrently, each in its own
+# sandboxed process. With fail_fast the first failure cancels every
+# case not yet started. The pass ratio is blended into the grader's
+# completeness (weight), and a submission failing any test can't be
+# graded correct.
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_WEIGHT = 0.6
+
+
+class CaseResult:
+    """How one test case went"""
+
+    __slots__ = ("name", "passed", "reason", "duration_ms", "hidden")
+
+    def __init__(self, name: str, passed: bool, reason: str = "",
+                 duration_ms: float = 0.0, hidden: bool = True):
+        self.name = name
+        self.passed = passed
+        self.reason = reason
+        self.duration_ms = duration_ms
+        self.hidden = hidden
+
+
+class TestReport:
+    """All cases for one submission"""
+
+    __slots__ = ("cases", "total", "stopped_early", "build")
+
+    def __init__(self, cases: List[CaseResult], total: int, stopped_early: bool,
+                 build: Build):
+        self.cases = cases
+        self.total = total
+        self.stopped_early = stopped_early
+        self.build = build
+
+    @property
+    def passed(self) -> int:
+        return sum(1 for case in self.cases if case.passed)
+
+    @property
+    def pass_ratio(self) -> float:
+        return self.passed / self.total if self.total else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.total > 0 and self.passed == self.total
+
+    def report(self) -> str:
+        lines = [f"Tests: {self.passed}/{self.total} passed"
+                 + (" (stopped at first failure)" if self.stopped_early else "")]
+        for case in self.cases:
+            mark = "PASS" if case.passed else "FAIL"
+            reason = f" - {case.reason}" if case.reason else ""
+            lines.append(f"  [{mark}] {case.name}{reason}")
+        return "\n".join(lines)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "passed": self.passed,
+            "total": self.total,
+            "pass_ratio": round(self.pass_ratio, 3),
+            "stopped_early": self.stopped_early,
+            "failed": [case.name for case in self.cases if not case.passed],
+        }
+
+
+def _normalize(text: str) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def check(case: TestCase, run: RunResult) -> Tuple[bool, str]:
+    """(passed, reason) for one run against its case"""
+    if run.killed:
+        return False, run.describe()
+    if case.exit_code is not None and run.returncode != case.exit_code:
+        return False, f"exit code {run.returncode}, expected {case.exit_code}"
+    if case.stdout is not None and _normalize(run.stdout) != _normalize(case.stdout):
+        if case.hidden:
+            return False, "wrong output"
+        return False, f"expected {case.stdout.strip()!r}, got {run.stdout.strip()[:200]!r}"
+    missing = [text for text in case.stdout_contains if text not in run.stdout]
+    if missing:
+        return False, "wrong output" if case.hidden else f"output is missing {missing!r}"
+    return True, ""
+
+
+def blend(completeness: float, report: TestReport, weight: float = DEFAULT_WEIGHT) -> int:
+    """Grader completeness (0-100) mixed with the objective pass ratio"""
+    return round((1 - weight) * completeness + weight * report.pass_ratio * 100)
+
+
+class TestBench:
+    """Runs a challenge's tests against a submission, in parallel"""
+
+    def __init__(self, engine: BuildEngine, catalog: Optional[Catalog] = None,
+                 workers: int = DEFAULT_WORKERS, fail_fast: bool = False,
+                 weight: float = DEFAULT_WEIGHT):
+        self.engine = engine
+        self.catalog = catalog
+        self.workers = max(1, workers)
+        self.fail_fast = fail_fast
+        self.weight = weight
+
+    @classmethod
+    def from_config(cls, config, engine: BuildEngine,
+                    catalog: Optional[Catalog] = None) -> "TestBench":
+        return cls(
+            engine,
+            catalog,
+            config.get("tests", "workers", default=DEFAULT_WORKERS),
+            config.get("tests", "fail_fast", default=False),
+            config.get("tests", "weight", default=DEFAULT_WEIGHT),
+        )
+
+    def tests_for(self, language: str, challenge_name: Optional[str]) -> Tuple[TestCase, ...]:
+        if not (self.catalog and challenge_name):
+            return ()
+        challenge = self.catalog.get_challenge(f"{language}/{challenge_name}")
+        return challenge.tests if challenge else ()
+
+    def run(self, language: str, code: str,
+            tests: Sequence[TestCase]) -> Optional[TestReport]:
+        """Build once, run every case; None without tests or a toolchain"""
+        if not tests or not self.engine.supports(language):
+            return None
+        build = self.engine.build(language, code)
+        if not build.ok:
+            cases = [CaseResult(t.name, False, "did not compile", hidden=t.hidden)
+                     for t in tests]
+            return TestReport(cases, len(tests), False, build)
+
+        order = {id(case): i for i, case in enumerate(tests)}
+        results: List[Tuple[int, CaseResult]] = []
+        stopped = False
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(tests))) as pool:
+            pending = {pool.submit(self._run_case, build, case): case for case in tests}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    case = pending.pop(future)
+                    result = future.result()
+                    results.append((order[id(case)], result))
+                    if not result.passed and self.fail_fast and not stopped:
+                        stopped = True
+                        for other in list(pending):
+                            if other.cancel():
+                                skipped = pending.pop(other)
+                                results.append((order[id(skipped)], CaseResult(
+                                    skipped.name, False, "not run", hidden=skipped.hidden)))
+        results.sort(key=lambda item: item[0])
+        return TestReport([result for _, result in results], len(tests), stopped, build)
+
+    def _run_case(self, build: Build, case: TestCase) -> CaseResult:
+        run = self.engine.run(build, case.stdin.encode("utf-8"), files=case.files)
+        passed, reason = check(case, run)
+        return CaseResult(case.name, passed, reason, run.duration_ms, case.hidden)
+
+
+# =====================================================================
+# COMMAND LINE - python testbench.py LANGUAGE "CHALLENGE" FILE
+# =====================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tux Boot Camp hidden test runner")
+    parser.add_argument("language")
+    parser.add_argument("challenge", help="challenge name, as in operations.json")
+    parser.add_argument("file", help="submission source file")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--fail-fast", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    tests_config = config.get("tests", {})
+    catalog = Catalog.load(os.path.join(os.path.dirname(os.path.abspath(__file__)), "armory"))
+    bench = TestBench(
+        BuildEngine(config.get("paths", {}).get("build_cache", "~/.tux_boot_camp/build_cache")),
+        catalog,
+        tests_config.get("workers", DEFAULT_WORKERS),
+        args.fail_fast or tests_config.get("fail_fast", False),
+    )
+
+    tests = bench.tests_for(args.language, args.challenge)
+    if not tests:
+        print(f"No tests for {args.language}/{args.challenge}")
+        sys.exit(2)
+    with open(args.file, "r", encoding="utf-8") as f:
+        report = bench.run(args.language, f.read(), tests)
+    if report is None:
+        print(f"No toolchain installed for {args.language}")
+        sys.exit(2)
+    print(report.report())
+    if not report.build.ok:
+        print(report.build.output)
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
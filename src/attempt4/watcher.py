@@ -0,0 +1,295 @@
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from prescreen import PreScreen, prescreen
+from submission_store import header_fields
+
+
+# =====================================================================
+# WATCHER - Live feedback while the recruit edits
+# =====================================================================
+#
+# Watches the sandbox folder from a background thread and calls back
+# with (path, PreScreen) once a file has been quiet for `debounce`
+# seconds - an editor that writes three times per save, or a recruit
+# hammering Ctrl+S, produces one pre-screen, not ten.
+#
+# Backends:
+#
+#   inotify   Linux, through libc via ctypes (no extra packages);
+#             wakes only on close-after-write / rename-into-place
+#   polling   everywhere else: os.scandir + (size, mtime) every
+#             `interval` seconds
+#
+# The callback runs on the watcher thread. Tk code must not touch
+# widgets from there - hand results to the UI through a queue.Queue
+# drained by root.after() (see attempt3 MainInterface).
+#
+# Each PreScreen carries the content fingerprint; FingerprintLedger
+# remembers the fingerprint of the last full grade per file, so "grade
+# now" is only offered when the code actually changed.
+
+
+DEFAULT_DEBOUNCE = 0.6
+DEFAULT_INTERVAL = 1.0
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+WatchCallback = Callable[[str, PreScreen], None]
+
+
+def _watchable(name: str) -> bool:
+    """Skip dotfiles (the index DB) and editor swap/backup files"""
+    return not (name.startswith(".") or name.endswith(("~", ".swp", ".swx", ".tmp")))
+
+
+# ---------------------------------------------------------------------
+# Backends - each yields batches of changed paths until stopped
+# ---------------------------------------------------------------------
+
+class _Inotify:
+    """Minimal inotify binding; raises OSError where unavailable"""
+
+    def __init__(self, directories: List[str]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is Linux-only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self._dirs[wd] = directory
+
+    def wait(self, timeout: float) -> List[str]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths, offset = [], 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if wd in self._dirs and name:
+                paths.append(os.path.join(self._dirs[wd], name))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _Poller:
+    """(size, mtime) snapshot diff of the watched directories"""
+
+    def __init__(self, directories: List[str], interval: float):
+        self.directories = directories
+        self.interval = interval
+        self._seen = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, float]]:
+        seen = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            st = entry.stat()
+                            seen[entry.path] = (st.st_size, st.st_mtime)
+            except FileNotFoundError:
+                continue
+        return seen
+
+    def wait(self, timeout: float) -> List[str]:
+        time.sleep(min(timeout, self.interval))
+        current = self._snapshot()
+        changed = [path for path, stamp in current.items() if self._seen.get(path) != stamp]
+        self._seen = current
+        return changed
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------
+# Watching
+# ---------------------------------------------------------------------
+
+class SandboxWatcher:
+    """Debounced, pre-screening watcher over a sandbox folder"""
+
+    def __init__(self, directory: str, callback: WatchCallback,
+                 comment_for: Callable[[str], str] = lambda language: "#",
+                 recruit: Optional[str] = None, debounce: float = DEFAULT_DEBOUNCE,
+                 interval: float = DEFAULT_INTERVAL, backend: str = "auto"):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.callback = callback
+        self.comment_for = comment_for
+        self.recruit = recruit
+        self.debounce = debounce
+        self.interval = interval
+        self.backend = backend
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fingerprints: Dict[str, str] = {}
+
+    def _directories(self) -> List[str]:
+        """The sandbox plus its (non-hidden) sub-folders, e.g. packs.py layouts"""
+        os.makedirs(self.directory, exist_ok=True)
+        directories = [self.directory]
+        with os.scandir(self.directory) as entries:
+            directories += [e.path for e in entries if e.is_dir() and _watchable(e.name)]
+        return directories
+
+    def _open_backend(self):
+        directories = self._directories()
+        if self.backend in ("auto", "inotify"):
+            try:
+                return _Inotify(directories)
+            except (OSError, AttributeError):
+                if self.backend == "inotify":
+                    raise
+        return _Poller(directories, self.interval)
+
+    def start(self) -> "SandboxWatcher":
+        source = self._open_backend()
+        self.backend = "inotify" if isinstance(source, _Inotify) else "polling"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(source,),
+                                        name="sandbox-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, source):
+        pending: Dict[str, float] = {}  # path -> time it becomes due
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                timeout = min(pending.values()) - now if pending else self.interval
+                for path in source.wait(max(0.0, min(timeout, self.interval))):
+                    if _watchable(os.path.basename(path)):
+                        pending[path] = time.monotonic() + self.debounce
+                now = time.monotonic()
+                for path in [p for p, due in pending.items() if due <= now]:
+                    del pending[path]
+                    self._screen(path)
+        finally:
+            source.close()
+
+    def _screen(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                code = f.read()
+        except (OSError, UnicodeDecodeError):
+            return  # deleted between save and screen, or not a text file
+        fields = header_fields(code)
+        language = fields.get("Language")
+        if not language:
+            return
+        if self.recruit and fields.get("Recruit") != self.recruit:
+            return
+        result = prescreen(language, code, self.comment_for(language))
+        if self._fingerprints.get(path) == result.fingerprint:
+            return  # saved again without changing anything real
+        self._fingerprints[path] = result.fingerprint
+        try:
+            self.callback(path, result)
+        except Exception as e:  # a broken callback must not kill the watcher
+            print(f"Watcher callback failed for {path}: {e}")
+
+
+class FingerprintLedger:
+    """Fingerprint of the last full grade per file"""
+
+    __slots__ = ("_graded", "_lock")
+
+    def __init__(self):
+        self._graded: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def needs_grade(self, path: str, fingerprint: str) -> bool:
+        with self._lock:
+            return self._graded.get(os.path.abspath(path)) != fingerprint
+
+    def graded(self, path: str, fingerprint: str):
+        with self._lock:
+            self._graded[os.path.abspath(path)] = fingerprint
+
+
+# =====================================================================
+# COMMAND LINE - python watcher.py DIR [--recruit NAME]
+# =====================================================================
+
+
+def main():
+    from template_engine import TemplateEngine
+
+    parser = argparse.ArgumentParser(description="Tux Boot Camp live pre-screen")
+    parser.add_argument("directory", help="sandbox / challenge files directory")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__),
+                                                         "command.json"))
+    parser.add_argument("--recruit")
+    parser.add_argument("--backend", choices=("auto", "inotify", "polling"))
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    watch = config.get("watch", {})
+    engine = TemplateEngine.load(os.path.join(os.path.dirname(__file__), "armory"))
+
+    def report(path, result):
+        mark = "OK " if result.ok else "!! "
+        print(f"{time.strftime('%H:%M:%S')} {mark}{os.path.basename(path)}: {result.summary()}"
+              f"  [{result.fingerprint[:12]}]")
+
+    watcher = SandboxWatcher(args.directory, report, engine.comment, args.recruit,
+                             debounce=watch.get("debounce_seconds", DEFAULT_DEBOUNCE),
+                             interval=watch.get("poll_interval_seconds", DEFAULT_INTERVAL),
+                             backend=args.backend or watch.get("backend", "auto")).start()
+    print(f"Watching {watcher.directory} ({watcher.backend}) - Ctrl+C to stop")
+    try:
+        while watcher.running:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    main()